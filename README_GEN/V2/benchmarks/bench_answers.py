@@ -0,0 +1,83 @@
+"""Memory per record and render throughput: answers dicts vs ProjectAnswers.
+
+Builds N records the way a batch run gets them (decoded from JSON, so equal
+license/author strings are separate objects), then compares:
+
+- memory held per record, measured with tracemalloc, for a plain answers dict
+  plus dependency list vs a ProjectAnswers record;
+- renders/sec of generate_readme() called once per dict vs render_many()
+  over all ProjectAnswers at once.
+
+Run from README_GEN/V2:  python benchmarks/bench_answers.py [records]
+"""
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readme_answers import ANSWER_FIELDS, ProjectAnswers  # noqa: E402
+from readme_generater import generate_readme, render_many  # noqa: E402
+
+LICENSES = ('MIT', 'Apache-2.0', 'BSD-3-Clause', 'GPL-3.0-or-later')
+AUTHORS = tuple(f"Team {index}" for index in range(50))
+DEPENDENCIES = ('click', 'rich', 'validators', 'requests', 'numpy', 'pandas')
+
+
+def manifest_lines(count):
+    for index in range(count):
+        yield json.dumps({
+            'project_name': f"project-{index}",
+            'project_description': f"Project number {index}, which does *useful* things with snake_case data.",
+            'project_homepage': f"https://example.com/project-{index}",
+            'project_doc_url': '',
+            'author': AUTHORS[index % len(AUTHORS)],
+            'license_name': LICENSES[index % len(LICENSES)],
+            'install_command': f"pip install project-{index}",
+            'usage_instructions': f"project-{index} --help",
+            'test_command': 'pytest',
+            'dependencies': list(DEPENDENCIES[:index % len(DEPENDENCIES) + 1]),
+        })
+
+
+def as_dict(record):
+    answers = {field: record.get(field) or '' for field in ANSWER_FIELDS}
+    answers['dependencies'] = list(record.get('dependencies') or [])
+    return answers
+
+
+def bytes_per_record(build, lines):
+    gc.collect()
+    tracemalloc.start()
+    records = [build(json.loads(line)) for line in lines]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current / len(records), records
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    lines = list(manifest_lines(count))
+
+    dict_bytes, dicts = bytes_per_record(as_dict, lines)
+    slot_bytes, records = bytes_per_record(ProjectAnswers.from_mapping, lines)
+    print(f"memory per record   dict {dict_bytes:7.0f} B   ProjectAnswers {slot_bytes:7.0f} B   "
+          f"({dict_bytes / slot_bytes:.2f}x smaller)")
+
+    start = time.perf_counter()
+    expected = [generate_readme(answers, answers['dependencies'], answers['project_homepage'] or None,
+                                answers['project_doc_url'] or None) for answers in dicts]
+    dict_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    rendered = render_many(records)
+    many_seconds = time.perf_counter() - start
+    assert rendered == expected
+    print(f"renders per second  generate_readme {count / dict_seconds:9.0f}   render_many {count / many_seconds:9.0f}"
+          f"   ({dict_seconds / many_seconds:.2f}x faster)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,58 @@
+"""Check that markdown escaping stays linear on multi-megabyte fields.
+
+Times escape_prose() and code_fence() on inputs of 1-16 MB, prints the cost
+per byte and compares escape_prose() with a single str.translate call. It
+exits with status 1 if the per-byte cost at the largest size is more than
+LINEARITY_LIMIT times the cost at the smallest size.
+
+Run from README_GEN/V2:  python benchmarks/bench_escape.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readme_escape import code_fence, escape_prose  # noqa: E402
+
+SIZES_MB = (1, 2, 4, 8, 16)
+LINEARITY_LIMIT = 2.0
+REPEAT = 3
+
+PROSE_SAMPLE = ("Some *emphasis*, a [link](https://example.com), snake_case_names and a | pipe.\n"
+                "# heading-like line\n- list-like line\n1. numbered line\n> quote <tag> `code` \\ backslash\n")
+CODE_SAMPLE = "pip install thing\n```bash\nthing --run `nested` ``double``\n```\n"
+
+_TRANSLATE_TABLE = str.maketrans({char: '\\' + char for char in '\\`*_[]<>|'})
+
+
+def translate_escape(text):
+    """The single-call alternative: str.translate with a table of two-character replacements."""
+    return text.translate(_TRANSLATE_TABLE)
+
+
+def per_byte_ns(function, text):
+    seconds = min(timeit.repeat(lambda: function(text), number=1, repeat=REPEAT))
+    return seconds * 1e9 / len(text)
+
+
+def main():
+    costs = []
+    print(f"{'size':>6}  {'escape_prose':>14}  {'str.translate':>16}  {'code_fence':>12}")
+    for size_mb in SIZES_MB:
+        size = size_mb * 1024 * 1024
+        prose = (PROSE_SAMPLE * (size // len(PROSE_SAMPLE) + 1))[:size]
+        code = (CODE_SAMPLE * (size // len(CODE_SAMPLE) + 1))[:size]
+        escape_cost = per_byte_ns(escape_prose, prose)
+        costs.append(escape_cost)
+        print(f"{size_mb:>4} MB  {escape_cost:>11.2f} ns/B  {per_byte_ns(translate_escape, prose):>13.2f} ns/B  "
+              f"{per_byte_ns(code_fence, code):>9.2f} ns/B")
+    ratio = costs[-1] / costs[0]
+    print(f"per-byte cost at {SIZES_MB[-1]} MB is {ratio:.2f}x the cost at {SIZES_MB[0]} MB "
+          f"(limit {LINEARITY_LIMIT:.1f}x)")
+    if ratio > LINEARITY_LIMIT:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""What each extra output format costs once the document IR is built.
+
+For N distinct projects, times building the IR, emitting each format from
+the built IR, and the template path that renders README.md, so the
+per-format cost can be read off directly.
+
+Run from README_GEN/V2:  python benchmarks/bench_formats.py [projects]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readme_document import EMITTERS, readme_document  # noqa: E402
+from readme_generater import readme_context  # noqa: E402
+from readme_templates import DEFAULT_TEMPLATE, render  # noqa: E402
+
+
+def projects(count):
+    return [{
+        'project_name': f"project-{index}",
+        'project_description': f"Project number {index}, which does *useful* things.\n\nSecond paragraph.",
+        'author': 'Bench Runner',
+        'license_name': 'MIT',
+        'install_command': f"pip install project-{index}",
+        'usage_instructions': f"project-{index} --help",
+        'test_command': 'pytest',
+        'dependencies': ['click', 'rich', 'validators'],
+    } for index in range(count)]
+
+
+def timed(function, items):
+    start = time.perf_counter()
+    results = [function(item) for item in items]
+    return (time.perf_counter() - start) / len(items) * 1e6, results
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    answers = projects(count)
+    homepage = 'https://example.com/project'
+
+    build_us, documents = timed(lambda item: readme_document(item, item['dependencies'], homepage), answers)
+    print(f"build IR                 {build_us:7.2f} us/project")
+    for output_format, (_, emitter) in EMITTERS.items():
+        emit_us, _ = timed(lambda document: ''.join(emitter(document)), documents)
+        print(f"emit {output_format:<19} {emit_us:7.2f} us/project")
+    template_us, _ = timed(lambda item: render(DEFAULT_TEMPLATE, readme_context(item, item['dependencies'], homepage)),
+                           answers)
+    print(f"template path (md only)  {template_us:7.2f} us/project")
+
+
+if __name__ == '__main__':
+    main()
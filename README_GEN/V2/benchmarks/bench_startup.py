@@ -0,0 +1,64 @@
+"""Startup-time budget for the readme-generator entry point.
+
+Measures wall-clock time of `readme_generater.py --help` against a bare
+interpreter, lists the slowest imports from `python -X importtime`, and exits
+with status 1 when the startup overhead is over budget.
+
+Run from README_GEN/V2:  python benchmarks/bench_startup.py [budget_ms]
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(HERE, 'readme_generater.py')
+STARTUP_BUDGET_MS = 80.0  # time on top of a bare `python -c pass`
+RUNS = 15
+
+
+def wall_time(args):
+    """Median wall-clock seconds of running a command RUNS times."""
+    samples = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        subprocess.run(args, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, cwd=HERE)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def slowest_imports(module, count=10):
+    """(cumulative microseconds, module name) of the slowest imports, from -X importtime."""
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                            capture_output=True, text=True, check=True, cwd=HERE)
+    timings = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, self_us, cumulative_us, name = [part.strip() for part in line.replace('import time:', '|').split('|')]
+        timings.append((int(cumulative_us), name))
+    return sorted(timings, reverse=True)[:count]
+
+
+def main():
+    budget_ms = float(sys.argv[1]) if len(sys.argv) > 1 else STARTUP_BUDGET_MS
+    bare = wall_time([sys.executable, '-c', 'pass'])
+    library = wall_time([sys.executable, '-c', 'import readme_generater'])
+    command = wall_time([sys.executable, SCRIPT, '--help'])
+
+    print(f"bare interpreter:        {bare * 1000:7.1f} ms")
+    print(f"import readme_generater: {library * 1000:7.1f} ms  (+{(library - bare) * 1000:.1f} ms)")
+    print(f"readme_generater --help: {command * 1000:7.1f} ms  (+{(command - bare) * 1000:.1f} ms, "
+          f"budget {budget_ms:.0f} ms)")
+    print("slowest imports of the CLI (cumulative):")
+    for cumulative_us, name in slowest_imports('readme_cli'):
+        print(f"  {cumulative_us / 1000:7.1f} ms  {name}")
+
+    if (command - bare) * 1000 > budget_ms:
+        print("startup time is over budget", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Per-render cost of the template engine against the old f-string generate_readme().
+
+generate_readme() renders DEFAULT_TEMPLATE through the template engine. Only
+render() is timed here: the context (escaping, dependency normalization) is
+built once outside the timer, so the benchmark keeps measuring the engine
+whatever readme_context() and generate_readme() do around it.
+
+Run from README_GEN/V2:  python benchmarks/bench_templates.py
+"""
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readme_generater import readme_context  # noqa: E402
+from readme_templates import DEFAULT_TEMPLATE, render  # noqa: E402
+
+
+def fstring_generate_readme(answers, dependencies, homepage_url=None, doc_url=None):
+    """The chained f-string implementation generate_readme() used before the template engine."""
+    readme_content = f"# {answers['project_name']}\n\n" \
+                     f"## Description\n{answers['project_description']}\n\n" \
+                     f"## Project Links\n" \
+                     f"- [Homepage]({homepage_url})\n" \
+                     f"- [Documentation]({doc_url})\n\n" \
+                     f"## Author\n{answers['author']}\n\n" \
+                     f"## License\n{answers['license_name']}\n\n" \
+                     f"## Installation\n```bash\n{answers['install_command']}\n```\n\n" \
+                     f"## Usage\n```bash\n{answers['usage_instructions']}\n```\n\n" \
+                     f"## Testing\n```bash\n{answers['test_command']}\n``"
+    if dependencies:
+        readme_content += "\n## Dependencies\n" + "\n".join(f"- {dep}" for dep in dependencies)
+    return readme_content
+
+
+def make_answers(description_size):
+    return {
+        'project_name': 'Benchmark Project',
+        'project_description': ('lorem ipsum ' * (description_size // 12 + 1))[:description_size],
+        'author': 'Bench Author',
+        'license_name': 'MIT',
+        'install_command': 'pip install benchmark-project',
+        'usage_instructions': 'benchmark-project --help',
+        'test_command': 'pytest',
+    }
+
+
+def bench(function, number):
+    return min(timeit.Timer(function).repeat(repeat=5, number=number)) / number
+
+
+def main():
+    dependencies = ['click', 'rich', 'validators']
+    urls = ('https://example.com', 'https://docs.example.com')
+    for label, size, number in (('1 KB', 1024, 20000), ('1 MB', 1024 * 1024, 200)):
+        answers = make_answers(size)
+        context = readme_context(answers, dependencies, *urls)
+        old = bench(lambda: fstring_generate_readme(answers, dependencies, *urls), number)
+        new = bench(lambda: render(DEFAULT_TEMPLATE, context), number)
+        print(f"{label:>5} description: f-string {old * 1e6:9.2f} us/render   "
+              f"template {new * 1e6:9.2f} us/render   ratio {new / old:5.2f}x")
+
+
+if __name__ == '__main__':
+    main()
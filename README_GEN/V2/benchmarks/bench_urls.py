@@ -0,0 +1,62 @@
+"""Bulk URL validation against calling is_valid_url() (plain validators.url) in a loop.
+
+Run from README_GEN/V2:  python benchmarks/bench_urls.py [count] [distinct]
+"""
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import validators  # noqa: E402
+
+from readme_urls import cache_stats, check_url, clear_cache, validate_urls  # noqa: E402
+
+HOSTS = ['https://github.com/org/{}', 'https://{}.readthedocs.io/en/latest/', 'https://wiki.example.com/{}']
+GARBAGE = ['', 'N/A', 'TODO', 'github.com/{}', 'see docs', 'http://']
+
+
+def make_urls(count, distinct, seed=1):
+    """count URLs drawn from `distinct` values: mostly real-looking links, about 5% garbage."""
+    rng = random.Random(seed)
+    pool = []
+    for index in range(distinct):
+        template = rng.choice(GARBAGE) if rng.random() < 0.05 else rng.choice(HOSTS)
+        pool.append(template.format(f"project-{index}") if '{}' in template else template)
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+    urls = make_urls(count, distinct)
+
+    start = time.perf_counter()
+    loop_verdicts = [bool(validators.url(url)) for url in urls]
+    loop_seconds = time.perf_counter() - start
+
+    clear_cache()
+    start = time.perf_counter()
+    verdicts = validate_urls(urls)
+    bulk_seconds = time.perf_counter() - start
+    assert [verdicts[url] for url in urls] == loop_verdicts
+
+    stats = cache_stats()
+    print(f"{count} URLs, {len(verdicts)} distinct")
+    print(f"is_valid_url loop: {loop_seconds:8.3f}s  ({count / loop_seconds:12,.0f} URLs/s)")
+    print(f"validate_urls:     {bulk_seconds:8.3f}s  ({count / bulk_seconds:12,.0f} URLs/s)  "
+          f"speedup {loop_seconds / bulk_seconds:.1f}x")
+    print(f"prefilter rejects: {stats['prefilter_rejects']}, "
+          f"validators calls: {stats['misses'] - stats['prefilter_rejects']}")
+
+    clear_cache()
+    start = time.perf_counter()
+    for url in urls:  # the per-URL path get_valid_url() and batch records take
+        check_url(url)
+    cached_seconds = time.perf_counter() - start
+    print(f"check_url loop:    {cached_seconds:8.3f}s  ({count / cached_seconds:12,.0f} URLs/s)  "
+          f"cache hit rate {cache_stats()['hit_rate']:.1%}")
+
+if __name__ == '__main__':
+    main()
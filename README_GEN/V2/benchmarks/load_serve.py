@@ -0,0 +1,134 @@
+"""Load test for `readme-generator serve` against one CLI process per request.
+
+Starts the server on a free localhost port, fires REQUESTS render requests
+over CONCURRENCY keep-alive connections, and reports throughput and p50/p99
+latency. For comparison it then renders the same payload with a fresh
+`readme_generater.py batch` process per request, which is what scripting the
+CLI costs today.
+
+Run from README_GEN/V2:  python benchmarks/load_serve.py [requests] [concurrency]
+"""
+import asyncio
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, HERE)
+
+from readme_links import percentile  # noqa: E402
+
+SCRIPT = os.path.join(HERE, 'readme_generater.py')
+CLI_RUNS = 20
+PAYLOAD = {
+    'project_name': 'Load Test Project',
+    'project_description': 'A project rendered over and over.',
+    'project_homepage': 'https://example.com/load-test',
+    'project_doc_url': 'https://example.com/load-test/docs',
+    'install_command': 'pip install load-test',
+    'usage_instructions': 'load-test --help',
+    'test_command': 'pytest',
+    'license_name': 'MIT',
+    'author': 'Bench Runner',
+    'dependencies': ['click', 'rich', 'validators'],
+}
+
+
+def free_port():
+    with socket.socket() as probe:
+        probe.bind(('127.0.0.1', 0))
+        return probe.getsockname()[1]
+
+
+async def wait_for_server(port, deadline=30.0):
+    start = time.perf_counter()
+    while time.perf_counter() - start < deadline:
+        try:
+            _, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.close()
+            return
+        except OSError:
+            await asyncio.sleep(0.05)
+    raise RuntimeError("server did not start")
+
+
+async def client(port, count, latencies):
+    """Send count requests over one keep-alive connection, recording each latency."""
+    body = json.dumps(PAYLOAD).encode('utf-8')
+    request = (f"POST /render HTTP/1.1\r\nHost: 127.0.0.1\r\nContent-Type: application/json\r\n"
+               f"Content-Length: {len(body)}\r\n\r\n").encode('latin-1') + body
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    try:
+        for _ in range(count):
+            start = time.perf_counter()
+            writer.write(request)
+            await writer.drain()
+            status_line = await reader.readline()
+            length = 0
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                if name.lower() == 'content-length':
+                    length = int(value)
+            await reader.readexactly(length)
+            if b' 200 ' not in status_line:
+                raise RuntimeError(status_line.decode('latin-1').strip())
+            latencies.append(time.perf_counter() - start)
+    finally:
+        writer.close()
+
+
+async def load(port, requests, concurrency):
+    await wait_for_server(port)
+    latencies = []
+    per_client = [requests // concurrency + (index < requests % concurrency) for index in range(concurrency)]
+    start = time.perf_counter()
+    await asyncio.gather(*(client(port, count, latencies) for count in per_client if count))
+    return time.perf_counter() - start, latencies
+
+
+def bench_server(requests, concurrency):
+    port = free_port()
+    server = subprocess.Popen([sys.executable, SCRIPT, 'serve', '--port', str(port)], cwd=HERE,
+                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        elapsed, latencies = asyncio.run(load(port, requests, concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    return elapsed, latencies
+
+
+def bench_cli():
+    latencies = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        record = json.dumps(dict(PAYLOAD, output_dir=tmp_dir)) + "\n"
+        for _ in range(CLI_RUNS):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, SCRIPT, 'batch', '--manifest', '-', '--jobs', '1', '--overwrite'],
+                           input=record, text=True, check=True, cwd=HERE,
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            latencies.append(time.perf_counter() - start)
+    return sum(latencies), latencies
+
+
+def report(label, elapsed, latencies):
+    print(f"{label:<28} {len(latencies) / elapsed:>9.0f} req/s   "
+          f"p50 {percentile(latencies, 0.50) * 1000:>7.2f} ms   p99 {percentile(latencies, 0.99) * 1000:>7.2f} ms")
+
+
+def main():
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 32
+    report(f"serve ({concurrency} connections)", *bench_server(requests, concurrency))
+    report("process per request", *bench_cli())
+
+
+if __name__ == '__main__':
+    main()
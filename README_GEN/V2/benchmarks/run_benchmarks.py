@@ -0,0 +1,275 @@
+"""Benchmark harness with JSON baselines for the hot paths of the generator.
+
+Every case is run on synthetic data of one size profile:
+
+    small   10,000-record manifest,    1 MB description   (seconds; the default)
+    medium  100,000-record manifest,  10 MB description
+    large   1,000,000-record manifest, 100 MB description  (several GB of RAM)
+
+For each case the best of --repeat timed runs is kept, and one extra run is
+made under tracemalloc to get the peak memory. The URL verdict cache is
+cleared before every run, so a case always measures a cold start.
+
+    python benchmarks/run_benchmarks.py --size small --save-baseline
+    python benchmarks/run_benchmarks.py --size small --threshold 0.25
+
+The first command stores benchmarks/baselines/small.json. The second
+compares against it and exits with status 1 if a case got slower or used
+more memory than the baseline by more than the threshold (a fraction:
+0.25 = 25%). Baselines depend on the machine, so make them on the machine
+that does the comparison.
+
+Run from README_GEN/V2.
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from readme_batch import iter_manifest, record_to_answers  # noqa: E402
+from readme_fanout import StagedFiles, write_targets  # noqa: E402
+from readme_generater import generate_readme, render_many, write_readme  # noqa: E402
+from readme_urls import clear_cache, validate_urls  # noqa: E402
+
+BASELINE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines')
+
+SIZES = {
+    'small': {'records': 10_000, 'description_bytes': 1024 ** 2, 'files': 200},
+    'medium': {'records': 100_000, 'description_bytes': 10 * 1024 ** 2, 'files': 2_000},
+    'large': {'records': 1_000_000, 'description_bytes': 100 * 1024 ** 2, 'files': 20_000},
+}
+
+LICENSES = ('MIT', 'Apache-2.0', 'BSD-3-Clause', 'GPL-3.0-or-later')
+DEPENDENCIES = ('click', 'rich', 'validators', 'requests', 'numpy', 'pandas')
+URL_TEMPLATES = ('https://github.com/org/{}', 'https://{}.readthedocs.io/en/latest/', 'github.com/{}', 'N/A')
+PARAGRAPH = ("The *project* reads `config_files` from [the docs](https://example.com) and writes <output> | "
+             "reports.\n1. First step\n- a bullet\n# not a heading\n\n")
+
+CASES = {}
+
+
+def case(function):
+    """Register a benchmark case: function(size, workdir) prepares the data and returns the callable to time."""
+    CASES[function.__name__] = function
+    return function
+
+
+def make_record(index, output_dir=''):
+    return {
+        'project_name': f"project-{index}",
+        'project_description': f"Project number {index}, which does *useful* things with snake_case data.",
+        'project_homepage': URL_TEMPLATES[index % 2].format(f"project-{index}"),
+        'project_doc_url': '',
+        'author': f"Team {index % 50}",
+        'license_name': LICENSES[index % len(LICENSES)],
+        'install_command': f"pip install project-{index}",
+        'usage_instructions': f"project-{index} --help",
+        'test_command': 'pytest',
+        'dependencies': list(DEPENDENCIES[:index % len(DEPENDENCIES) + 1]),
+        'output_dir': output_dir,
+    }
+
+
+def make_description(size_bytes):
+    """Markdown-heavy prose of about size_bytes, so escaping has real work to do."""
+    return PARAGRAPH * (size_bytes // len(PARAGRAPH) + 1)
+
+
+def write_manifest(path, count):
+    with open(path, 'w', encoding='utf-8') as manifest:
+        for index in range(count):
+            manifest.write(json.dumps(make_record(index)) + "\n")
+
+
+def make_urls(count, distinct, seed=1):
+    rng = random.Random(seed)
+    pool = [rng.choice(URL_TEMPLATES).format(f"project-{index}") for index in range(distinct)]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+@case
+def generate_readme_records(size, workdir):
+    records = [make_record(index) for index in range(size['records'])]
+
+    def run():
+        for record in records:
+            generate_readme(record, record['dependencies'], record['project_homepage'] or None)
+    return run
+
+
+@case
+def render_many_records(size, workdir):
+    records = [make_record(index) for index in range(size['records'])]
+    return lambda: render_many(records)
+
+
+@case
+def generate_readme_large_description(size, workdir):
+    answers = dict(make_record(0), project_description=make_description(size['description_bytes']))
+    return lambda: generate_readme(answers, answers['dependencies'])
+
+
+@case
+def write_readme_large_description(size, workdir):
+    answers = dict(make_record(0), project_description=make_description(size['description_bytes']))
+    output_dir = os.path.join(workdir, 'large')
+    os.makedirs(output_dir, exist_ok=True)
+    return lambda: write_readme(answers, answers['dependencies'], output_dir=output_dir, overwrite=True, quiet=True)
+
+
+@case
+def write_readme_files(size, workdir):
+    records = [make_record(index, os.path.join(workdir, 'files', str(index))) for index in range(size['files'])]
+    for record in records:
+        os.makedirs(record['output_dir'], exist_ok=True)
+
+    def run():
+        for record in records:
+            write_readme(record, record['dependencies'], output_dir=record['output_dir'], overwrite=True, quiet=True)
+    return run
+
+
+@case
+def write_readme_files_async(size, workdir):
+    records = [make_record(index, os.path.join(workdir, 'async', str(index))) for index in range(size['files'])]
+    for record in records:
+        os.makedirs(record['output_dir'], exist_ok=True)
+
+    def run():
+        targets = []
+        for record in records:
+            target = StagedFiles()
+            write_readme(record, record['dependencies'], output_dir=record['output_dir'], overwrite=True, quiet=True,
+                         write=target.write)
+            targets.append(target.files)
+        write_targets(targets)
+    return run
+
+
+@case
+def validate_urls_bulk(size, workdir):
+    urls = make_urls(size['records'], max(1, size['records'] // 50))
+    return lambda: validate_urls(urls)
+
+
+@case
+def ingest_manifest(size, workdir):
+    manifest_path = os.path.join(workdir, 'manifest.jsonl')
+    if not os.path.exists(manifest_path):
+        write_manifest(manifest_path, size['records'])
+
+    def run():
+        for _, record in iter_manifest(manifest_path):
+            record_to_answers(record)
+    return run
+
+
+def reset_caches():
+    clear_cache()
+    gc.collect()
+
+
+def measure(run, repeat):
+    """Best wall time of repeat runs, plus the tracemalloc peak of one more run."""
+    timings = []
+    for _ in range(repeat):
+        reset_caches()
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    reset_caches()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {'seconds': min(timings), 'peak_bytes': peak}
+
+
+def run_cases(size_name, names=None, repeat=5, progress=None):
+    """Run the named cases (all by default) at one size; returns the results document."""
+    size = SIZES[size_name]
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for name in names or CASES:
+            run = CASES[name](size, workdir)
+            results[name] = measure(run, repeat)
+            if progress:
+                progress(name, results[name])
+            del run
+    return {'size': size_name, 'python': platform.python_version(), 'machine': platform.machine(),
+            'results': results}
+
+
+def compare(results, baseline, threshold, memory_threshold=None):
+    """Regressions of results against baseline, as messages; cases missing from either side are ignored."""
+    if memory_threshold is None:
+        memory_threshold = threshold
+    if baseline.get('size') != results.get('size'):
+        raise ValueError(f"baseline is for size {baseline.get('size')!r}, results for {results.get('size')!r}")
+    regressions = []
+    for name, current in results['results'].items():
+        expected = baseline['results'].get(name)
+        if expected is None:
+            continue
+        for key, limit in (('seconds', threshold), ('peak_bytes', memory_threshold)):
+            if expected[key] and current[key] > expected[key] * (1 + limit):
+                regressions.append(f"{name}: {key} {current[key]:.4g} vs baseline {expected[key]:.4g} "
+                                   f"(+{current[key] / expected[key] - 1:.0%}, limit +{limit:.0%})")
+    return regressions
+
+
+def print_result(name, result):
+    print(f"{name:<36} {result['seconds']:10.4f} s {result['peak_bytes'] / 1024 ** 2:10.1f} MB peak", flush=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    parser.add_argument('--size', choices=SIZES, default='small')
+    parser.add_argument('--case', dest='cases', action='append', choices=CASES,
+                        help='run only this case (repeatable)')
+    parser.add_argument('--repeat', type=int, default=5, help='timed runs per case; the best one is kept')
+    parser.add_argument('--baseline', help='baseline JSON (default: benchmarks/baselines/<size>.json)')
+    parser.add_argument('--save-baseline', action='store_true', help='store the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='allowed slowdown as a fraction of the baseline (default: 0.2)')
+    parser.add_argument('--memory-threshold', type=float, default=None,
+                        help='allowed growth of the memory peak (default: same as --threshold)')
+    parser.add_argument('--output', help='also write the results JSON to this file')
+    args = parser.parse_args(argv)
+
+    results = run_cases(args.size, args.cases, args.repeat, progress=print_result)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as output_file:
+            json.dump(results, output_file, indent=2)
+
+    baseline_path = args.baseline or os.path.join(BASELINE_DIR, f"{args.size}.json")
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(os.path.abspath(baseline_path)), exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as baseline_file:
+            json.dump(results, baseline_file, indent=2)
+        print(f"Baseline saved to {baseline_path}")
+        return 0
+    if not os.path.exists(baseline_path):
+        print(f"No baseline at {baseline_path}; run with --save-baseline first.")
+        return 0
+    with open(baseline_path, encoding='utf-8') as baseline_file:
+        regressions = compare(results, json.load(baseline_file), args.threshold, args.memory_threshold)
+    for message in regressions:
+        print(f"REGRESSION {message}")
+    if not regressions:
+        print(f"No regressions against {baseline_path} (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
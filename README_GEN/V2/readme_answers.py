@@ -0,0 +1,98 @@
+"""Compact record type for the answers a README is rendered from.
+
+ProjectAnswers holds the same ten fields as the answers dict that main() used
+to build, plus the dependency list, in ``__slots__``. That makes it a fraction
+of the size of a dict, and misspelt field names fail loudly instead of
+quietly creating a new key. Values that repeat across many projects (license,
+author, dependency names) are interned, so a batch of thousands of projects
+keeps only one copy of each. Dependencies are normalized on the way in (see
+readme_deps), so '  rich' and 'Rich' end up as one 'rich'.
+
+The record still behaves like a read/write mapping of its fields (keys(),
+items(), get(), ``answers['field']``), so code written against the dict keeps
+working.
+"""
+import sys
+
+from readme_deps import normalize_dependencies
+
+ANSWER_FIELDS = (
+    'project_name', 'project_description', 'project_homepage', 'project_doc_url',
+    'author', 'license_name', 'install_command', 'usage_instructions', 'test_command',
+)
+INTERNED_FIELDS = ('author', 'license_name')
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class ProjectAnswers:
+    """The answers for one project: string fields plus a tuple of dependencies."""
+
+    __slots__ = ANSWER_FIELDS + ('dependencies',)
+
+    def __init__(self, project_name='', project_description='', project_homepage='', project_doc_url='',
+                 author='', license_name='', install_command='', usage_instructions='', test_command='',
+                 dependencies=()):
+        self.project_name = project_name
+        self.project_description = project_description
+        self.project_homepage = project_homepage
+        self.project_doc_url = project_doc_url
+        self.author = _intern(author)
+        self.license_name = _intern(license_name)
+        self.install_command = install_command
+        self.usage_instructions = usage_instructions
+        self.test_command = test_command
+        self.dependencies = tuple(map(_intern, normalize_dependencies(dependencies)))
+
+    @classmethod
+    def from_mapping(cls, mapping):
+        """Build a record from a dict-like object, treating missing or empty values as ''."""
+        dependencies = mapping.get('dependencies') or ()
+        if isinstance(dependencies, str):
+            dependencies = dependencies.split(",")  # same format get_dependencies() accepts
+        return cls(*[mapping.get(field) or '' for field in ANSWER_FIELDS], dependencies=dependencies)
+
+    def keys(self):
+        return self.__slots__
+
+    def items(self):
+        return [(field, getattr(self, field)) for field in self.__slots__]
+
+    def get(self, field, default=None):
+        return getattr(self, field, default) if field in self.__slots__ else default
+
+    def __getitem__(self, field):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __setitem__(self, field, value):
+        if field not in self.__slots__:
+            raise KeyError(field)
+        if field in INTERNED_FIELDS:
+            value = _intern(value)
+        elif field == 'dependencies':
+            value = tuple(map(_intern, normalize_dependencies(value)))
+        setattr(self, field, value)
+
+    def __contains__(self, field):
+        return field in self.__slots__
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __eq__(self, other):
+        if not isinstance(other, ProjectAnswers):
+            return NotImplemented
+        return all(getattr(self, field) == getattr(other, field) for field in self.__slots__)
+
+    def __repr__(self):
+        return f"ProjectAnswers(project_name={self.project_name!r}, ...)"
+
+    def to_dict(self):
+        """Plain dict copy, e.g. for JSON; dependencies become a list."""
+        answers = dict(self.items())
+        answers['dependencies'] = list(self.dependencies)
+        return answers
@@ -0,0 +1,348 @@
+"""Non-interactive batch mode: render READMEs for many projects from a manifest.
+
+A manifest is either JSON Lines (one answers object per line) or CSV with a
+header row. Every record uses the same keys as the ``answers`` dict built in
+``main()`` plus an ``output_dir`` naming the directory the README goes to and,
+for --scan, an optional ``project_dir`` to read packaging metadata from.
+
+With --since only the projects of a git checkout that changed since a
+revision are rendered (see readme_git). Without a manifest, those projects
+are found from their packaging files and filled in by a scan.
+
+With --writer async the READMEs of a chunk are rendered first and then
+written concurrently (see readme_fanout). Every record still gets its own
+status, and --target-report lists each one with its write latency.
+"""
+import csv
+import itertools
+import json
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from readme_answers import ProjectAnswers
+from readme_generater import write_readme
+from readme_links import extract_links, percentile
+from readme_metrics import metrics
+from readme_urls import check_url
+from readme_writer import DEFAULT_BUFFER_SIZE, DEFAULT_WRITE_CONCURRENCY, atomic_write, digest_path
+
+WRITE_OPTIONS = ('create_new_readme', 'template', 'buffer_size', 'incremental', 'update', 'formats')
+MAX_REPORTED_ERRORS = 50  # per status (failed, skipped): a sample keeps the summary small on huge manifests
+
+
+def _open_manifest(manifest_path):
+    """Open the manifest for streaming, '-' meaning stdin."""
+    if manifest_path == '-':
+        return sys.stdin
+    return open(manifest_path, newline='', encoding='utf-8')
+
+
+def iter_manifest(manifest_path, manifest_format=None):
+    """Yield (line_number, record) pairs from a JSONL or CSV manifest, one at a time."""
+    if manifest_format is None:
+        manifest_format = 'csv' if manifest_path.lower().endswith('.csv') else 'jsonl'
+
+    manifest = _open_manifest(manifest_path)
+    try:
+        if manifest_format == 'csv':
+            reader = csv.DictReader(manifest)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_number, line in enumerate(manifest, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except ValueError as error:
+                    yield line_number, {'_error': f"invalid JSON: {error}"}
+    finally:
+        if manifest is not sys.stdin:
+            manifest.close()
+
+
+def record_to_answers(record):
+    """Build the ProjectAnswers (including dependencies) that write_readme() expects."""
+    return ProjectAnswers.from_mapping(record)
+
+
+def fill_from_scan(record):
+    """Return a copy of record with its empty fields taken from a scan of the project directory."""
+    from readme_scan import scan_project
+
+    project_dir = record.get('project_dir') or record.get('output_dir')
+    if not project_dir:
+        return record
+    filled = dict(record)
+    for key, value in scan_project(project_dir).items():
+        if value and not filled.get(key):
+            filled[key] = value
+    return filled
+
+
+def changed_records(since, manifest_path=None, manifest_format=None):
+    """The manifest records (or, without a manifest, discovered projects) with changes since a git revision.
+
+    Returns (records, changes). records is a list of (line_number, record)
+    pairs in manifest order. changes counts the changed paths and projects.
+    Unreadable records are kept so that they are still reported.
+    """
+    from readme_git import ProjectIndex, changed_items, changed_paths, find_project_roots, repo_parts
+
+    top, paths = changed_paths(since)
+    changes = {'since': since, 'changed_paths': len(paths)}
+    if manifest_path is None:
+        roots = find_project_roots(top, paths)
+        records = [(number, {'project_dir': os.path.join(top, root), 'output_dir': os.path.join(top, root)})
+                   for number, root in enumerate(roots, start=1)]
+        changes.update(projects=None, changed_projects=len(records))
+        return records, changes
+
+    index = ProjectIndex()
+    records = []
+    for line_number, record in iter_manifest(manifest_path, manifest_format):
+        if not isinstance(record, dict) or '_error' in record:
+            records.append((line_number, record))
+            continue
+        root = record.get('project_dir') or record.get('output_dir')
+        parts = repo_parts(root, top) if root else None
+        if parts is not None:  # projects outside the checkout never have changes
+            index.add(parts, (line_number, record))
+    changed = changed_items(index, paths)
+    changes.update(projects=index.roots, changed_projects=len(changed))
+    records += changed
+    records.sort(key=lambda item: item[0])
+    return records, changes
+
+
+def render_record(line_number, record, options, write=atomic_write):
+    """Render one manifest record with the given write_readme options.
+
+    Returns a (status, line_number, detail, bytes_written, write_seconds,
+    links) tuple; links are only collected when options['check_links'] is set.
+    """
+    if not isinstance(record, dict):
+        return 'failed', line_number, "record is not a JSON object", 0, 0.0, ()
+    if '_error' in record:
+        return 'failed', line_number, record['_error'], 0, 0.0, ()
+    if options.get('scan'):
+        try:
+            with metrics.phase('ingest'):
+                record = fill_from_scan(record)
+        except OSError as error:
+            return 'failed', line_number, f"scan failed: {error}", 0, 0.0, ()
+    if not record.get('project_name'):
+        return 'skipped', line_number, "missing project_name", 0, 0.0, ()
+    output_dir = record.get('output_dir')
+    if not output_dir:
+        return 'skipped', line_number, "missing output_dir", 0, 0.0, ()
+
+    write_options = {key: value for key, value in options.items() if key in WRITE_OPTIONS}
+    try:
+        answers = record_to_answers(record)
+        if options.get('enrich_deps'):
+            from readme_deps import enrich_dependencies, open_index
+            with metrics.phase('ingest'):
+                index = open_index(options.get('deps_index'))
+                answers['dependencies'] = enrich_dependencies(answers['dependencies'], index)
+        for field in ('project_homepage', 'project_doc_url'):
+            if answers[field] and not check_url(answers[field]):
+                return 'failed', line_number, f"invalid {field} URL: {answers[field]}", 0, 0.0, ()
+        os.makedirs(output_dir, exist_ok=True)
+        readme_file_path = os.path.join(output_dir, 'README.md')
+        generated_before = options.get('incremental') and os.path.exists(digest_path(readme_file_path))
+        replaces = ('overwrite', 'create_new_readme', 'update')
+        if not generated_before and not any(options.get(key) for key in replaces) \
+                and os.path.exists(readme_file_path):
+            return 'skipped', line_number, "README.md already exists", 0, 0.0, ()
+        write_options['overwrite'] = True
+        result = write_readme(answers, answers['dependencies'],
+                              homepage_url=answers['project_homepage'] or None,
+                              doc_url=answers['project_doc_url'] or None,
+                              output_dir=output_dir, quiet=True, write=write, **write_options)
+        links = ()
+        if options.get('check_links'):
+            with open(result['path'], encoding='utf-8') as readme_file:
+                links = extract_links(readme_file.read())
+    except Exception as error:  # one bad record must not abort the whole batch
+        return 'failed', line_number, f"{type(error).__name__}: {error}", 0, 0.0, ()
+    if result['unchanged']:
+        return 'unchanged', line_number, result['path'], 0, 0.0, links
+    return 'written', line_number, result['path'], result['bytes_written'], result['write_seconds'], links
+
+
+def render_chunk_async(chunk, options):
+    """Render a chunk with its files staged in memory, then write them all concurrently (readme_fanout)."""
+    from readme_fanout import StagedFiles, write_targets
+
+    results = []
+    staged = []  # (index in results, files)
+    render_options = dict(options, check_links=False)  # the files only exist once write_targets() is done
+    for line_number, record in chunk:
+        target = StagedFiles()
+        results.append(render_record(line_number, record, render_options, write=target.write))
+        if results[-1][0] == 'written' and target.files:  # --update splices write directly
+            staged.append((len(results) - 1, target.files))
+
+    reports = write_targets([files for _, files in staged],
+                            options.get('write_concurrency') or DEFAULT_WRITE_CONCURRENCY,
+                            options.get('buffer_size') or DEFAULT_BUFFER_SIZE)
+    for (index, files), report in zip(staged, reports):
+        _, line_number, path, bytes_written, _, _ = results[index]
+        if metrics.enabled:
+            metrics.add_time('write', report['seconds'])
+        if not report['ok']:
+            results[index] = 'failed', line_number, f"write failed: {report['error']}", 0, report['seconds'], ()
+            continue
+        links = extract_links(files[0][1].decode('utf-8')) if options.get('check_links') else ()
+        results[index] = 'written', line_number, path, bytes_written, report['seconds'], links
+    return results
+
+
+def render_chunk(chunk, options):
+    """Worker entry point: render a chunk of records and return only their statuses."""
+    if options.get('writer') == 'async' and not options.get('update') and len(chunk) > 1:
+        return render_chunk_async(chunk, options)
+    return [render_record(line_number, record, options) for line_number, record in chunk]
+
+
+def render_chunk_with_metrics(chunk, options):
+    """Worker entry point for --metrics-json runs: statuses plus the worker's metrics for this chunk."""
+    metrics.enable()
+    return render_chunk(chunk, options), metrics.drain()
+
+
+def _chunks(records, chunk_size):
+    """Split a record stream into lists of at most chunk_size records."""
+    while True:
+        chunk = list(itertools.islice(records, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _tally(summary, results, target_report=None):
+    for status, line_number, detail, bytes_written, write_seconds, links in results:
+        summary[status] += 1
+        metrics.count('records_' + status)
+        summary['bytes_written'] += bytes_written
+        if status == 'written':
+            summary['write_seconds'].append(write_seconds)
+        if target_report is not None:
+            target_report.write(json.dumps({'line': line_number, 'status': status, 'detail': detail,
+                                            'bytes_written': bytes_written, 'write_seconds': write_seconds}) + "\n")
+        # the first MAX_REPORTED_ERRORS of each status, so skipped records cannot crowd out the failures
+        if status in ('failed', 'skipped') and summary[status] <= MAX_REPORTED_ERRORS:
+            summary['errors'].append((status, line_number, detail))
+        for link in links:
+            summary['links'].setdefault(link, line_number)
+
+
+def run_batch(manifest_path=None, jobs=None, chunk_size=64, manifest_format=None, since=None, target_report=None,
+              **options):
+    """Render every record in the manifest and return a summary dict.
+
+    ``options`` are write_readme() keyword arguments (overwrite, template,
+    incremental, ...) plus ``scan``, ``check_links``, ``enrich_deps``,
+    ``deps_index``, ``writer`` and ``write_concurrency``. Records are read
+    lazily and at most ``2 * jobs`` chunks are in flight at a time, so memory
+    use does not grow with the size of the manifest. With check_links, the
+    distinct links of all READMEs are checked once at the end. With since,
+    only projects changed since that git revision are rendered; the manifest
+    may then be None to render every changed project found in the checkout.
+    With writer='async' each chunk is written through readme_fanout, up to
+    write_concurrency targets at a time per worker. target_report is a path
+    that receives one JSON line per record with its status and write latency.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    summary = {'written': 0, 'unchanged': 0, 'failed': 0, 'skipped': 0, 'bytes_written': 0, 'errors': [],
+               'links': {}, 'write_seconds': array('d')}
+    start = time.perf_counter()
+    if options.get('enrich_deps'):
+        from readme_deps import open_index
+        with metrics.phase('ingest'):
+            open_index(options.get('deps_index')).close()  # build a missing index once, before any worker needs it
+        open_index.cache_clear()  # forked workers must not share the parent's sqlite connection
+    if since is None:
+        records = metrics.timed(iter_manifest(manifest_path, manifest_format), 'ingest')
+    else:
+        with metrics.phase('ingest'):
+            records, summary['changes'] = changed_records(since, manifest_path, manifest_format)
+        metrics.count('changed_paths', summary['changes']['changed_paths'])
+        if manifest_path is None:
+            options['scan'] = True  # discovered projects only have a directory to go on
+        records = iter(records)
+    chunks = _chunks(records, chunk_size)
+    report_file = open(target_report, 'w', encoding='utf-8') if target_report else None
+
+    try:
+        if jobs == 1:
+            for chunk in chunks:
+                _tally(summary, render_chunk(chunk, options), report_file)
+        else:
+            worker = render_chunk_with_metrics if metrics.enabled else render_chunk
+
+            def collect(future):
+                results = future.result()
+                if metrics.enabled:
+                    results, worker_metrics = results
+                    metrics.merge(worker_metrics)
+                _tally(summary, results, report_file)
+
+            with ProcessPoolExecutor(max_workers=jobs) as executor:
+                in_flight = set()
+                for chunk in chunks:
+                    if len(in_flight) >= 2 * jobs:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            collect(future)
+                    in_flight.add(executor.submit(worker, chunk, options))
+                for future in wait(in_flight).done:
+                    collect(future)
+    finally:
+        if report_file is not None:
+            report_file.close()
+
+    summary['elapsed'] = time.perf_counter() - start
+    write_seconds = summary.pop('write_seconds')
+    summary['write_latency'] = {'p50_seconds': percentile(write_seconds, 0.50),
+                                'p99_seconds': percentile(write_seconds, 0.99),
+                                'max_seconds': max(write_seconds, default=0.0)}
+    total = summary['written'] + summary['unchanged'] + summary['failed'] + summary['skipped']
+    summary['records_per_sec'] = total / summary['elapsed'] if summary['elapsed'] else 0.0
+    if options.get('check_links'):
+        from readme_links import check_links
+        with metrics.phase('links'):
+            summary['link_report'] = check_links(summary['links'])
+    return summary
+
+
+def print_summary(summary, console):
+    """Print the end-of-run summary of a batch."""
+    total = summary['written'] + summary['unchanged'] + summary['failed'] + summary['skipped']
+    if 'changes' in summary:
+        changes = summary['changes']
+        of_projects = f" of {changes['projects']}" if changes['projects'] is not None else ''
+        console.print(f"{changes['changed_paths']} paths changed since {changes['since']}, "
+                      f"in {changes['changed_projects']}{of_projects} projects", style="bold")
+    console.print(f"Processed {total} records in {summary['elapsed']:.2f}s "
+                  f"({summary['records_per_sec']:.1f} records/sec)", style="bold")
+    console.print(f"Written: {summary['written']} ({summary['bytes_written']} bytes)", style="bold green")
+    if summary['written']:
+        latency = summary['write_latency']
+        console.print(f"Write latency per README: p50 {latency['p50_seconds'] * 1000:.1f} ms, "
+                      f"p99 {latency['p99_seconds'] * 1000:.1f} ms, max {latency['max_seconds'] * 1000:.1f} ms")
+    if summary['unchanged']:
+        console.print(f"Unchanged: {summary['unchanged']}", style="bold green")
+    if summary['skipped']:
+        console.print(f"Skipped: {summary['skipped']}", style="bold yellow")
+    if summary['failed']:
+        console.print(f"Failed: {summary['failed']}", style="bold red")
+    for status, line_number, detail in summary['errors']:
+        console.print(f"  line {line_number}: {status} ({detail})")
+    if 'link_report' in summary:
+        from readme_links import print_link_report
+        print_link_report(summary['link_report'], console)
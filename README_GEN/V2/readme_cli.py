@@ -0,0 +1,190 @@
+"""Command-line entry point of the README generator (the installed readme-generator command)."""
+import os
+import sys
+
+import click
+
+from readme_generater import console, main
+from readme_metrics import run_instrumented
+from readme_templates import load_template
+from readme_writer import DEFAULT_BUFFER_SIZE, DEFAULT_WRITE_CONCURRENCY
+
+
+TESTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'tests')
+
+
+def run_test_suite(tests_dir=None):
+    """Run the pytest suite of a source checkout; returns pytest's exit code.
+
+    The tests are not installed with the modules, so an installed copy
+    reports that instead of letting pytest fail on a missing directory.
+    """
+    tests_dir = tests_dir or TESTS_DIR
+    if not os.path.isdir(tests_dir):
+        console.print(f"--run-tests only works from a source checkout: no test suite at {tests_dir}.",
+                      style="bold red")
+        return 1
+    try:
+        import pytest
+    except ImportError:
+        console.print("--run-tests needs pytest (pip install 'readme_generator[test]').", style="bold red")
+        return 1
+    return pytest.main(['-q', tests_dir])
+
+
+@click.group(invoke_without_command=True)
+@click.option('--run-tests', is_flag=True, help='Run the test suite (needs pytest and a source checkout)')
+@click.option('--create-new-readme', is_flag=True, help='Create a new README.md file')
+@click.option('--template', 'template_path', type=click.Path(exists=True, dir_okay=False),
+              help='Markdown template to render instead of the built-in layout')
+@click.option('--buffer-size', type=click.IntRange(min=1), default=DEFAULT_BUFFER_SIZE, show_default=True,
+              help='Write buffer size in bytes')
+@click.option('--incremental', is_flag=True, help='Skip rendering when the inputs have not changed since the last run')
+@click.option('--update', is_flag=True, help='Update only the generated sections of an existing README.md in place')
+@click.option('--scan', 'scan_dir', type=click.Path(exists=True, file_okay=False),
+              help='Pre-fill answers from the packaging files of this project directory')
+@click.option('--check-links', is_flag=True, help='Check that the links in the generated README are reachable')
+@click.option('--output-format', 'formats', type=click.Choice(['html', 'rst']), multiple=True,
+              help='Also write README.html / README.rst next to README.md (repeatable; not with --template)')
+@click.option('--answers', 'answers_path', type=click.Path(dir_okay=False, allow_dash=True),
+              help="Read the answers from a JSON, JSON Lines, YAML or TOML file ('-' for stdin); "
+                   "only missing fields are prompted for")
+@click.option('--answers-format', type=click.Choice(['json', 'jsonl', 'yaml', 'toml']), default=None,
+              help='Format of --answers (default: guessed from the extension or the content)')
+@click.option('--enrich-deps', is_flag=True,
+              help='Link each dependency to its docs, with its summary and license, from installed package metadata')
+@click.option('--deps-index', type=click.Path(dir_okay=False),
+              help='Dependency metadata index to use with --enrich-deps (default: in the user cache directory)')
+@click.option('--metrics-json', type=click.Path(dir_okay=False, allow_dash=True),
+              help="Write per-phase timings and counters as JSON to this file ('-' for stdout)")
+@click.option('--profile', 'profile_path', type=click.Path(dir_okay=False),
+              help='Write a cProfile/pstats dump of the run to this file')
+@click.pass_context
+def cli(ctx, run_tests, create_new_readme, template_path, buffer_size, incremental, update, scan_dir, check_links,
+        formats, answers_path, answers_format, enrich_deps, deps_index, metrics_json, profile_path):
+    if ctx.invoked_subcommand is not None:
+        return
+    if run_tests:
+        sys.exit(run_test_suite())
+    else:
+        from readme_input import AnswersError
+
+        if template_path and formats:
+            raise click.UsageError("--template only applies to README.md; it cannot be combined with --output-format")
+        template = load_template(template_path) if template_path else None
+        try:
+            run_instrumented(lambda: main(run_tests, create_new_readme, template=template, buffer_size=buffer_size,
+                                          incremental=incremental, update=update, scan_dir=scan_dir,
+                                          check_links=check_links, formats=formats, answers_path=answers_path,
+                                          answers_format=answers_format, enrich_deps=enrich_deps,
+                                          deps_index=deps_index),
+                             metrics_json, profile_path)
+        except AnswersError as error:
+            console.print(f"Cannot read answers: {error}", style="bold red")
+            sys.exit(1)
+
+@cli.command()
+@click.option('--manifest', help="JSONL or CSV manifest of projects ('-' for stdin)")
+@click.option('--since', metavar='REV',
+              help='Only render projects with changes in the git checkout since REV (or in a REV..REV range); '
+                   'without --manifest, every changed project with a packaging file')
+@click.option('--jobs', type=click.IntRange(min=1), default=None,
+              help='Number of worker processes (default: CPU count)')
+@click.option('--chunk-size', type=click.IntRange(min=1), default=64, show_default=True,
+              help='Records sent to a worker at a time')
+@click.option('--format', 'manifest_format', type=click.Choice(['jsonl', 'csv']), default=None,
+              help='Manifest format (default: guessed from the file extension)')
+@click.option('--overwrite', is_flag=True, help='Overwrite existing README.md files instead of skipping them')
+@click.option('--create-new-readme', is_flag=True, help='Create a new timestamped README next to existing ones')
+@click.option('--template', 'template_path', type=click.Path(exists=True, dir_okay=False),
+              help='Markdown template to render instead of the built-in layout')
+@click.option('--buffer-size', type=click.IntRange(min=1), default=DEFAULT_BUFFER_SIZE, show_default=True,
+              help='Write buffer size in bytes')
+@click.option('--incremental', is_flag=True, help='Skip projects whose inputs have not changed since the last run')
+@click.option('--update', is_flag=True, help='Update only the generated sections of existing README.md files')
+@click.option('--scan', is_flag=True,
+              help="Fill fields a record leaves empty by scanning its project_dir (or output_dir)")
+@click.option('--check-links', is_flag=True, help='Check that the links in the generated READMEs are reachable')
+@click.option('--output-format', 'formats', type=click.Choice(['html', 'rst']), multiple=True,
+              help='Also write README.html / README.rst files next to each README.md (repeatable; not with --template)')
+@click.option('--enrich-deps', is_flag=True,
+              help='Link each dependency to its docs, with its summary and license, from installed package metadata')
+@click.option('--deps-index', type=click.Path(dir_okay=False),
+              help='Dependency metadata index to use with --enrich-deps (default: in the user cache directory)')
+@click.option('--writer', type=click.Choice(['sync', 'async']), default='sync', show_default=True,
+              help='Write the READMEs of a chunk one by one, or render them first and write them concurrently')
+@click.option('--write-concurrency', type=click.IntRange(min=1), default=DEFAULT_WRITE_CONCURRENCY, show_default=True,
+              help='READMEs each worker writes at a time with --writer async')
+@click.option('--target-report', type=click.Path(dir_okay=False),
+              help='Write one JSON line per record (status, path or reason, bytes, write latency) to this file')
+@click.option('--metrics-json', type=click.Path(dir_okay=False, allow_dash=True),
+              help="Write per-phase timings and counters as JSON to this file ('-' for stdout)")
+@click.option('--profile', 'profile_path', type=click.Path(dir_okay=False),
+              help='Write a cProfile/pstats dump of the run (the parent process only with --jobs > 1) to this file')
+def batch(manifest, since, jobs, chunk_size, manifest_format, overwrite, create_new_readme, template_path,
+          buffer_size, incremental, update, scan, check_links, formats, enrich_deps, deps_index, writer,
+          write_concurrency, target_report, metrics_json, profile_path):
+    """Render READMEs for every project in a manifest without prompting."""
+    from readme_batch import print_summary, run_batch
+    from readme_git import GitError
+
+    if manifest is None and since is None:
+        raise click.UsageError("give a --manifest, --since or both")
+    if template_path and formats:
+        raise click.UsageError("--template only applies to README.md; it cannot be combined with --output-format")
+    template = load_template(template_path) if template_path else None
+    try:
+        summary = run_instrumented(lambda: run_batch(manifest, jobs=jobs, chunk_size=chunk_size, since=since,
+                                                     overwrite=overwrite, create_new_readme=create_new_readme,
+                                                     manifest_format=manifest_format, template=template,
+                                                     buffer_size=buffer_size, incremental=incremental, update=update,
+                                                     scan=scan, check_links=check_links, formats=formats,
+                                                     enrich_deps=enrich_deps, deps_index=deps_index,
+                                                     writer=writer, write_concurrency=write_concurrency,
+                                                     target_report=target_report),
+                                   metrics_json, profile_path)
+    except GitError as error:
+        console.print(f"Cannot detect changes: {error}", style="bold red")
+        sys.exit(1)
+    print_summary(summary, console)
+    if summary['failed'] or summary.get('link_report', {}).get('broken'):
+        sys.exit(1)
+
+
+@cli.command()
+@click.option('--host', default='127.0.0.1', show_default=True, help='Address to listen on')
+@click.option('--port', type=int, default=8000, show_default=True, help='TCP port to listen on')
+@click.option('--socket', 'socket_path', type=click.Path(dir_okay=False),
+              help='Listen on this Unix socket instead of a TCP port')
+@click.option('--workers', type=click.IntRange(min=1), default=None,
+              help='Number of render processes (default: CPU count)')
+@click.option('--render-timeout', type=float, default=30.0, show_default=True, help='Seconds allowed per render')
+def serve(host, port, socket_path, workers, render_timeout):
+    """Keep the renderer warm and render READMEs from JSON POSTed to /render."""
+    import asyncio
+    from readme_serve import serve as run_server
+
+    def ready(server):
+        where = socket_path or f"http://{host}:{port}"
+        console.print(f"Serving on {where} with {server.workers} workers (Ctrl+C to stop)", style="bold green")
+
+    metrics = asyncio.run(run_server(host, port, socket_path, workers, render_timeout, ready=ready))
+    console.print(f"Served {metrics['requests']} requests ({metrics['errors']} errors), "
+                  f"p50 {metrics['latency_p50_ms']:.1f} ms, p99 {metrics['latency_p99_ms']:.1f} ms", style="bold")
+
+
+@cli.command('deps-index')
+@click.option('--index', 'index_path', type=click.Path(dir_okay=False),
+              help='Index file to build (default: in the user cache directory)')
+@click.option('--mirror', 'mirrors', type=click.Path(exists=True, file_okay=False), multiple=True,
+              help='Also index the wheels and sdists in this directory (repeatable)')
+@click.option('--no-installed', is_flag=True, help='Leave out the distributions installed in this environment')
+def build_deps_index(index_path, mirrors, no_installed):
+    """Build or refresh the dependency metadata index used by --enrich-deps."""
+    from readme_deps import DependencyIndex
+
+    index = DependencyIndex(index_path)
+    stats = index.build(mirrors=mirrors, installed=not no_installed)
+    console.print(f"Indexed {stats['packages']} packages in {index.path} ({stats['installed']} installed, "
+                  f"{stats['archives_read']} archives read, {stats['archives_reused']} unchanged) "
+                  f"in {stats['seconds']:.2f}s", style="bold green")
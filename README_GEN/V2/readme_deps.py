@@ -0,0 +1,317 @@
+"""Dependency normalization and offline enrichment from package metadata.
+
+normalize_dependencies() turns the dependency strings of a project (typed,
+scanned or read from a manifest) into one entry per distribution. Whitespace
+is stripped, names are compared in their PEP 503 normalized form, duplicates
+are merged and version specifiers are written without spaces.
+
+enrich_dependencies() adds a summary, a documentation (or home page) URL
+and a license to each dependency. It looks them up in a DependencyIndex: a
+sqlite file built once from the metadata of the installed distributions
+(importlib.metadata) and of the wheels and sdists in local mirror
+directories. A rebuild only reopens the archives whose mtime or size
+changed. After that, enriching a dependency is a primary-key lookup,
+memoized in the process, and nothing touches the network.
+"""
+import os
+import re
+import sys
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+from readme_escape import escape_prose
+
+INDEX_VERSION = 1
+LOOKUP_BATCH = 500  # stays below sqlite's limit on query parameters
+ARCHIVE_SUFFIXES = ('.whl', '.tar.gz', '.tgz', '.zip')
+MAX_LICENSE_LENGTH = 64  # longer License fields hold the whole license text
+
+# Only used on parse_requirement() cache misses, so they are left to re's cache instead of compiled at import
+_REQUIREMENT = r"""
+    ^\s*(?P<name>[A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*
+    (?:\[(?P<extras>[^\]]*)\])?\s*
+    (?:@\s*(?P<url>[^\s;]+)\s*|\(?(?P<specifier>[<>=!~][^;()]*)\)?\s*)?
+    (?:;\s*(?P<marker>.*?))?\s*$"""
+_CLAUSE = r"(~=|===|==|!=|<=|>=|<|>)\s*([^\s,]+)"
+_SEPARATORS = re.compile(r"[-_.]+")
+_LABEL = re.compile(r"[^a-z]")
+
+Requirement = namedtuple('Requirement', 'name key extras specifier marker')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS packages (key TEXT PRIMARY KEY, name TEXT, version TEXT, summary TEXT, url TEXT,
+                                     license TEXT);
+CREATE TABLE IF NOT EXISTS sources (path TEXT PRIMARY KEY, mtime REAL, size INTEGER, key TEXT, name TEXT,
+                                    version TEXT, summary TEXT, url TEXT, license TEXT);
+"""
+
+
+def canonical_name(name):
+    """PEP 503 normalized form of a distribution name."""
+    return _SEPARATORS.sub('-', name).lower()
+
+
+@lru_cache(maxsize=4096)
+def parse_requirement(text):
+    """Split a PEP 508-style requirement; text that does not parse is kept whole as the name."""
+    match = re.match(_REQUIREMENT, text, re.X)
+    if match is None:
+        text = ' '.join(text.split())
+        return Requirement(text, text.lower(), (), '', '')
+    extras = tuple(sorted({canonical_name(extra.strip()) for extra in (match['extras'] or '').split(',')
+                           if extra.strip()}))
+    if match['url']:
+        specifier = '@ ' + match['url']
+    else:
+        clauses = re.findall(_CLAUSE, match['specifier'] or '')
+        specifier = ','.join(dict.fromkeys(op + version for op, version in clauses))
+    marker = ' '.join((match['marker'] or '').split())
+    return Requirement(match['name'], canonical_name(match['name']), extras, specifier, marker)
+
+
+def requirement_text(requirement):
+    """The normalized text of a requirement, e.g. 'requests[socks]>=2.0,<3; python_version < "3.8"'."""
+    name, _, extras, specifier, marker = requirement
+    text = name + (f"[{','.join(extras)}]" if extras else '')
+    if specifier:
+        text += ' ' + specifier if specifier.startswith('@') else specifier
+    return text + ('; ' + marker if marker else '')
+
+
+def _merge(first, second):
+    if first.specifier.startswith('@') or second.specifier.startswith('@'):
+        specifier = first.specifier if first.specifier.startswith('@') else second.specifier
+    else:
+        clauses = [clause for clause in first.specifier.split(',') + second.specifier.split(',') if clause]
+        specifier = ','.join(dict.fromkeys(clauses))
+    marker = first.marker if first.marker == second.marker else ''  # needed in either environment: no marker
+    return Requirement(first.name, first.key, tuple(sorted(set(first.extras) | set(second.extras))), specifier,
+                       marker)
+
+
+def normalize_dependencies(dependencies):
+    """One normalized requirement string per distribution, in first-mention order.
+
+    Blank entries are dropped. Entries naming the same distribution
+    (compared by PEP 503 name) are merged. Enriched Dependency entries are
+    passed through unchanged; other non-string values (numbers from a JSON
+    manifest, say) are turned into strings first.
+    """
+    merged = {}
+    for dependency in dependencies or ():
+        if isinstance(dependency, Dependency):
+            merged.setdefault(canonical_name(dependency.name), dependency)
+            continue
+        if not isinstance(dependency, str):
+            dependency = '' if dependency is None else str(dependency)
+        if not dependency or dependency.isspace():
+            continue
+        requirement = parse_requirement(dependency)
+        known = merged.get(requirement.key)
+        if known is None:
+            merged[requirement.key] = requirement
+        elif isinstance(known, Requirement):
+            merged[requirement.key] = _merge(known, requirement)
+    return [requirement_text(value) if isinstance(value, Requirement) else value for value in merged.values()]
+
+
+class Dependency(namedtuple('Dependency', 'name rest url summary license')):
+    """An enriched dependency: the name, the rest of its requirement text and what the index knows about it.
+
+    str() gives the Markdown list item text, so templates render it with {.}.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        text = f"[{self.name}]({self.url}){self.rest}" if self.url else self.name + self.rest
+        if self.summary:
+            text += ': ' + escape_prose(self.summary)
+        if self.license:
+            text += f" ({escape_prose(self.license)})"
+        return text
+
+
+def default_index_path():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'readme-generator', 'dependencies.sqlite')
+
+
+def _single_line(value):
+    value = ' '.join((value or '').split())
+    return '' if value.upper() == 'UNKNOWN' else value
+
+
+def metadata_fields(message):
+    """(key, name, version, summary, url, license) from a parsed METADATA / PKG-INFO message."""
+    name = _single_line(message.get('Name'))
+    urls = {}
+    for entry in message.get_all('Project-URL') or ():
+        label, _, url = entry.partition(',')
+        urls.setdefault(_LABEL.sub('', label.lower()), url.strip())
+    url = urls.get('documentation') or urls.get('docs') or _single_line(message.get('Home-page')) \
+        or urls.get('homepage') or urls.get('home') or urls.get('source') or urls.get('repository') or ''
+    license_name = _single_line(message.get('License-Expression'))
+    if not license_name:
+        license_name = _single_line(message.get('License'))
+        if len(license_name) > MAX_LICENSE_LENGTH:
+            license_name = ''
+    if not license_name:
+        classifiers = [classifier.rsplit('::', 1)[-1].strip() for classifier in message.get_all('Classifier') or ()
+                       if classifier.startswith('License ::') and classifier.count('::') > 1]
+        license_name = ', '.join(classifiers)
+    return (canonical_name(name), name, _single_line(message.get('Version')), _single_line(message.get('Summary')),
+            url, license_name)
+
+
+def _parse_metadata(text):
+    from email.parser import HeaderParser
+    return metadata_fields(HeaderParser().parsestr(text))
+
+
+def read_archive_metadata(path):
+    """Metadata fields of a wheel (.dist-info/METADATA) or sdist (PKG-INFO); None if it has none."""
+    if path.endswith('.whl') or path.endswith('.zip'):
+        import zipfile
+        with zipfile.ZipFile(path) as archive:
+            for member in archive.namelist():
+                parts = member.split('/')
+                if (len(parts) == 2 and parts[0].endswith('.dist-info') and parts[1] == 'METADATA') \
+                        or (len(parts) == 2 and parts[1] == 'PKG-INFO'):
+                    return _parse_metadata(archive.read(member).decode('utf-8', 'replace'))
+        return None
+    import tarfile
+    with tarfile.open(path) as archive:
+        for member in archive:
+            parts = member.name.split('/')
+            if len(parts) == 2 and parts[1] == 'PKG-INFO' and member.isfile():
+                return _parse_metadata(archive.extractfile(member).read().decode('utf-8', 'replace'))
+    return None
+
+
+def _archives(mirrors):
+    for mirror in mirrors:
+        for directory, _, names in os.walk(mirror):
+            for name in sorted(names):
+                if name.endswith(ARCHIVE_SUFFIXES):
+                    yield os.path.join(directory, name)
+
+
+class DependencyIndex:
+    """Persistent sqlite index of package metadata keyed by PEP 503 name."""
+
+    def __init__(self, path=None):
+        self.path = path or default_index_path()
+        self.connection = None
+        self.cache = {}
+
+    def connect(self):
+        if self.connection is None:
+            import sqlite3
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            self.connection = sqlite3.connect(self.path)
+            if self.connection.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+                self.connection.executescript("DROP TABLE IF EXISTS packages; DROP TABLE IF EXISTS sources;")
+                self.connection.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+            self.connection.executescript(_SCHEMA)
+        return self.connection
+
+    def close(self):
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM packages").fetchone()[0]
+
+    def build(self, paths=None, mirrors=(), installed=True):
+        """(Re)build the index from installed distributions on paths (default sys.path) and mirror directories.
+
+        Archives already indexed with the same mtime and size are not
+        reopened. Installed distributions win over mirror archives of the
+        same name; among archives, the one that sorts last by path wins.
+        Returns counts of what was read.
+        """
+        start = time.perf_counter()
+        connection = self.connect()
+        known = {row[0]: row[1:] for row in connection.execute("SELECT path, mtime, size FROM sources")}
+        stats = {'archives_read': 0, 'archives_reused': 0, 'installed': 0}
+        seen = []
+        with connection:
+            for path in _archives(mirrors):
+                path = os.path.abspath(path)
+                seen.append(path)
+                status = os.stat(path)
+                if known.get(path) == (status.st_mtime, status.st_size):
+                    stats['archives_reused'] += 1
+                    continue
+                try:
+                    fields = read_archive_metadata(path)
+                except (OSError, ValueError, EOFError) as error:  # zipfile/tarfile errors are among these
+                    print(f"skipping {path}: {error}", file=sys.stderr)
+                    fields = None
+                stats['archives_read'] += 1
+                connection.execute("INSERT OR REPLACE INTO sources VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                                   (path, status.st_mtime, status.st_size) + (fields or (None,) * 6))
+            connection.execute("CREATE TEMP TABLE IF NOT EXISTS seen (path TEXT PRIMARY KEY)")
+            connection.execute("DELETE FROM seen")
+            connection.executemany("INSERT OR IGNORE INTO seen VALUES (?)", ((path,) for path in seen))
+            connection.execute("DELETE FROM sources WHERE path NOT IN (SELECT path FROM seen)")
+
+            connection.execute("DELETE FROM packages")
+            connection.execute("INSERT OR REPLACE INTO packages SELECT key, name, version, summary, url, license "
+                               "FROM sources WHERE key IS NOT NULL AND key != '' ORDER BY path")
+            if installed:
+                from importlib.metadata import distributions
+                for distribution in distributions(path=paths if paths is not None else sys.path):
+                    fields = metadata_fields(distribution.metadata)
+                    if fields[0]:
+                        connection.execute("INSERT OR REPLACE INTO packages VALUES (?, ?, ?, ?, ?, ?)", fields)
+                        stats['installed'] += 1
+        self.cache.clear()
+        stats['packages'] = len(self)
+        stats['seconds'] = time.perf_counter() - start
+        return stats
+
+    def lookup(self, keys):
+        """{key: (name, version, summary, url, license) or None} for PEP 503 names, memoized per process."""
+        missing = [key for key in dict.fromkeys(keys) if key not in self.cache]
+        if missing:
+            connection = self.connect()
+            for start in range(0, len(missing), LOOKUP_BATCH):
+                batch = missing[start:start + LOOKUP_BATCH]
+                for key in batch:
+                    self.cache[key] = None
+                query = ("SELECT key, name, version, summary, url, license FROM packages WHERE key IN "
+                         f"({','.join('?' * len(batch))})")
+                for row in connection.execute(query, batch):
+                    self.cache[row[0]] = row[1:]
+        return {key: self.cache[key] for key in keys}
+
+
+@lru_cache(maxsize=8)
+def open_index(path=None):
+    """The process-wide index at path, built from the installed distributions on first use."""
+    index = DependencyIndex(path)
+    if not os.path.exists(index.path) or not len(index):
+        index.build()
+    return index
+
+
+def enrich_dependencies(dependencies, index):
+    """Normalized dependencies with the ones the index knows turned into Dependency entries."""
+    dependencies = normalize_dependencies(dependencies)
+    requirements = [parse_requirement(dependency) if isinstance(dependency, str) else None
+                    for dependency in dependencies]
+    found = index.lookup([requirement.key for requirement in requirements if requirement is not None])
+    enriched = []
+    for dependency, requirement in zip(dependencies, requirements):
+        info = found.get(requirement.key) if requirement is not None else None
+        if info is None:
+            enriched.append(dependency)
+        else:
+            _, _, summary, url, license_name = info
+            enriched.append(Dependency(requirement.name, dependency[len(requirement.name):], url or None, summary,
+                                       license_name))
+    return enriched
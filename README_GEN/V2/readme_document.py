@@ -0,0 +1,166 @@
+"""Document IR for the default README layout, with HTML and RST emitters.
+
+build_document() turns the answers into a small tree of plain tuples, in the
+same style as the compiled templates of readme_templates:
+
+    document  (title, sections)
+    section   (heading, blocks)
+    block     (PARAGRAPH, text) | (CODE_BLOCK, language, text)
+              | (LINK_LIST, ((label, url), ...)) | (BULLET_LIST, (item, ...))
+
+A BULLET_LIST item is text, or a readme_deps.Dependency (name, rest, url,
+summary, license) tuple for an enriched dependency.
+
+Node text is the raw answer text. Each emitter does its own escaping when it
+writes its format. write_formats() builds the IR once per project and emits
+every format from it. Nothing is cached across projects, so a batch or serve
+worker holds no answer text beyond the project at hand. A new format is an
+iter_<format>(document) generator registered with register_emitter().
+
+Markdown is not emitted from the IR: README.md always comes from the
+template engine (DEFAULT_TEMPLATE or --template), so the Markdown layout is
+defined in one place. The IR holds the same sections for the other formats;
+it follows the default layout only, so a custom template is refused together
+with html or rst output rather than letting the files disagree.
+"""
+import re
+
+from readme_deps import normalize_dependencies
+
+PARAGRAPH, CODE_BLOCK, LINK_LIST, BULLET_LIST = range(4)
+
+_RST_INLINE = re.compile(r"([\\`*_|])")
+_RST_LINE_START = re.compile(r"^([ \t]*)([-+*#]|\d+(?=[.)])|\.\.)", re.M)
+_BLANK_LINES = re.compile(r"\n[ \t]*\n")
+
+
+def _text(value):
+    return value if isinstance(value, str) else ('' if value is None else str(value))
+
+
+def build_document(project_name, project_description, author, license_name, install_command,
+                   usage_instructions, test_command, dependencies=(), homepage_url=None, doc_url=None):
+    """Build the IR of the default README layout."""
+    sections = [('Description', ((PARAGRAPH, _text(project_description)),))]
+    links = tuple((label, url) for label, url in (('Homepage', homepage_url), ('Documentation', doc_url)) if url)
+    if links:
+        sections.append(('Project Links', ((LINK_LIST, links),)))
+    sections += [
+        ('Author', ((PARAGRAPH, _text(author)),)),
+        ('License', ((PARAGRAPH, _text(license_name)),)),
+        ('Installation', ((CODE_BLOCK, 'bash', _text(install_command)),)),
+        ('Usage', ((CODE_BLOCK, 'bash', _text(usage_instructions)),)),
+        ('Testing', ((CODE_BLOCK, 'bash', _text(test_command)),)),
+    ]
+    if dependencies:
+        items = tuple(item if isinstance(item, tuple) else _text(item) for item in dependencies)
+        sections.append(('Dependencies', ((BULLET_LIST, items),)))
+    return _text(project_name), tuple(sections)
+
+
+def readme_document(answers, dependencies, homepage_url=None, doc_url=None):
+    """The IR for one project's answers, as passed to generate_readme()."""
+    return build_document(answers.get('project_name'), answers.get('project_description'), answers.get('author'),
+                          answers.get('license_name'), answers.get('install_command'),
+                          answers.get('usage_instructions'), answers.get('test_command'),
+                          tuple(normalize_dependencies(dependencies)), homepage_url or None, doc_url or None)
+
+
+def _html_item(item):
+    from html import escape
+
+    if isinstance(item, str):
+        return escape(item)
+    name, rest, url, summary, license_name = item
+    text = f'<a href="{escape(url)}">{escape(name)}</a>{escape(rest)}' if url else escape(name + rest)
+    if summary:
+        text += f": {escape(summary)}"
+    return text + (f" ({escape(license_name)})" if license_name else '')
+
+
+def iter_html(document):
+    """Emit the document as a standalone HTML page, yielding string chunks."""
+    from html import escape
+
+    title, sections = document
+    title = escape(title)
+    yield (f'<!DOCTYPE html>\n<html lang="en">\n<head>\n<meta charset="utf-8">\n<title>{title}</title>\n'
+           f'</head>\n<body>\n<h1>{title}</h1>\n')
+    for heading, blocks in sections:
+        yield f"<section>\n<h2>{escape(heading)}</h2>\n"
+        for block in blocks:
+            kind = block[0]
+            if kind == PARAGRAPH:
+                yield ''.join(f"<p>{escape(paragraph)}</p>\n"
+                              for paragraph in _BLANK_LINES.split(block[1].strip()) if paragraph)
+            elif kind == CODE_BLOCK:
+                yield f'<pre><code class="language-{escape(block[1])}">{escape(block[2])}</code></pre>\n'
+            elif kind == LINK_LIST:
+                yield "<ul>\n" + ''.join(f'<li><a href="{escape(url)}">{escape(label)}</a></li>\n'
+                                         for label, url in block[1]) + "</ul>\n"
+            else:
+                yield "<ul>\n" + ''.join(f"<li>{_html_item(item)}</li>\n" for item in block[1]) + "</ul>\n"
+        yield "</section>\n"
+    yield "</body>\n</html>\n"
+
+
+def escape_rst(text):
+    """Backslash-escape reStructuredText inline markup and line-start list/directive markers."""
+    if _RST_INLINE.search(text) is not None:  # sub() has a per-call cost even when nothing matches
+        text = _RST_INLINE.sub(r"\\\1", text)
+    if _RST_LINE_START.search(text) is not None:
+        text = _RST_LINE_START.sub(r"\1\\\2", text)
+    return text
+
+
+def _rst_heading(text, underline):
+    return f"{text}\n{underline * len(text)}\n\n" if text else ''
+
+
+def _rst_item(item):
+    if isinstance(item, str):
+        return escape_rst(item)
+    name, rest, url, summary, license_name = item
+    text = f"`{name} <{url}>`__{escape_rst(rest)}" if url else escape_rst(name + rest)
+    if summary:
+        text += f": {escape_rst(summary)}"
+    return text + (f" ({escape_rst(license_name)})" if license_name else '')
+
+
+def iter_rst(document):
+    """Emit the document as reStructuredText (e.g. for Sphinx), yielding string chunks."""
+    title, sections = document
+    yield _rst_heading(escape_rst(title), '=')
+    for heading, blocks in sections:
+        yield _rst_heading(heading, '-')
+        for block in blocks:
+            kind = block[0]
+            if kind == PARAGRAPH:
+                if block[1].strip():
+                    yield escape_rst(block[1].strip()) + "\n\n"
+            elif kind == CODE_BLOCK:
+                if block[2].strip():
+                    code = ''.join(f"   {line}\n" if line.strip() else "\n" for line in block[2].split("\n"))
+                    yield f".. code-block:: {block[1]}\n\n{code}\n"
+            elif kind == LINK_LIST:
+                yield ''.join(f"- `{label} <{url}>`__\n" for label, url in block[1]) + "\n"
+            else:
+                yield ''.join(f"- {_rst_item(item)}\n" for item in block[1]) + "\n"
+
+
+EMITTERS = {
+    'html': ('.html', iter_html),
+    'rst': ('.rst', iter_rst),
+}
+
+
+def register_emitter(name, extension, emitter):
+    """Add an output format: emitter(document) must yield string chunks."""
+    EMITTERS[name] = (extension, emitter)
+
+
+def emit(document, output_format):
+    """Render the document in one of the registered formats."""
+    if output_format not in EMITTERS:
+        raise ValueError(f"unknown output format {output_format!r}; choose from {', '.join(EMITTERS)}")
+    return ''.join(EMITTERS[output_format][1](document))
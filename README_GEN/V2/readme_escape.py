@@ -0,0 +1,57 @@
+"""Make free-text answers safe to drop into the README markdown.
+
+Prose fields (the description, name, author, license) are escaped so that
+characters like ``*``, ``_`` or ``[`` in pasted text show up as typed instead
+of turning into emphasis or links, and lines starting with ``#``, ``-`` or
+``1.`` don't become headings or lists. Code fields are inserted verbatim
+inside a fence that is one backtick longer than the longest backtick run in
+the field, so pasted text containing a fence cannot close the block early.
+
+Every helper makes a fixed number of linear passes over its input, each done
+in C by str.replace or a precompiled regex, so the cost grows linearly with
+the size of the field. (str.translate with a table of two-character
+replacements looks like the natural single pass, but CPython runs it on a
+slow per-character path that is several times slower than these passes.)
+"""
+import re
+
+PROSE_FIELDS = ('project_name', 'project_description', 'author', 'license_name')
+CODE_FIELDS = ('install_command', 'usage_instructions', 'test_command')
+FENCE_SUFFIX = '_fence'  # context key of a code field's fence: install_command -> install_command_fence
+
+# Inline metacharacters are escaped wherever they appear; the backslash must come first
+_INLINE_ESCAPES = tuple((char, '\\' + char) for char in '\\`*_[]<>|')
+_INLINE_CHARS = re.compile(r"[\\`*_\[\]<>|]")
+# Block markers only mean something at the start of a line (after optional indentation)
+_LINE_START = re.compile(r"^([ \t]*(?:\d+(?=[.)]))?)([#+=.)-])", re.M)
+_BACKTICK_RUN = re.compile(r"`+")
+
+
+def escape_prose(text):
+    """Escape markdown metacharacters so text renders literally."""
+    if _INLINE_CHARS.search(text) is not None:
+        for char, escaped in _INLINE_ESCAPES:
+            if char in text:
+                text = text.replace(char, escaped)
+    if _LINE_START.search(text) is None:  # skip sub()'s per-call template handling when nothing matches
+        return text
+    return _LINE_START.sub(r"\1\\\2", text)
+
+
+def code_fence(text):
+    """Return a backtick fence longer than any backtick run in text (at least three)."""
+    if '`' not in text:
+        return '```'
+    return '`' * max(3, max(map(len, _BACKTICK_RUN.findall(text))) + 1)
+
+
+def sanitize_context(context):
+    """Escape the prose fields of a template context in place and add a fence for each code field."""
+    for field in PROSE_FIELDS:
+        value = context.get(field)
+        if isinstance(value, str):
+            context[field] = escape_prose(value)
+    for field in CODE_FIELDS:
+        value = context.get(field)
+        context[field + FENCE_SUFFIX] = code_fence(value) if isinstance(value, str) else '```'
+    return context
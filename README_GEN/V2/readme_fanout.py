@@ -0,0 +1,97 @@
+"""Concurrent output of many rendered READMEs (batch --writer async).
+
+Writing a README is latency-bound: the open, write, fsync and rename each
+wait on the filesystem, and on a network filesystem that can take
+milliseconds. Written one after another, thousands of output directories
+spend most of a run waiting.
+
+With the async writer a batch worker first renders the READMEs of a chunk,
+staging their files in memory (StagedFiles). write_targets() then writes
+them from a thread pool driven by an asyncio loop, with at most
+``concurrency`` targets in flight. A target is the set of files of one
+project (README.md, README.html, ..., the digest sidecar). Its files are
+written in order, each with atomic_write(), and the first failure stops
+the rest, so a digest is never stored for a README that was not written.
+Each directory is fsynced once, after the last target writing into it is
+done, instead of once per file.
+
+Every target gets its own result (ok or error, bytes and seconds), so an
+unwritable directory fails only its own project. A single target is
+written in the calling thread, without an event loop.
+"""
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from readme_metrics import metrics
+from readme_writer import DEFAULT_BUFFER_SIZE, DEFAULT_WRITE_CONCURRENCY, atomic_write, fsync_directory
+
+
+class StagedFiles:
+    """Collects the files of one target in memory; its write() stands in for atomic_write()."""
+
+    def __init__(self):
+        self.files = []  # (path, data, fsync) in the order they were written
+
+    def write(self, path, chunks, buffer_size=DEFAULT_BUFFER_SIZE, fsync=True):
+        start = time.perf_counter()
+        data = b''.join(chunk.encode('utf-8') if isinstance(chunk, str) else chunk for chunk in chunks)
+        self.files.append((path, data, fsync))
+        return {'path': path, 'bytes_written': len(data), 'write_seconds': time.perf_counter() - start}
+
+
+def _synced_directories(files):
+    return {os.path.dirname(os.path.abspath(path)) for path, _, fsync in files if fsync}
+
+
+def write_target(files, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Write the files of one target in order, leaving the directory fsyncs to the caller; returns its result."""
+    start = time.perf_counter()
+    result = {'path': files[0][0] if files else None, 'ok': True, 'error': None, 'bytes_written': 0}
+    try:
+        for path, data, fsync in files:
+            written = atomic_write(path, [data], buffer_size, fsync=fsync, sync_directory=False)
+            result['bytes_written'] += written['bytes_written']
+    except Exception as error:  # reported for this target; the others are still written
+        result.update(ok=False, error=f"{type(error).__name__}: {error}")
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+async def write_targets_async(targets, concurrency=DEFAULT_WRITE_CONCURRENCY, buffer_size=DEFAULT_BUFFER_SIZE):
+    loop = asyncio.get_running_loop()
+    limit = asyncio.Semaphore(concurrency)
+    pending = {}  # directory -> targets still to be written into it
+    for files in targets:
+        for directory in _synced_directories(files):
+            pending[directory] = pending.get(directory, 0) + 1
+
+    with ThreadPoolExecutor(max_workers=min(concurrency, len(targets)) or 1) as executor:
+        async def bounded(files):
+            async with limit:
+                result = await loop.run_in_executor(executor, write_target, files, buffer_size)
+            for directory in _synced_directories(files):
+                pending[directory] -= 1
+                if not pending[directory]:
+                    metrics.count('directory_fsyncs')
+                    await loop.run_in_executor(executor, fsync_directory, directory)
+            return result
+
+        return await asyncio.gather(*(bounded(files) for files in targets))
+
+
+def write_targets(targets, concurrency=DEFAULT_WRITE_CONCURRENCY, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Write targets (lists of (path, data, fsync) files) with at most concurrency of them in flight.
+
+    Returns one result dict per target, in order: path (its first file), ok,
+    error, bytes_written and seconds (the target's own write latency).
+    """
+    targets = list(targets)
+    if len(targets) > 1 and concurrency > 1:
+        return asyncio.run(write_targets_async(targets, concurrency, buffer_size))
+    results = [write_target(files, buffer_size) for files in targets]
+    for directory in set().union(*map(_synced_directories, targets)):
+        metrics.count('directory_fsyncs')
+        fsync_directory(directory)
+    return results
@@ -1,38 +1,83 @@
-import click
-from rich.console import Console
 import sys
 import os
-from datetime import datetime
-import validators
-
-console = Console()
-
-def get_multiline_input(prompt, allow_empty=False):
-    """Prompt user for multiline input until 'END' is entered."""
-    console.print(f"{prompt} (Type 'END' on a new line to finish input):")
-    lines = []
-    while True:
-        line = input()
-        if line.strip().upper() == 'END':
-            break
-        lines.append(line)
-    input_text = "\n".join(lines)
-    if not input_text.strip() and not allow_empty:
+import time
+from readme_answers import ANSWER_FIELDS, ProjectAnswers
+from readme_deps import normalize_dependencies
+from readme_metrics import metrics
+from readme_escape import CODE_FIELDS, FENCE_SUFFIX, PROSE_FIELDS, code_fence, escape_prose, sanitize_context
+from readme_urls import check_url
+from readme_templates import DEFAULT_TEMPLATE, TEMPLATE_VERSION, iter_render, render_rows
+from readme_writer import DEFAULT_BUFFER_SIZE, atomic_write, read_digest, write_digest
+
+class LazyConsole:
+    """Stand-in for rich's Console that only imports rich when something is printed to a terminal.
+
+    When stdout is not a TTY (pipes, CI logs, batch runs) text is written as
+    plain lines and rich is never imported.
+    """
+
+    def __init__(self):
+        self._console = None
+
+    def print(self, text='', style=None, markup=True):
+        if self._console is None:
+            if sys.stdout.isatty():
+                from rich.console import Console
+                self._console = Console()
+            else:
+                self._console = False
+        if self._console:
+            self._console.print(text, style=style, markup=markup)
+        else:
+            print(text)
+
+console = LazyConsole()
+
+def get_multiline_input(prompt, allow_empty=False, default=None):
+    """Prompt user for multiline input until 'END' (or the end of the input) is entered."""
+    while True:  # a loop rather than recursion, so any number of empty retries is fine
+        console.print(f"{prompt} (Type 'END' on a new line to finish input):")
+        if default:
+            console.print(f"Leave empty to keep: {shorten(default)}", style="dim")
+        lines = []
+        while True:
+            try:
+                line = input()
+            except EOFError:  # piped input that ran out counts as END
+                break
+            if line.strip().upper() == 'END':
+                break
+            lines.append(line)
+        input_text = "\n".join(lines)
+        if not input_text.strip() and default:
+            return default
+        if input_text.strip() or allow_empty:
+            return input_text
         console.print("Input cannot be empty. If you want to leave it empty, press Enter.", style="bold red")
-        return get_multiline_input(prompt, allow_empty)  # Recursively call the function if input is empty
-    return input_text
+
+def shorten(text, width=60):
+    """First line of text, cut to width characters, for showing defaults in prompts."""
+    lines = text.strip().splitlines()
+    first_line = lines[0] if lines else ''
+    if len(lines) > 1 or len(first_line) > width:
+        return first_line[:width - 3] + '...'
+    return first_line
 
 def is_valid_url(url):
     """Check if the given URL is valid."""
-    return validators.url(url)
+    return check_url(url)
 
-def get_valid_url(prompt, default_url=None, allow_empty=False, is_testing=False):
+def get_valid_url(prompt, default_url=None, allow_empty=False, is_testing=False, suggested_url=None):
     """Prompt user for a valid URL."""
     if is_testing:
         return default_url if default_url else None
 
+    if suggested_url:
+        prompt = f"{prompt} [{suggested_url}] "
     while True:
         url = input(prompt).strip() if default_url is None else default_url
+        if not url and suggested_url:
+            url = suggested_url
         if allow_empty and not url:
             return None  # Return None if allow_empty is True and the user leaves the input empty
         if url and is_valid_url(url):
@@ -40,194 +85,319 @@ def get_valid_url(prompt, default_url=None, allow_empty=False, is_testing=False)
         else:
             console.print("Invalid URL. Please enter a valid URL.", style="bold red")
 
-def generate_readme(answers, dependencies, homepage_url=None, doc_url=None):
-    """Customize this function to format and structure your README.md."""
-    readme_content = f"# {answers['project_name']}\n\n" \
-                     f"## Description\n{answers['project_description']}\n\n" \
-                     f"## Project Links\n" \
-                     f"- [Homepage]({homepage_url})\n" \
-                     f"- [Documentation]({doc_url})\n\n" \
-                     f"## Author\n{answers['author']}\n\n" \
-                     f"## License\n{answers['license_name']}\n\n" \
-                     f"## Installation\n```bash\n{answers['install_command']}\n```\n\n" \
-                     f"## Usage\n```bash\n{answers['usage_instructions']}\n```\n\n" \
-                     f"## Testing\n```bash\n{answers['test_command']}\n``"
-
-    # Include Dependencies section only if there are dependencies
-    if dependencies:
-        readme_content += "\n## Dependencies\n" + "\n".join(f"- {dep}" for dep in dependencies)
-
-    return readme_content
-
-def write_readme(answers, dependencies, homepage_url=None, doc_url=None, create_new_readme=False):
-    """Generate README content and write it to a file."""
-    readme_content = generate_readme(answers, dependencies, homepage_url, doc_url)
+def readme_context(answers, dependencies, homepage_url=None, doc_url=None):
+    """Build the mapping of values the README template is rendered with; missing answers render empty."""
+    context = dict.fromkeys(ANSWER_FIELDS, '')
+    context.update(answers)
+    context.update(
+        homepage_url=homepage_url,
+        doc_url=doc_url,
+        project_links=bool(homepage_url or doc_url),  # Project Links section only if there are links
+        dependencies=normalize_dependencies(dependencies),  # Dependencies section only if there are dependencies
+    )
+    return sanitize_context(context)  # escape prose fields, pick fences for code fields
+
+def iter_readme(answers, dependencies, homepage_url=None, doc_url=None, template=None):
+    """Render the README lazily as a stream of text chunks."""
+    return iter_render(template or DEFAULT_TEMPLATE, readme_context(answers, dependencies, homepage_url, doc_url))
+
+def generate_readme(answers, dependencies, homepage_url=None, doc_url=None, template=None):
+    """Render the README as Markdown: the default layout, or a template like the one in readme_templates.py."""
+    with metrics.phase('render'):
+        readme = ''.join(iter_readme(answers, dependencies, homepage_url, doc_url, template))
+    if metrics.enabled:
+        metrics.count('bytes_rendered', len(readme.encode('utf-8')))
+    return readme
+
+def _memoized(function, values, default):
+    # Runs function once per distinct value; shared values (license, author) are common in batches
+    results = {}
+    return [results[value] if value in results else results.setdefault(value, function(value))
+            if isinstance(value, str) else default for value in values]
+
+def readme_columns(records):
+    """Columnar form of readme_context() for a list of ProjectAnswers: one list of values per field."""
+    columns = {field: [getattr(record, field) for record in records] for field in ProjectAnswers.__slots__}
+    columns['homepage_url'] = [url or None for url in columns['project_homepage']]
+    columns['doc_url'] = [url or None for url in columns['project_doc_url']]
+    columns['project_links'] = [bool(homepage_url or doc_url) for homepage_url, doc_url
+                                in zip(columns['homepage_url'], columns['doc_url'])]
+    for field in PROSE_FIELDS:
+        columns[field] = _memoized(escape_prose, columns[field], None)
+    for field in CODE_FIELDS:
+        columns[field + FENCE_SUFFIX] = _memoized(code_fence, columns[field], '```')
+    return columns
+
+def render_many(records, template=None):
+    """Render READMEs for many projects at once; same output as generate_readme() for each record."""
+    records = [record if isinstance(record, ProjectAnswers) else ProjectAnswers.from_mapping(record)
+               for record in records]
+    with metrics.phase('render'):
+        return render_rows(template or DEFAULT_TEMPLATE, readme_columns(records), len(records))
+
+def readme_digest(answers, dependencies, homepage_url=None, doc_url=None, template=None, formats=()):
+    """Hash everything a render depends on: the normalized answers, the template and the output formats."""
+    import hashlib
+    import json
+    normalized = {key: '' if value is None else value for key, value in answers.items()}
+    payload = json.dumps([normalized, list(dependencies or []), homepage_url or '', doc_url or '',
+                          TEMPLATE_VERSION, template or DEFAULT_TEMPLATE] + sorted(set(formats) - {'md'}),
+                         sort_keys=True)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+def write_readme(answers, dependencies, homepage_url=None, doc_url=None, create_new_readme=False,
+                 output_dir='', overwrite=False, quiet=False, template=None, buffer_size=DEFAULT_BUFFER_SIZE,
+                 incremental=False, update=False, formats=(), write=atomic_write):
+    """Render the README and stream it into a file, replacing any old file atomically.
+
+    With incremental=True the render and the write are skipped when the README
+    was last generated from the same inputs. With update=True an existing
+    README.md keeps its hand-written sections and only the generated sections
+    whose inputs changed are rewritten; incremental runs do the same for a
+    README that was last written with update=True. Other formats listed in formats
+    ('html', 'rst') are written next to the README from the same document IR.
+    write replaces atomic_write for the new files, e.g. to stage them for
+    readme_fanout (--update always writes directly). A template only shapes
+    README.md, so it cannot be combined with other formats (ValueError).
+    """
+    if template and set(formats) - {'md'}:
+        raise ValueError("a custom template only applies to README.md; it cannot be combined with other formats")
+    digest = None
+    if (incremental or update) and not create_new_readme:
+        readme_file_path = os.path.join(output_dir, 'README.md')
+        digest = readme_digest(answers, dependencies, homepage_url, doc_url, template, formats)
+        stored_digest = read_digest(readme_file_path)
+        if incremental and stored_digest == digest:
+            metrics.count('files_unchanged')
+            if not quiet:
+                console.print(f"{readme_file_path} is up to date.", style="bold green")
+            return {'path': readme_file_path, 'bytes_written': 0, 'write_seconds': 0.0, 'unchanged': True}
+        overwrite = overwrite or stored_digest is not None  # a README we generated earlier is ours to replace
+        if incremental and not update:
+            from readme_update import sections_path
+            # a README kept up to date with --update may have hand-written sections: splice, never replace it
+            update = os.path.exists(sections_path(readme_file_path))
+
+    if update and not create_new_readme:
+        from readme_update import format_update_stats, update_readme
+        context = readme_context(answers, dependencies, homepage_url, doc_url)
+        with metrics.phase('update'):
+            result = update_readme(readme_file_path, context, template, buffer_size=buffer_size)
+        metrics.count('files_unchanged' if result['unchanged'] else 'files_written')
+        result['formats'] = write_formats(readme_file_path, answers, dependencies, homepage_url, doc_url, formats,
+                                          buffer_size)
+        write_digest(readme_file_path, digest)
+        if not quiet:
+            console.print(format_update_stats(result), style="bold green")
+        return result
 
     if create_new_readme:
-        readme_file_path = f"README_{datetime.now().strftime('%Y%m%d%H%M%S')}.md"
+        readme_file_path = os.path.join(output_dir, f"README_{time.strftime('%Y%m%d%H%M%S')}.md")
     else:
-        readme_file_path = 'README.md'
-        if os.path.exists(readme_file_path):
+        readme_file_path = os.path.join(output_dir, 'README.md')
+        if os.path.exists(readme_file_path) and not overwrite:
             user_input = input("A README.md file already exists. Do you want to (o)verwrite, (c)reate a new one, or (e)xit? ").strip().lower()
             if user_input == 'o':
                 pass  # Overwrite existing README.md
             elif user_input == 'c':
-                readme_file_path = f"README_{datetime.now().strftime('%Y%m%d%H%M%S')}.md"  # Create a new README.md
+                readme_file_path = os.path.join(output_dir, f"README_{time.strftime('%Y%m%d%H%M%S')}.md")  # Create a new README.md
             elif user_input == 'e':
                 console.print("Exiting without generating README.", style="bold red")
-                return
+                metrics.count('files_skipped')
+                return None
             else:
                 console.print("Invalid choice. Exiting without generating README.", style="bold red")
-                return
-
-    with open(readme_file_path, 'w') as readme_file:
-        readme_file.write(readme_content)
-
-    console.print(f"{readme_file_path} generated successfully!", style="bold green")
-
-def get_dependencies():
+                metrics.count('files_skipped')
+                return None
+
+    chunks = metrics.timed(iter_readme(answers, dependencies, homepage_url, doc_url, template), 'render')
+    result = write(readme_file_path, chunks, buffer_size=buffer_size)
+    result['unchanged'] = False
+    if metrics.enabled:
+        # write pulls the chunks as it writes; what it did not spend rendering was I/O
+        metrics.add_time('write', result['write_seconds'] - chunks.seconds)
+        metrics.count('files_written')
+        metrics.count('bytes_rendered', result['bytes_written'])
+    result['formats'] = write_formats(readme_file_path, answers, dependencies, homepage_url, doc_url, formats,
+                                      buffer_size, write)
+    if digest is not None and os.path.basename(readme_file_path) == 'README.md':
+        write_digest(readme_file_path, digest, write)
+
+    if not quiet:
+        console.print(f"{readme_file_path} generated successfully! "
+                      f"({result['bytes_written']} bytes in {result['write_seconds'] * 1000:.1f} ms)", style="bold green")
+    return result
+
+def write_formats(readme_file_path, answers, dependencies, homepage_url=None, doc_url=None, formats=(),
+                  buffer_size=DEFAULT_BUFFER_SIZE, write=atomic_write):
+    """Write the non-Markdown formats next to a README (README.html, README.rst, ...); returns {format: path}."""
+    formats = [output_format for output_format in formats if output_format != 'md']
+    if not formats:
+        return {}
+    from readme_document import EMITTERS, readme_document
+    document = readme_document(answers, dependencies, homepage_url, doc_url)  # built once, emitted per format
+    paths = {}
+    for output_format in formats:
+        extension, emitter = EMITTERS[output_format]
+        paths[output_format] = os.path.splitext(readme_file_path)[0] + extension
+        with metrics.phase('write'):
+            write(paths[output_format], emitter(document), buffer_size=buffer_size)
+        metrics.count('files_written')
+    return paths
+
+def get_dependencies(default=None):
     """Get user input for project dependencies."""
+    prompt = "Enter project dependencies (comma-separated, or 'END' to finish): "
+    if default:
+        prompt = f"Enter project dependencies (comma-separated, or 'END' for none) [{shorten(', '.join(default))}]: "
     while True:
-        dependencies = input("Enter project dependencies (comma-separated, or 'END' to finish): ").strip()
+        dependencies = input(prompt).strip()
         if dependencies.upper() == 'END':
             return []  # Return an empty list if the user enters 'END'
         elif not dependencies:
-            return []  # Return an empty list if the user leaves it empty
+            return list(default or [])  # Keep the scanned dependencies, or none, if the user leaves it empty
         else:
             return dependencies.split(",")
         
-def get_user_input(prompt, allow_empty=False):
+def get_user_input(prompt, allow_empty=False, default=None):
     """Get user input and ensure it is not empty unless specified."""
+    if default:
+        prompt = f"{prompt} [{default}] "
     while True:
-        user_input = input(prompt).strip()
+        user_input = input(prompt).strip() or default or ''
         if user_input or allow_empty:
             return user_input
         else:
             console.print("Input cannot be empty. If you want to leave it empty, press Enter.", style="bold red")
 
 
-def run_tests_function():
-    # Test generate_readme function
-    test_answers = {
-        'project_name': 'README.md Generator',
-        'project_description': 'Certainly! The provided Python script is a command-line tool for generating README.md files for software projects...',
-        'project_homepage': 'https://github.com/smritibangera/README.md-Generator',
-        'project_doc_url': 'https://github.com/smritibangera/README.md-Generator',
-        'author': 'Smriti Bangera',
-        'license_name': 'MIT',
-        'install_command': 'pip install click rich validators',
-        'usage_instructions': 'Certainly! Here are usage instructions for running the provided Python script:...',
-        'test_command': 'python script_name.py --run-tests',
-        'dependencies': ['click', 'rich', 'validators']
-    }
-
-    homepage_url = 'https://github.com/smritibangera/README.md-Generator'
-
-    generated_readme = generate_readme(test_answers, test_answers['dependencies'], homepage_url=homepage_url)
-
-    # Call write_readme to generate the README file
-    write_readme(test_answers, test_answers['dependencies'], homepage_url=homepage_url)
-
-    assert 'README.md Generator' in generated_readme
-    assert 'Certainly! The provided Python script is a command-line tool for generating README.md files for software projects.' in generated_readme
-    assert homepage_url in generated_readme
-
-    console.print("All tests passed successfully!", style="bold green")
-
-def run_additional_tests():
-    # Test empty dependencies
-    test_answers_empty_deps = {
-        'project_name': 'Empty Dependencies Project',
-        'project_description': 'Project with empty dependencies.',
-        'project_homepage': 'https://github.com/testuser/emptydepsproject',
-        'project_doc_url': 'https://emptydepsproject.readthedocs.io/',
-        'author': 'John Doe',
-        'license_name': 'Apache 2.0',
-        'install_command': 'pip install emptydepsproject',
-        'usage_instructions': 'python emptydepsproject.py',
-        'test_command': 'pytest',
-        'dependencies': []
-    }
-
-    generated_readme_empty_deps = generate_readme(test_answers_empty_deps, test_answers_empty_deps['dependencies'])
-    assert 'Empty Dependencies Project' in generated_readme_empty_deps
-
-    if test_answers_empty_deps['dependencies']:
-        assert '## Dependencies\n' in generated_readme_empty_deps  # should include Dependencies section
-        assert '- ' not in generated_readme_empty_deps  # should not include any dependencies
-    else:
-        assert '## Dependencies\n' not in generated_readme_empty_deps  # should not include Dependencies section
-
-    # Test special characters in project description
-    test_answers_special_chars = {
-        'project_name': 'Special Characters Project',
-        'project_description': 'Project with special characters: & < > " \'',
-        'project_homepage': 'https://github.com/testuser/specialcharsproject',
-        'project_doc_url': 'https://specialcharsproject.readthedocs.io/',
-        'author': 'Alice',
-        'license_name': 'MIT',
-        'install_command': 'pip install specialcharsproject',
-        'usage_instructions': 'python specialcharsproject.py',
-        'test_command': 'pytest',
-        'dependencies': ['dep1', 'dep2']
-    }
-
-    generated_readme_special_chars = generate_readme(test_answers_special_chars, test_answers_special_chars['dependencies'])
-    assert 'Special Characters Project' in generated_readme_special_chars
-    assert '&' in generated_readme_special_chars  # Check for the actual ampersand character
-    assert '<' in generated_readme_special_chars  # Check for the actual "<" character
-    assert '>' in generated_readme_special_chars  # Check for the actual ">" character
-    assert '"' in generated_readme_special_chars  # Check for the actual `"` character
-    assert "'" in generated_readme_special_chars  # Check for the actual "'" character
-
-    console.print("Additional tests passed successfully!")
-
-
-
-@click.command()
-@click.option('--run-tests', is_flag=True, help='Run tests')
-@click.option('--create-new-readme', is_flag=True, help='Create a new README.md file')
-def cli(run_tests, create_new_readme):
-    if run_tests:
-        run_tests_function()
-        run_additional_tests()
-    else:
-        main(run_tests, create_new_readme)
-
-def main(run_tests, create_new_readme=False):
-    console.print("ENTER PROJECT INFORMATION:")
-
-    answers = {
-        'project_name': get_user_input("Enter the project name:", allow_empty=True),
-        'project_description': get_multiline_input("Describe your project:", allow_empty=True),
-        'project_homepage': '',
-        'project_doc_url': '',
-        'author': get_user_input("Enter the author's name:", allow_empty=True),
-        'license_name': get_user_input("Enter the license name:", allow_empty=True),
-        'install_command': get_multiline_input("Enter the installation command:", allow_empty=True),
-        'usage_instructions': get_multiline_input("Enter usage instructions:", allow_empty=True),
-        'test_command': get_user_input("Enter the test command:", allow_empty=True),
-        'dependencies': get_dependencies()
-    }
-
-    if not answers['project_name']:
+PROMPTS = (
+    ('project_name', get_user_input, "Enter the project name:"),
+    ('project_description', get_multiline_input, "Describe your project:"),
+    ('author', get_user_input, "Enter the author's name:"),
+    ('license_name', get_user_input, "Enter the license name:"),
+    ('install_command', get_multiline_input, "Enter the installation command:"),
+    ('usage_instructions', get_multiline_input, "Enter usage instructions:"),
+    ('test_command', get_user_input, "Enter the test command:"),
+)
+
+def ask_answers(run_tests, scan_dir=None, known=None, interactive=True):
+    """Prompt for the project information (pre-filled from a scan); returns ProjectAnswers or None to exit.
+
+    Fields set in known (e.g. from --answers) are taken as they are, and only
+    the missing ones are prompted for. With interactive=False nothing is
+    prompted for and missing fields keep their scanned value or stay empty.
+    """
+    known = known or {}
+    found = {}
+    if scan_dir:
+        from readme_scan import scan_project
+        found = scan_project(scan_dir)
+        if interactive:
+            console.print(f"Found {len(found)} fields in {scan_dir}; press Enter to keep them.", style="bold green")
+
+    missing = [field for field in ProjectAnswers.__slots__ if field not in known]
+    if interactive and missing:
+        console.print("ENTER PROJECT INFORMATION:")
+
+    answers = ProjectAnswers.from_mapping(known)
+    for field, ask, prompt in PROMPTS:
+        if field in missing:
+            answers[field] = ask(prompt, allow_empty=True, default=found.get(field)) if interactive \
+                else found.get(field) or ''
+    if 'dependencies' in missing:
+        answers['dependencies'] = get_dependencies(default=found.get('dependencies')) if interactive \
+            else found.get('dependencies')
+
+    if not answers.project_name:
         console.print("Exiting without generating README.", style="bold red")
+        return None
+
+    for field, prompt in (('project_homepage', "Enter the project homepage URL:"),
+                          ('project_doc_url', "Enter the project documentation URL:")):
+        url = answers[field]
+        if field not in known:
+            if interactive and not run_tests:
+                url = get_valid_url(prompt, allow_empty=True, suggested_url=found.get(field))
+            elif not interactive:
+                url = found.get(field)
+        if url and not is_valid_url(url):
+            console.print(f"Ignoring invalid {field} URL: {url}", style="bold red")
+            url = None
+        answers[field] = url
+    return answers
+
+def main(run_tests, create_new_readme=False, template=None, buffer_size=DEFAULT_BUFFER_SIZE, incremental=False,
+         update=False, scan_dir=None, check_links=False, formats=(), answers_path=None, answers_format=None,
+         enrich_deps=False, deps_index=None):
+    write_options = dict(create_new_readme=create_new_readme, template=template, buffer_size=buffer_size,
+                         incremental=incremental, update=update, formats=formats)
+    index = None
+    if enrich_deps:
+        from readme_deps import enrich_dependencies, open_index
+        with metrics.phase('ingest'):
+            index = open_index(deps_index)
+    if answers_path is None:
+        with metrics.phase('ingest'):
+            answers = ask_answers(run_tests, scan_dir)
+            if answers is not None and index is not None:
+                answers['dependencies'] = enrich_dependencies(answers.dependencies, index)
+        if answers is not None:
+            generate_project(answers, check_links=check_links, **write_options)
         return
 
-    if not run_tests:
-        answers['project_homepage'] = get_valid_url("Enter the project homepage URL:", allow_empty=True)
-        answers['project_doc_url'] = get_valid_url("Enter the project documentation URL:", allow_empty=True)
-
-    # Generate and write README
-    write_readme(answers, answers['dependencies'], create_new_readme)
-
+    # Prepared answers: prompt only for missing fields, and only when stdin is a terminal not used for the answers
+    from readme_input import iter_answers
+    interactive = answers_path != '-' and sys.stdin.isatty()
+    for where, known in metrics.timed(iter_answers(answers_path, answers_format), 'ingest'):
+        with metrics.phase('ingest'):
+            answers = ask_answers(run_tests, scan_dir, known=known, interactive=interactive)
+            if answers is not None and index is not None:
+                answers['dependencies'] = enrich_dependencies(answers.dependencies, index)
+        if answers is None:
+            continue
+        output_dir = known.get('output_dir') or ''
+        readme_file_path = os.path.join(output_dir, 'README.md')
+        generated_before = incremental and read_digest(readme_file_path) is not None
+        if not interactive and os.path.exists(readme_file_path) and \
+                not (create_new_readme or update or generated_before):  # there is no one to ask about overwriting
+            console.print(f"{where}: skipped, {readme_file_path} already exists "
+                          "(use --update or --create-new-readme)", style="bold yellow")
+            metrics.count('files_skipped')
+            continue
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+        generate_project(answers, output_dir=output_dir, check_links=check_links, **write_options)
+
+def generate_project(answers, output_dir='', check_links=False, **write_options):
+    """Write the README (and other formats) for one project's answers, then check its links if asked."""
+    result = write_readme(answers, answers.dependencies, homepage_url=answers.project_homepage,
+                          doc_url=answers.project_doc_url, output_dir=output_dir, **write_options)
+    if result and check_links:
+        from readme_links import check_links as check_readme_links, extract_links, print_link_report
+        with open(result['path'], encoding='utf-8') as readme_file:
+            with metrics.phase('links'):
+                report = check_readme_links(extract_links(readme_file.read()))
+        print_link_report(report, console)
+
+    if not result or result['unchanged']:
+        return  # nothing was generated: the user declined, or the README was already up to date
     console.print("README.md generated successfully!")
-    for dependency in answers['dependencies']:
-        console.print(f"- {dependency}", style="bold green")
+    for dependency in answers.dependencies:
+        console.print(f"- {dependency}", style="bold green", markup=False)  # [name](url) is not rich markup
+
+def __getattr__(name):
+    # The click command lives in readme_cli so that importing this module doesn't import click
+    if name == 'cli':
+        from readme_cli import cli
+        return cli
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # ... (rest of the script remains unchanged)
 
 if __name__ == "__main__":
+    sys.modules.setdefault('readme_generater', sys.modules[__name__])  # don't import this file a second time
+    from readme_cli import cli
     cli()
 
 
@@ -0,0 +1,147 @@
+"""Find the projects of a git checkout that changed since a revision (--since).
+
+The changed paths come from the local repository through subprocess, with no
+network access: ``git diff --name-only <rev>`` (committed, staged and
+unstaged changes against rev, or the changes between the two ends of an
+``A..B`` range), plus ``git ls-files --others --exclude-standard`` for new
+files that are not tracked yet.
+
+Each changed path is then mapped to the project it belongs to through a
+ProjectIndex, a trie of project root directories keyed by path component.
+A lookup walks one node per directory level and returns the innermost root
+that contains the path, so the cost of a run depends on the number of
+changed paths and not on the number of files in the repository. Without a
+manifest, project roots are found by walking up from each changed path to
+the nearest directory that has a packaging file. This also only looks at the
+directories of changed paths.
+
+Changes to the files the generator writes itself (README.md, README.html,
+their digest sidecars, ...) do not count, so committing regenerated READMEs
+does not mark their projects as changed again.
+"""
+import os
+import re
+import subprocess
+
+PROJECT_MARKERS = ('pyproject.toml', 'setup.cfg', 'setup.py')  # the files readme_scan reads metadata from
+GIT_TIMEOUT = 60
+
+_GENERATED = re.compile(r"^\.?README(?:_\d{14})?\.(?:md|html|rst)(?:\.digest|\.sections)?$")
+
+
+class GitError(ValueError):
+    """Raised when git is missing, the directory is not a checkout or the revision is unknown."""
+
+
+def _git(repo_dir, *args):
+    try:
+        completed = subprocess.run(('git', '-C', repo_dir) + args, capture_output=True, timeout=GIT_TIMEOUT)
+    except FileNotFoundError:
+        raise GitError("git is not installed") from None
+    except subprocess.TimeoutExpired:
+        raise GitError(f"git {args[0]} took longer than {GIT_TIMEOUT}s") from None
+    if completed.returncode != 0:
+        message = completed.stderr.decode('utf-8', 'replace').strip().splitlines()
+        raise GitError(f"git {args[0]} failed: {message[-1] if message else completed.returncode}")
+    return completed.stdout
+
+
+def _paths(output):
+    # -z output: NUL-separated, repository-relative, '/'-separated and never quoted
+    return [path.decode('utf-8', 'surrogateescape') for path in output.split(b'\0') if path]
+
+
+def is_generated(path):
+    """True for files the generator writes (READMEs and their sidecars), whose changes are ignored."""
+    return _GENERATED.match(path.rsplit('/', 1)[-1]) is not None
+
+
+def changed_paths(since, repo_dir='.'):
+    """Return (top, paths): the checkout's top directory and the paths changed since a revision or range."""
+    top = _git(repo_dir, 'rev-parse', '--show-toplevel').decode('utf-8', 'surrogateescape').strip()
+    paths = _paths(_git(top, 'diff', '--name-only', '--no-renames', '-z', since, '--'))
+    if '..' not in since:  # a bare revision is compared with the working tree, so new files count too
+        paths += _paths(_git(top, 'ls-files', '--others', '--exclude-standard', '-z'))
+    return top, [path for path in dict.fromkeys(paths) if not is_generated(path)]
+
+
+def repo_parts(path, top):
+    """Components of path relative to the checkout top, or None if path lies outside it."""
+    relative = os.path.relpath(os.path.realpath(path), top)
+    if relative == os.curdir:
+        return ()
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        return None
+    return tuple(relative.split(os.sep))
+
+
+class ProjectIndex:
+    """Prefix index from project root directories to the items (e.g. manifest records) rooted there."""
+
+    def __init__(self):
+        self.root = {}
+        self.roots = 0
+
+    def add(self, parts, item):
+        """Register item under the root directory given as a tuple of path components."""
+        node = self.root
+        for part in parts:
+            node = node.setdefault(part, {})
+        if None not in node:
+            node[None] = []
+            self.roots += 1
+        node[None].append(item)
+
+    def lookup(self, path):
+        """Items of the innermost root containing a '/'-separated path ([] if none does)."""
+        node = self.root
+        found = node.get(None, [])
+        for part in path.split('/'):
+            node = node.get(part)
+            if node is None:
+                break
+            found = node.get(None, found)
+        return found
+
+
+def changed_items(index, paths):
+    """The distinct items whose roots contain at least one of paths, in first-changed order."""
+    changed = {}
+    for path in paths:
+        for item in index.lookup(path):
+            changed.setdefault(id(item), item)
+    return list(changed.values())
+
+
+def _parent(path):
+    return path.rsplit('/', 1)[0] if '/' in path else ''
+
+
+def find_project_roots(top, paths, markers=PROJECT_MARKERS):
+    """Directories (relative to top, '' for top itself) of the nearest project root above each changed path.
+
+    Paths with no project root above them are left out. So are paths in
+    projects that were deleted. Every directory is checked at most once.
+    """
+    root_of = {}  # directory -> nearest project root at or above it, or None
+    roots = {}
+    for path in paths:
+        directory = _parent(path)
+        walked = []
+        while directory not in root_of:
+            walked.append(directory)
+            absolute = os.path.join(top, *directory.split('/'))
+            if any(os.path.isfile(os.path.join(absolute, marker)) for marker in markers):
+                root = directory
+                break
+            if not directory:
+                root = None
+                break
+            directory = _parent(directory)
+        else:
+            root = root_of[directory]
+        for seen in walked:
+            root_of[seen] = root
+        if root is not None:
+            roots.setdefault(root, None)
+    return list(roots)
@@ -0,0 +1,172 @@
+"""Prepared answers (--answers FILE|-) in JSON, JSON Lines, YAML or TOML.
+
+A document holds the same keys as a batch manifest record: the answer fields,
+``dependencies`` (a list or a comma-separated string) and an optional
+``output_dir``. One document can also describe several projects, either as a
+list of such mappings or as a mapping with a ``projects`` list (in TOML this
+is a ``[[projects]]`` array of tables).
+
+JSON and TOML are parsed in one go. Small inputs and stdin are read with a
+single buffered read. Files of MMAP_THRESHOLD bytes or more are mapped and
+decoded straight from the mapping, so a 100 MB description is not copied
+twice. JSON Lines (one project per line) and multi-document YAML (documents
+separated by ``---``) are streamed: every project is yielded as soon as its
+document has been read, which lets one process work through a pipe of
+projects without holding them all.
+
+PyYAML is only imported for YAML input. TOML needs Python 3.11+ (tomllib)
+or the tomli package.
+"""
+import json
+import mmap
+import os
+import re
+import sys
+
+from readme_answers import ANSWER_FIELDS
+
+ANSWER_FORMATS = ('json', 'jsonl', 'yaml', 'toml')
+MMAP_THRESHOLD = 1024 * 1024  # smaller files are cheaper to read than to map
+SNIFF_SIZE = 4096
+
+_EXTENSIONS = {'.json': 'json', '.jsonl': 'jsonl', '.ndjson': 'jsonl', '.yaml': 'yaml', '.yml': 'yaml',
+               '.toml': 'toml'}
+_TOML_TABLE = re.compile(rb"\[\[?[A-Za-z0-9_.\"' -]+\]\]?[ \t]*(?:#.*)?$")
+_TOML_KEY = re.compile(rb"[A-Za-z0-9_.\"'-]+[ \t]*=")
+
+
+class AnswersError(ValueError):
+    """Raised when an answers file cannot be read or does not describe projects."""
+
+
+def guess_format(path, head=b''):
+    """Format of an answers file from its extension, or else from its first bytes (head)."""
+    answers_format = _EXTENSIONS.get(os.path.splitext(path)[1].lower())
+    if answers_format:
+        return answers_format
+    for line in head.splitlines():
+        line = line.strip()
+        if not line or line.startswith(b'#'):
+            continue
+        if line.startswith(b'{'):
+            return 'jsonl' if line.endswith(b'}') else 'json'
+        if line.startswith(b'['):
+            return 'toml' if _TOML_TABLE.match(line) else 'json'
+        return 'toml' if _TOML_KEY.match(line) else 'yaml'
+    return 'json'
+
+
+def _text(value):
+    if value is None or isinstance(value, str):
+        return value
+    return str(value)  # YAML/TOML numbers, dates and booleans
+
+
+def normalize_answers(mapping, where):
+    """Check a parsed document is a mapping and turn its scalar values into strings."""
+    if not isinstance(mapping, dict):
+        raise AnswersError(f"{where}: expected a mapping of answers, got {type(mapping).__name__}")
+    answers = {key: _text(value) for key, value in mapping.items() if key != 'dependencies'}
+    dependencies = mapping.get('dependencies')
+    if isinstance(dependencies, (list, tuple)):
+        answers['dependencies'] = [_text(dependency) for dependency in dependencies]
+    elif dependencies is not None:
+        answers['dependencies'] = _text(dependencies)
+    return answers
+
+
+def _projects(document, where):
+    """The project mappings described by one parsed document."""
+    if isinstance(document, dict) and isinstance(document.get('projects'), list) \
+            and not any(field in document for field in ANSWER_FIELDS):
+        document = document['projects']
+    if isinstance(document, list):
+        return [normalize_answers(mapping, f"{where}, project {index}")
+                for index, mapping in enumerate(document, start=1)]
+    return [normalize_answers(document, where)]
+
+
+def _read_text(stream):
+    """The whole input as text: one buffered read, or a decode straight from a mapping for large files."""
+    try:
+        size = os.fstat(stream.fileno()).st_size
+    except (OSError, ValueError):  # pipes and in-memory streams have no usable size
+        size = 0
+    if stream is sys.stdin.buffer or size < MMAP_THRESHOLD:
+        return str(stream.read(), 'utf-8')
+    with mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return str(mapped, 'utf-8')
+
+
+def _load_toml(text):
+    try:
+        import tomllib
+    except ImportError:
+        try:
+            import tomli as tomllib
+        except ImportError:
+            raise AnswersError("TOML answers need Python 3.11+ or the tomli package") from None
+    return tomllib.loads(text)
+
+
+def _import_yaml():
+    try:
+        import yaml
+    except ImportError:
+        raise AnswersError("YAML answers need PyYAML (pip install pyyaml)") from None
+    return yaml
+
+
+def iter_answers(path, answers_format=None):
+    """Yield (where, answers) for every project in an answers file ('-' for stdin).
+
+    where names the document (and project) for messages. answers is a dict
+    holding only the keys the document sets, so callers can tell a missing
+    field from one that was deliberately left empty.
+    """
+    name = 'stdin' if path == '-' else path
+    try:
+        stream = sys.stdin.buffer if path == '-' else open(path, 'rb')
+    except OSError as error:
+        raise AnswersError(f"cannot open {path}: {error.strerror}") from None
+    try:
+        if answers_format is None:
+            answers_format = guess_format('' if path == '-' else path, stream.peek(SNIFF_SIZE)[:SNIFF_SIZE])
+        if answers_format == 'jsonl':
+            for line_number, line in enumerate(stream, start=1):
+                if not line.strip():
+                    continue
+                where = f"{name} line {line_number}"
+                try:
+                    document = json.loads(line)
+                except ValueError as error:
+                    raise AnswersError(f"{where}: invalid JSON: {error}") from None
+                for answers in _projects(document, where):
+                    yield where, answers
+        elif answers_format == 'yaml':
+            yaml = _import_yaml()
+            documents = yaml.load_all(stream, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+            try:
+                for number, document in enumerate(documents, start=1):
+                    if document is not None:
+                        for answers in _projects(document, f"{name} document {number}"):
+                            yield f"{name} document {number}", answers
+            except yaml.YAMLError as error:
+                raise AnswersError(f"{name}: invalid YAML: {error}") from None
+        elif answers_format in ('json', 'toml'):
+            try:
+                text = _read_text(stream)
+                document = json.loads(text) if answers_format == 'json' else _load_toml(text)
+            except UnicodeDecodeError as error:
+                raise AnswersError(f"{name}: not UTF-8: {error}") from None
+            except ValueError as error:  # JSONDecodeError and TOMLDecodeError are both ValueErrors
+                if isinstance(error, AnswersError):
+                    raise
+                raise AnswersError(f"{name}: invalid {answers_format.upper()}: {error}") from None
+            for answers in _projects(document, name):
+                yield name, answers
+        else:
+            raise AnswersError(f"unknown answers format {answers_format!r}; choose from {', '.join(ANSWER_FORMATS)}")
+    finally:
+        if stream is not sys.stdin.buffer:
+            stream.close()
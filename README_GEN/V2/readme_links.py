@@ -0,0 +1,268 @@
+"""Check that the links in a rendered README actually resolve.
+
+Links are extracted from the markdown (code blocks excluded), deduplicated,
+and probed concurrently with asyncio: a HEAD request first, falling back to
+GET for servers that refuse HEAD, redirects followed. Connections are kept
+alive and reused per host, with a cap on how many are open to any one host.
+
+Verdicts are kept in an on-disk cache with a TTL, so a batch over many
+projects does not probe the same URL again and again.
+"""
+import asyncio
+import json
+import math
+import os
+import re
+import ssl
+import time
+from urllib.parse import urljoin, urlsplit
+
+from readme_writer import atomic_write
+
+DEFAULT_TIMEOUT = 10.0
+DEFAULT_PER_HOST = 4
+DEFAULT_CONCURRENCY = 64
+DEFAULT_TTL = 24 * 60 * 60
+MAX_REDIRECTS = 5
+USER_AGENT = 'readme-generator-linkcheck/1.0'
+
+_FENCE = re.compile(r"^(`{3,}|~{3,})", re.M)
+_LINK = re.compile(r"\]\((https?://[^)\s]+)\)|<(https?://[^>\s]+)>|(?<![(<])\b(https?://[^\s<>()\[\]]+)")
+_REDIRECTS = {301, 302, 303, 307, 308}
+_HEAD_REFUSED = {403, 405, 501}  # statuses after which the same URL is retried with GET
+
+
+def extract_links(markdown):
+    """Return the distinct http(s) links of a markdown document, in order of appearance."""
+    links = {}
+    open_fence = None
+    position = 0
+    for fence in _FENCE.finditer(markdown):
+        marker = fence.group(1)
+        if open_fence is None:
+            _collect(markdown[position:fence.start()], links)
+            open_fence = marker
+        elif marker[0] == open_fence[0] and len(marker) >= len(open_fence):
+            open_fence = None
+            position = fence.end()
+    if open_fence is None:
+        _collect(markdown[position:], links)
+    return list(links)
+
+
+def _collect(text, links):
+    for match in _LINK.finditer(text):
+        url = next(group for group in match.groups() if group)
+        links.setdefault(url.rstrip('.,;:'), None)
+
+
+def default_cache_path():
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(cache_home, 'readme-generator', 'link-cache.json')
+
+
+def load_cache(cache_path, ttl):
+    """Cached results that are still fresh, keyed by URL."""
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            entries = json.load(cache_file)
+    except (OSError, ValueError):
+        return {}
+    now = time.time()
+    return {url: entry for url, entry in entries.items()
+            if isinstance(entry, dict) and now - entry.get('checked_at', 0) < ttl}
+
+
+def save_cache(cache_path, entries):
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    atomic_write(cache_path, [json.dumps(entries, separators=(',', ':'))], fsync=False)
+
+
+class ConnectionPool:
+    """Keep-alive connections per (scheme, host, port), at most per_host open to each."""
+
+    def __init__(self, per_host=DEFAULT_PER_HOST):
+        self.per_host = per_host
+        self._idle = {}
+        self._limits = {}
+        self._ssl_context = None
+
+    def limit(self, key):
+        if key not in self._limits:
+            self._limits[key] = asyncio.Semaphore(self.per_host)
+        return self._limits[key]
+
+    async def connect(self, key):
+        """Return (reader, writer, reused) for a host, preferring an idle connection."""
+        idle = self._idle.get(key)
+        while idle:
+            reader, writer = idle.pop()
+            if not writer.is_closing() and not reader.at_eof():
+                return reader, writer, True
+            writer.close()
+        scheme, host, port = key
+        context = None
+        if scheme == 'https':
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            context = self._ssl_context
+        reader, writer = await asyncio.open_connection(host, port, ssl=context)
+        return reader, writer, False
+
+    def release(self, key, reader, writer, reusable):
+        if reusable:
+            self._idle.setdefault(key, []).append((reader, writer))
+        else:
+            writer.close()
+
+    def close(self):
+        for connections in self._idle.values():
+            for _, writer in connections:
+                writer.close()
+        self._idle.clear()
+
+
+async def _read_response_head(reader):
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("connection closed by server")
+    version, status = status_line.decode('latin-1').split(None, 2)[:2]
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b'\n', b''):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return version, int(status), headers
+
+
+async def _request(pool, method, url, timeout):
+    """Send one request and return (status, headers) without reading any body."""
+    parts = urlsplit(url)
+    port = parts.port or (443 if parts.scheme == 'https' else 80)
+    key = (parts.scheme, parts.hostname, port)
+    path = parts.path or '/'
+    if parts.query:
+        path += '?' + parts.query
+    host_header = parts.hostname if parts.port is None else f"{parts.hostname}:{parts.port}"
+    request = (f"{method} {path} HTTP/1.1\r\nHost: {host_header}\r\nUser-Agent: {USER_AGENT}\r\n"
+               f"Accept: */*\r\nConnection: keep-alive\r\n\r\n").encode('latin-1')
+
+    async with pool.limit(key):
+        for attempt in range(2):
+            reader, writer, reused = await asyncio.wait_for(pool.connect(key), timeout)
+            try:
+                writer.write(request)
+                await writer.drain()
+                version, status, headers = await asyncio.wait_for(_read_response_head(reader), timeout)
+            except (ConnectionError, asyncio.IncompleteReadError):
+                writer.close()
+                if reused and attempt == 0:
+                    continue  # the server dropped an idle keep-alive connection; retry on a fresh one
+                raise
+            except BaseException:
+                writer.close()
+                raise
+            # Only a bodiless response leaves the connection ready for the next request
+            reusable = (method == 'HEAD' and version == 'HTTP/1.1'
+                        and headers.get('connection', '').lower() != 'close')
+            pool.release(key, reader, writer, reusable)
+            return status, headers
+    raise ConnectionResetError("connection closed by server")
+
+
+async def check_link(pool, url, timeout=DEFAULT_TIMEOUT):
+    """Probe one URL; returns a result dict with ok, status, error and seconds."""
+    start = time.perf_counter()
+    result = {'url': url, 'ok': False, 'status': None, 'error': None}
+    try:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            status, headers = await _request(pool, 'HEAD', current, timeout)
+            if status in _HEAD_REFUSED:
+                status, headers = await _request(pool, 'GET', current, timeout)
+            if status in _REDIRECTS and headers.get('location'):
+                current = urljoin(current, headers['location'])
+                continue
+            break
+        else:
+            result['error'] = "too many redirects"
+        result['status'] = status
+        result['ok'] = 200 <= status < 300 and result['error'] is None
+    except asyncio.TimeoutError:
+        result['error'] = "timed out"
+    except (OSError, ValueError, ssl.SSLError) as error:
+        result['error'] = f"{type(error).__name__}: {error}"
+    result['seconds'] = time.perf_counter() - start
+    return result
+
+
+async def check_links_async(urls, timeout=DEFAULT_TIMEOUT, per_host=DEFAULT_PER_HOST,
+                            concurrency=DEFAULT_CONCURRENCY):
+    pool = ConnectionPool(per_host)
+    limit = asyncio.Semaphore(concurrency)
+
+    async def bounded(url):
+        async with limit:
+            return await check_link(pool, url, timeout)
+
+    try:
+        return await asyncio.gather(*(bounded(url) for url in urls))
+    finally:
+        pool.close()
+
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a list of numbers (0.0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def check_links(urls, timeout=DEFAULT_TIMEOUT, per_host=DEFAULT_PER_HOST, concurrency=DEFAULT_CONCURRENCY,
+                cache_path=None, ttl=DEFAULT_TTL, use_cache=True):
+    """Check many links and return a report dict.
+
+    The report has a 'results' list (one dict per distinct URL, with 'cached'
+    set for answers that came from the cache) and p50/p99 latency of the
+    probes actually made.
+    """
+    urls = list(dict.fromkeys(urls))
+    cache_path = cache_path or default_cache_path()
+    cache = load_cache(cache_path, ttl) if use_cache else {}
+    to_check = [url for url in urls if url not in cache]
+    fresh = asyncio.run(check_links_async(to_check, timeout, per_host, concurrency)) if to_check else []
+
+    now = time.time()
+    for result in fresh:
+        result['cached'] = False
+        if result['status'] is not None:  # don't remember network failures, they are often transient
+            cache[result['url']] = dict(result, checked_at=now)
+    if use_cache and fresh:
+        save_cache(cache_path, cache)
+
+    by_url = {result['url']: result for result in fresh}
+    results = [by_url.get(url) or dict(cache[url], cached=True) for url in urls]
+    latencies = [result['seconds'] for result in fresh]
+    return {
+        'results': results,
+        'broken': [result for result in results if not result['ok']],
+        'checked': len(fresh),
+        'cached': len(urls) - len(fresh),
+        'p50_seconds': percentile(latencies, 0.50),
+        'p99_seconds': percentile(latencies, 0.99),
+    }
+
+
+def print_link_report(report, console):
+    """Print broken links and latency figures of a link check."""
+    console.print(f"Checked {report['checked']} links ({report['cached']} from cache), "
+                  f"p50 {report['p50_seconds'] * 1000:.0f} ms, p99 {report['p99_seconds'] * 1000:.0f} ms",
+                  style="bold")
+    for result in report['broken']:
+        reason = result['error'] or f"HTTP {result['status']}"
+        console.print(f"  broken link: {result['url']} ({reason})", style="bold red")
+    if not report['broken']:
+        console.print("All links are reachable.", style="bold green")
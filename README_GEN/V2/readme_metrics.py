@@ -0,0 +1,163 @@
+"""Lightweight per-phase timers and counters for a generator run.
+
+The module-level ``metrics`` object is disabled by default. While disabled,
+phase() returns a shared no-op context manager and count() returns at once,
+so instrumented code costs an attribute check per call. --metrics-json turns
+it on and writes the report at the end of the run.
+
+Phases: ingest (prompting, manifest reading, scanning), validate (URL
+checks), render (producing the markdown), write (file I/O), update
+(--update splicing) and links (--check-links). In batch runs the phases of
+all worker processes are added up, so phase seconds can exceed wall time.
+"""
+import sys
+import time
+
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+_NULL_PHASE = _NullPhase()
+
+
+class _Phase:
+    __slots__ = ('metrics', 'name', 'start')
+
+    def __init__(self, metrics, name):
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.metrics.add_time(self.name, time.perf_counter() - self.start)
+        return False
+
+
+class TimedChunks:
+    """Iterator wrapper that books the time spent producing its items to a phase (one call when exhausted)."""
+
+    def __init__(self, metrics, iterable, name):
+        self.metrics = metrics
+        self.iterator = iter(iterable)
+        self.name = name
+        self.seconds = 0.0
+        self.exhausted = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        start = time.perf_counter()
+        calls = 0
+        try:
+            return next(self.iterator)
+        except StopIteration:
+            calls = 0 if self.exhausted else 1
+            self.exhausted = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            self.seconds += elapsed
+            self.metrics.add_time(self.name, elapsed, calls)
+
+
+class Metrics:
+    """Accumulates seconds and call counts per phase plus named counters."""
+
+    def __init__(self):
+        self.enabled = False
+        self.phases = {}
+        self.counters = {}
+        self.started_at = time.perf_counter()
+
+    def enable(self):
+        self.enabled = True
+        self.started_at = time.perf_counter()
+
+    def phase(self, name):
+        """Context manager timing one call of a phase; a no-op while disabled."""
+        return _Phase(self, name) if self.enabled else _NULL_PHASE
+
+    def add_time(self, name, seconds, calls=1):
+        entry = self.phases.get(name)
+        if entry is None:
+            entry = self.phases[name] = [0.0, 0]
+        entry[0] += seconds
+        entry[1] += calls
+
+    def count(self, name, amount=1):
+        if self.enabled:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timed(self, iterable, name):
+        """Wrap an iterable so producing its items is booked to a phase (unchanged while disabled)."""
+        return TimedChunks(self, iterable, name) if self.enabled else iterable
+
+    def drain(self):
+        """Return the collected data as a picklable snapshot and start over (used by batch workers)."""
+        snapshot = {'phases': self.phases, 'counters': self.counters}
+        self.phases = {}
+        self.counters = {}
+        return snapshot
+
+    def merge(self, snapshot):
+        """Add a snapshot from drain() (e.g. from a worker process) to this collector."""
+        for name, (seconds, calls) in snapshot['phases'].items():
+            self.add_time(name, seconds, calls)
+        for name, amount in snapshot['counters'].items():
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self):
+        """The machine-readable report written by --metrics-json."""
+        return {
+            'wall_seconds': time.perf_counter() - self.started_at,
+            'phases': {name: {'seconds': seconds, 'calls': calls}
+                       for name, (seconds, calls) in sorted(self.phases.items())},
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+
+metrics = Metrics()
+
+
+def write_metrics_json(path, report=None):
+    """Write the metrics report as JSON to path ('-' for stdout)."""
+    import json
+    text = json.dumps(report or metrics.report(), indent=2) + "\n"
+    if path == '-':
+        sys.stdout.write(text)
+    else:
+        with open(path, 'w', encoding='utf-8') as report_file:
+            report_file.write(text)
+
+
+def run_instrumented(function, metrics_json=None, profile_path=None):
+    """Call function() with metrics enabled for --metrics-json and/or under cProfile for --profile.
+
+    The metrics report and the pstats dump are written even if function()
+    raises or exits, so a failing run can be diagnosed too.
+    """
+    if metrics_json:
+        metrics.enable()
+    try:
+        if not profile_path:
+            return function()
+        import cProfile
+        profiler = cProfile.Profile()
+        try:
+            return profiler.runcall(function)
+        finally:
+            profiler.dump_stats(profile_path)
+    finally:
+        if metrics_json:
+            write_metrics_json(metrics_json)
@@ -0,0 +1,329 @@
+"""Pre-fill README answers by scanning a project's files.
+
+The project tree is walked with os.scandir, skipping VCS, virtualenv, vendored
+and build directories. Packaging and test configuration files are parsed
+concurrently in a thread pool: setup.py (read with ast, never executed),
+pyproject.toml, setup.cfg, requirements*.txt, LICENSE and test runner configs.
+
+Parsed results are cached on disk keyed by (path, mtime, size), and directory
+listings by (path, mtime), so a repeat scan of an unchanged tree only has to
+stat its directories.
+"""
+import ast
+import configparser
+import hashlib
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+from readme_writer import atomic_write
+
+try:
+    import tomllib
+except ImportError:  # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+CACHE_VERSION = 1
+
+SKIP_DIRS = {
+    '.git', '.hg', '.svn', 'node_modules', 'bower_components', '.venv', 'venv', 'env', '.env',
+    '__pycache__', '.tox', '.nox', '.eggs', '.mypy_cache', '.pytest_cache', '.ruff_cache',
+    'build', 'dist', 'site-packages', 'vendor', 'third_party', '_vendor',
+}
+TEST_CONFIG_FILES = {'pytest.ini', 'tox.ini', 'noxfile.py', 'conftest.py'}
+LICENSE_PREFIXES = ('license', 'licence', 'copying')
+
+# (pattern, license name) checked in order against the start of a LICENSE file
+LICENSE_PATTERNS = [
+    (re.compile(r"MIT License|Permission is hereby granted, free of charge", re.I), 'MIT'),
+    (re.compile(r"Apache License,?\s+Version 2\.0", re.I), 'Apache-2.0'),
+    (re.compile(r"GNU LESSER GENERAL PUBLIC LICENSE", re.I), 'LGPL'),
+    (re.compile(r"GNU AFFERO GENERAL PUBLIC LICENSE", re.I), 'AGPL-3.0'),
+    (re.compile(r"GNU GENERAL PUBLIC LICENSE\s+Version 3", re.I), 'GPL-3.0'),
+    (re.compile(r"GNU GENERAL PUBLIC LICENSE\s+Version 2", re.I), 'GPL-2.0'),
+    (re.compile(r"Mozilla Public License,?\s+(version )?2\.0", re.I), 'MPL-2.0'),
+    (re.compile(r"Redistribution and use in source and binary forms.*?Neither the name", re.I | re.S),
+     'BSD-3-Clause'),
+    (re.compile(r"Redistribution and use in source and binary forms", re.I), 'BSD-2-Clause'),
+    (re.compile(r"This is free and unencumbered software", re.I), 'Unlicense'),
+    (re.compile(r"ISC License", re.I), 'ISC'),
+]
+
+
+def default_cache_path(root):
+    """Per-project scan cache in the user's cache directory."""
+    cache_home = os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache')
+    root_hash = hashlib.sha1(os.path.abspath(root).encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_home, 'readme-generator', f"scan-{root_hash}.json")
+
+
+def load_cache(cache_path):
+    try:
+        with open(cache_path, encoding='utf-8') as cache_file:
+            cache = json.load(cache_file)
+    except (OSError, ValueError):
+        cache = None
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        cache = {'version': CACHE_VERSION, 'dirs': {}, 'files': {}}
+    return cache
+
+
+def save_cache(cache_path, cache):
+    if not cache.pop('dirty', False):
+        return  # nothing changed since it was loaded
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    atomic_write(cache_path, [json.dumps(cache, separators=(',', ':'))], fsync=False)
+
+
+def is_candidate(name):
+    """Whether a file name is one the scanner knows how to parse."""
+    lower = name.lower()
+    return (name in ('setup.py', 'pyproject.toml', 'setup.cfg') or name in TEST_CONFIG_FILES
+            or (lower.startswith('requirements') and lower.endswith('.txt'))
+            or lower.startswith(LICENSE_PREFIXES))
+
+
+def _list_directory(path):
+    """Return (subdirectories, candidate file names) of one directory."""
+    subdirs, candidates = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in SKIP_DIRS and not entry.name.endswith('.egg-info'):
+                    subdirs.append(entry.name)
+            elif entry.name == 'pyvenv.cfg':
+                return [], []  # a virtualenv that is not named like one
+            elif entry.is_file() and is_candidate(entry.name):
+                candidates.append(entry.name)
+    return subdirs, candidates
+
+
+def walk_candidates(root, cache):
+    """Yield the paths of parseable files under root, using cached listings of unchanged directories."""
+    dir_cache = cache['dirs']
+    stack = [root]
+    while stack:
+        path = stack.pop()
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            continue
+        cached = dir_cache.get(path)
+        if cached and cached[0] == mtime:
+            subdirs, candidates = cached[1], cached[2]
+        else:
+            try:
+                subdirs, candidates = _list_directory(path)
+            except OSError:
+                continue
+            dir_cache[path] = [mtime, subdirs, candidates]
+            cache['dirty'] = True
+        for name in candidates:
+            yield os.path.join(path, name)
+        stack.extend(os.path.join(path, name) for name in reversed(subdirs))
+
+
+def _read_text(path, limit=None):
+    with open(path, encoding='utf-8', errors='replace') as source:
+        return source.read(limit) if limit else source.read()
+
+
+def _author_name(value):
+    """'Jane Doe <jane@example.com>' -> 'Jane Doe'."""
+    return value.split('<', 1)[0].strip() if isinstance(value, str) else ''
+
+
+def parse_pyproject(path):
+    if tomllib is None:
+        return {}
+    with open(path, 'rb') as source:
+        try:
+            data = tomllib.load(source)
+        except tomllib.TOMLDecodeError:
+            return {}
+    result = {'kind': 'package'}
+    project = data.get('project') or {}
+    poetry = (data.get('tool') or {}).get('poetry') or {}
+    result['project_name'] = project.get('name') or poetry.get('name') or ''
+    result['project_description'] = project.get('description') or poetry.get('description') or ''
+    authors = project.get('authors') or []
+    if authors and isinstance(authors[0], dict):
+        result['author'] = authors[0].get('name', '')
+    elif poetry.get('authors'):
+        result['author'] = _author_name(poetry['authors'][0])
+    license_value = project.get('license') or poetry.get('license') or ''
+    if isinstance(license_value, dict):
+        license_value = license_value.get('text', '')
+    result['license_name'] = license_value
+    urls = {key.lower(): value for key, value in (project.get('urls') or {}).items()}
+    result['project_homepage'] = urls.get('homepage') or poetry.get('homepage') or ''
+    result['project_doc_url'] = urls.get('documentation') or poetry.get('documentation') or ''
+    dependencies = list(project.get('dependencies') or [])
+    dependencies += [name for name in (poetry.get('dependencies') or {}) if name.lower() != 'python']
+    result['dependencies'] = dependencies
+    if ((data.get('tool') or {}).get('pytest') or {}).get('ini_options') is not None:
+        result['test_command'] = 'pytest'
+    return result
+
+
+def parse_setup_cfg(path):
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read_string(_read_text(path))
+    except configparser.Error:
+        return {}
+    result = {}
+    if parser.has_section('metadata'):
+        metadata = parser['metadata']
+        result.update(kind='package', project_name=metadata.get('name', ''),
+                      project_description=metadata.get('description', ''),
+                      author=metadata.get('author', ''), license_name=metadata.get('license', ''),
+                      project_homepage=metadata.get('url', ''))
+    if parser.has_option('options', 'install_requires'):
+        requires = parser.get('options', 'install_requires')
+        result['dependencies'] = [line.strip() for line in requires.splitlines() if line.strip()]
+    if parser.has_section('tool:pytest'):
+        result['test_command'] = 'pytest'
+    return result
+
+
+def _literal(node):
+    try:
+        return ast.literal_eval(node)
+    except (ValueError, SyntaxError, TypeError):
+        return None
+
+
+def parse_setup_py(path):
+    try:
+        tree = ast.parse(_read_text(path), filename=path)
+    except SyntaxError:
+        return {}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Call) and getattr(node.func, 'id', getattr(node.func, 'attr', None)) == 'setup':
+            keywords = {keyword.arg: _literal(keyword.value) for keyword in node.keywords if keyword.arg}
+            result = {'kind': 'package'}
+            for answer_key, setup_key in (('project_name', 'name'), ('project_description', 'description'),
+                                          ('author', 'author'), ('license_name', 'license'),
+                                          ('project_homepage', 'url')):
+                if isinstance(keywords.get(setup_key), str):
+                    result[answer_key] = keywords[setup_key]
+            requires = keywords.get('install_requires')
+            if isinstance(requires, (list, tuple)):
+                result['dependencies'] = [dep for dep in requires if isinstance(dep, str)]
+            return result
+    return {}
+
+
+def parse_requirements(path):
+    dependencies = []
+    for line in _read_text(path).splitlines():
+        line = line.split(' #', 1)[0].strip()
+        if line and not line.startswith(('#', '-')):
+            dependencies.append(line)
+    return {'kind': 'requirements', 'dependencies': dependencies}
+
+
+def parse_license(path):
+    head = _read_text(path, 4096)
+    for pattern, name in LICENSE_PATTERNS:
+        if pattern.search(head):
+            return {'license_name': name}
+    return {}
+
+
+def parse_test_config(path):
+    name = os.path.basename(path)
+    if name == 'noxfile.py':
+        return {'test_command': 'nox'}
+    if name == 'tox.ini':
+        text = _read_text(path)
+        if '[tox]' in text or '[testenv' in text:
+            return {'test_command': 'tox'}
+    return {'test_command': 'pytest'}
+
+
+def parse_file(path):
+    """Parse one candidate file into a partial answers dict."""
+    name = os.path.basename(path)
+    lower = name.lower()
+    try:
+        if name == 'pyproject.toml':
+            return parse_pyproject(path)
+        if name == 'setup.cfg':
+            return parse_setup_cfg(path)
+        if name == 'setup.py':
+            return parse_setup_py(path)
+        if name in TEST_CONFIG_FILES:
+            return parse_test_config(path)
+        if lower.startswith('requirements'):
+            return parse_requirements(path)
+        return parse_license(path)
+    except (OSError, ValueError):
+        return {}
+
+
+def _parse_cached(path, cache):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    cached = cache['files'].get(path)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    result = parse_file(path)
+    cache['files'][path] = [stat.st_mtime_ns, stat.st_size, result]
+    cache['dirty'] = True
+    return result
+
+
+# Files earlier in this list win when several at the same depth set the same field
+_PRECEDENCE = ('pyproject.toml', 'setup.cfg', 'setup.py')
+
+
+def _rank(root, path):
+    depth = os.path.relpath(path, root).count(os.sep)
+    name = os.path.basename(path)
+    return depth, _PRECEDENCE.index(name) if name in _PRECEDENCE else len(_PRECEDENCE), path
+
+
+def merge_results(root, parsed):
+    """Combine per-file results into one answers dict; files nearer the root win."""
+    answers = {}
+    dependencies, dependency_depth = [], None
+    has_package = has_requirements = False
+    for path, result in sorted(parsed, key=lambda item: _rank(root, item[0])):
+        depth = os.path.relpath(path, root).count(os.sep)
+        for key, value in result.items():
+            if key in ('kind', 'dependencies') or not value:
+                continue
+            answers.setdefault(key, value)
+        if result.get('dependencies') and dependency_depth in (None, depth):
+            dependency_depth = depth
+            dependencies.extend(dep for dep in result['dependencies'] if dep not in dependencies)
+        if depth == 0:
+            has_package = has_package or result.get('kind') == 'package'
+            has_requirements = has_requirements or os.path.basename(path) == 'requirements.txt'
+    answers['dependencies'] = dependencies
+    if has_package:
+        answers['install_command'] = 'pip install .'
+    elif has_requirements:
+        answers['install_command'] = 'pip install -r requirements.txt'
+    return answers
+
+
+def scan_project(root, jobs=None, cache_path=None, use_cache=True):
+    """Scan a project tree and return a partial answers dict (only the fields it found)."""
+    root = os.path.abspath(root)
+    cache_path = cache_path or default_cache_path(root)
+    cache = load_cache(cache_path) if use_cache else {'version': CACHE_VERSION, 'dirs': {}, 'files': {}}
+    candidates = list(walk_candidates(root, cache))
+    with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as executor:
+        results = list(executor.map(lambda path: _parse_cached(path, cache), candidates))
+    if use_cache:
+        save_cache(cache_path, cache)
+    return merge_results(root, [(path, result) for path, result in zip(candidates, results) if result])
@@ -0,0 +1,247 @@
+"""Long-running render server: keeps generate_readme() and its templates warm.
+
+Speaks a minimal HTTP/1.1 (with keep-alive) on a localhost TCP port or a Unix
+socket:
+
+    POST /render   JSON answers payload (same keys as a batch manifest record)
+                   -> 200 text/markdown (?format=html or ?format=rst for the
+                   other formats of readme_document; a "template" key in the
+                   payload applies to Markdown only)
+    GET  /metrics  request counts and latency percentiles as JSON
+    GET  /health   "ok"
+
+Requests are parsed on an asyncio event loop and rendered in a pool of worker
+processes that import the generator and compile the default template once at
+start-up. SIGINT/SIGTERM stop accepting connections, let in-flight requests
+finish, and then shut the pool down.
+"""
+import asyncio
+import json
+import os
+import signal
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qs
+
+from readme_links import percentile
+
+MAX_BODY_SIZE = 64 * 1024 * 1024
+DEFAULT_RENDER_TIMEOUT = 30.0
+SHUTDOWN_GRACE = 10.0
+LATENCY_SAMPLES = 10000  # latency percentiles are computed over the most recent requests
+
+CONTENT_TYPES = {'md': 'text/markdown', 'html': 'text/html', 'rst': 'text/x-rst'}
+_REASONS = {200: 'OK', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed',
+            413: 'Payload Too Large', 500: 'Internal Server Error', 504: 'Gateway Timeout'}
+
+
+def warm_worker():
+    """Pool initializer: import the renderer and compile the default template before the first request."""
+    from readme_generater import generate_readme
+    from readme_templates import DEFAULT_TEMPLATE, compile_template
+    compile_template(DEFAULT_TEMPLATE)
+    generate_readme({'project_name': ''}, [], template='{project_name}')
+
+
+def render_payload(payload, output_format='md'):
+    """Render one JSON payload in the given format. Raises ValueError for payloads that cannot be rendered."""
+    from readme_batch import record_to_answers
+    from readme_generater import generate_readme
+    from readme_templates import TemplateError
+    from readme_urls import check_url
+
+    if not isinstance(payload, dict):
+        raise ValueError("payload must be a JSON object")
+    answers = record_to_answers(payload)
+    for field in ('project_homepage', 'project_doc_url'):
+        if answers[field] and not check_url(answers[field]):
+            raise ValueError(f"invalid {field} URL: {answers[field]}")
+    if output_format != 'md':
+        if payload.get('template'):
+            raise ValueError(f"a template only applies to Markdown, not format={output_format}")
+        from readme_document import emit, readme_document
+        return emit(readme_document(answers, answers['dependencies'], answers['project_homepage'],
+                                    answers['project_doc_url']), output_format)
+    try:
+        return generate_readme(answers, answers['dependencies'], answers['project_homepage'] or None,
+                               answers['project_doc_url'] or None, payload.get('template'))
+    except TemplateError as error:
+        raise ValueError(str(error)) from None
+
+
+class RenderServer:
+    """Asyncio HTTP front end that hands rendering to a process pool."""
+
+    def __init__(self, workers=None, render_timeout=DEFAULT_RENDER_TIMEOUT):
+        self.workers = workers or os.cpu_count() or 1
+        self.render_timeout = render_timeout
+        self.pool = None
+        self.server = None
+        self.closing = False
+        self.started_at = time.time()
+        self.requests = 0
+        self.errors = 0
+        self.latencies = deque(maxlen=LATENCY_SAMPLES)
+        self.render_seconds = 0.0
+        self._connections = set()
+        self._idle = set()
+
+    async def start(self, host='127.0.0.1', port=8000, socket_path=None):
+        self.pool = ProcessPoolExecutor(max_workers=self.workers, initializer=warm_worker)
+        # Start every worker now so the first requests don't pay for process start-up
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(loop.run_in_executor(self.pool, warm_worker) for _ in range(self.workers)))
+        if socket_path:
+            if os.path.exists(socket_path):
+                os.unlink(socket_path)
+            self.server = await asyncio.start_unix_server(self._handle_connection, path=socket_path)
+        else:
+            self.server = await asyncio.start_server(self._handle_connection, host, port)
+        return self.server
+
+    async def shutdown(self, grace=SHUTDOWN_GRACE):
+        """Stop accepting, let in-flight requests finish, then stop the workers."""
+        self.closing = True
+        if self.server is not None:
+            self.server.close()
+        for writer in list(self._idle):
+            writer.close()  # idle keep-alive connections have nothing left to finish
+        if self._connections:
+            await asyncio.wait(list(self._connections), timeout=grace)
+        if self.pool is not None:
+            self.pool.shutdown(wait=True, cancel_futures=True)
+
+    def metrics(self):
+        """Request counters and latency percentiles (served at /metrics)."""
+        latencies = list(self.latencies)
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'uptime_seconds': time.time() - self.started_at,
+            'render_seconds_total': self.render_seconds,
+            'latency_p50_ms': percentile(latencies, 0.50) * 1000,
+            'latency_p99_ms': percentile(latencies, 0.99) * 1000,
+            'workers': self.workers,
+        }
+
+    async def _handle_connection(self, reader, writer):
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            while not self.closing:
+                self._idle.add(writer)
+                try:
+                    request_line = await reader.readline()
+                finally:
+                    self._idle.discard(writer)
+                if not request_line:
+                    break
+                keep_alive = await self._handle_request(request_line, reader, writer)
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            writer.close()
+
+    async def _handle_request(self, request_line, reader, writer):
+        start = time.perf_counter()
+        try:
+            method, path, version = request_line.decode('latin-1').split()
+        except ValueError:
+            await self._respond(writer, 400, b"malformed request line\n", keep_alive=False)
+            return False
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b'\r\n', b'\n', b''):
+                break
+            name, _, value = line.decode('latin-1').partition(':')
+            headers[name.strip().lower()] = value.strip()
+        keep_alive = (version == 'HTTP/1.1' and headers.get('connection', '').lower() != 'close'
+                      and not self.closing)
+
+        try:
+            length = int(headers.get('content-length') or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            await self._respond(writer, 400, b"invalid Content-Length\n", keep_alive=False)
+            return False
+        if length > MAX_BODY_SIZE:
+            await self._respond(writer, 413, b"request body too large\n", keep_alive=False)
+            return False
+        body = await reader.readexactly(length) if length else b''
+
+        path, _, query = path.partition('?')
+        status, content_type, payload = await self._dispatch(method, path, query, body)
+        await self._respond(writer, status, payload, content_type, keep_alive)
+        self.requests += 1
+        if status >= 400:
+            self.errors += 1
+        self.latencies.append(time.perf_counter() - start)
+        return keep_alive
+
+    async def _dispatch(self, method, path, query, body):
+        if path == '/health':
+            return 200, 'text/plain', b"ok\n"
+        if path == '/metrics':
+            return 200, 'application/json', json.dumps(self.metrics()).encode('utf-8')
+        if path != '/render':
+            return 404, 'text/plain', b"not found\n"
+        if method != 'POST':
+            return 405, 'text/plain', b"use POST\n"
+        output_format = parse_qs(query).get('format', ['md'])[-1]
+        if output_format not in CONTENT_TYPES:
+            return 400, 'text/plain', f"unknown format {output_format!r}\n".encode('utf-8')
+        try:
+            payload = json.loads(body or b'null')
+        except ValueError as error:
+            return 400, 'text/plain', f"invalid JSON: {error}\n".encode('utf-8')
+
+        loop = asyncio.get_running_loop()
+        render_start = time.perf_counter()
+        render = loop.run_in_executor(self.pool, render_payload, payload, output_format)
+        try:
+            rendered = await asyncio.wait_for(render, self.render_timeout)
+        except ValueError as error:
+            return 400, 'text/plain', f"{error}\n".encode('utf-8')
+        except asyncio.TimeoutError:
+            return 504, 'text/plain', b"render timed out\n"
+        except Exception as error:
+            return 500, 'text/plain', f"{type(error).__name__}: {error}\n".encode('utf-8')
+        finally:
+            self.render_seconds += time.perf_counter() - render_start
+        return 200, f"{CONTENT_TYPES[output_format]}; charset=utf-8", rendered.encode('utf-8')
+
+    async def _respond(self, writer, status, body, content_type='text/plain', keep_alive=True):
+        head = (f"HTTP/1.1 {status} {_REASONS.get(status, '')}\r\n"
+                f"Content-Type: {content_type}\r\nContent-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+
+async def serve(host='127.0.0.1', port=8000, socket_path=None, workers=None, render_timeout=DEFAULT_RENDER_TIMEOUT,
+                ready=None):
+    """Run a RenderServer until SIGINT/SIGTERM, then shut it down gracefully."""
+    server = RenderServer(workers, render_timeout)
+    await server.start(host, port, socket_path)
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stop.set)
+        except (NotImplementedError, RuntimeError):  # not available on this platform/thread
+            pass
+    if ready is not None:
+        ready(server)
+    try:
+        await stop.wait()
+    finally:
+        await server.shutdown()
+        if socket_path and os.path.exists(socket_path):
+            os.unlink(socket_path)
+    return server.metrics()
@@ -0,0 +1,243 @@
+"""Small section-template engine used by generate_readme().
+
+Templates are plain markdown with a few placeholder forms:
+
+    {field}              the value of ``field``
+    {?field}...{/field}  rendered only when ``field`` is truthy
+    {#field}...{/field}  rendered once per item of the list ``field``;
+                         ``{.}`` inside it is the current item
+
+Anything else, including braces that do not wrap a field name, is copied
+literally. A template is compiled once into an ordered list of segments and
+the compiled form is cached, so rendering is a walk over that list that ends
+in a single ``''.join`` (or, with iter_render(), a stream of chunks that is
+never joined at all).
+"""
+import re
+from functools import lru_cache
+
+LITERAL, FIELD, OPTIONAL, REPEAT = range(4)
+
+# Bump whenever rendering changes output for the same template, so incremental
+# runs know that READMEs generated by an older version are stale.
+TEMPLATE_VERSION = 4
+
+_TAG = re.compile(r"\{([?#/]?)([A-Za-z_][A-Za-z0-9_]*|\.)\}")
+# A section starts at a '## ' heading line, possibly wrapped in opening section tags;
+# closing tags at the start of that line still belong to the previous section
+_SECTION_START = re.compile(r"^(?:\{/[A-Za-z_][A-Za-z0-9_]*\})*(?=(?:\{[?#][A-Za-z_][A-Za-z0-9_]*\})*## )", re.M)
+_OPENING_TAGS = re.compile(r"^(?:\{[?#][A-Za-z_][A-Za-z0-9_]*\})*")
+
+DEFAULT_TEMPLATE = """\
+# {project_name}
+
+## Description
+{project_description}
+
+{?project_links}## Project Links
+{?homepage_url}- [Homepage]({homepage_url})
+{/homepage_url}{?doc_url}- [Documentation]({doc_url})
+{/doc_url}
+{/project_links}## Author
+{author}
+
+## License
+{license_name}
+
+## Installation
+{install_command_fence}bash
+{install_command}
+{install_command_fence}
+
+## Usage
+{usage_instructions_fence}bash
+{usage_instructions}
+{usage_instructions_fence}
+
+## Testing
+{test_command_fence}bash
+{test_command}
+{test_command_fence}
+
+{?dependencies}## Dependencies
+{#dependencies}- {.}
+{/dependencies}
+{/dependencies}"""
+
+
+class TemplateError(ValueError):
+    """Raised when a template cannot be compiled or rendered."""
+
+
+@lru_cache(maxsize=32)
+def compile_template(source):
+    """Compile template source into a tuple of (kind, value[, children]) segments."""
+    root = []
+    stack = [(None, root)]  # (open section name, segment list being filled)
+    position = 0
+    for match in _TAG.finditer(source):
+        if match.start() > position:
+            stack[-1][1].append((LITERAL, source[position:match.start()]))
+        position = match.end()
+        sigil, name = match.groups()
+        if sigil == '':
+            stack[-1][1].append((FIELD, name))
+        elif sigil == '/':
+            if stack[-1][0] != name:
+                raise TemplateError(f"unexpected {{/{name}}} at offset {match.start()}")
+            stack.pop()
+        elif name == '.':
+            raise TemplateError(f"'{{{sigil}.}}' is not a valid section at offset {match.start()}")
+        else:
+            children = []
+            stack[-1][1].append((OPTIONAL if sigil == '?' else REPEAT, name, children))
+            stack.append((name, children))
+    if len(stack) > 1:
+        raise TemplateError(f"section {{{stack[-1][0]}}} is never closed")
+    if position < len(source):
+        root.append((LITERAL, source[position:]))
+    return _freeze(root)
+
+
+def _freeze(segments):
+    """Turn the nested segment lists into tuples so a cached template cannot be mutated."""
+    return tuple(
+        (segment[0], segment[1], _freeze(segment[2])) if len(segment) == 3 else segment
+        for segment in segments
+    )
+
+
+def _lookup(context, name, item):
+    if name == '.':
+        return item
+    try:
+        return context[name]
+    except KeyError:
+        raise TemplateError(f"template field '{name}' is not defined") from None
+
+
+def _iter_segments(segments, context, item=None):
+    for segment in segments:
+        kind = segment[0]
+        if kind == LITERAL:
+            yield segment[1]
+        elif kind == FIELD:
+            value = _lookup(context, segment[1], item)
+            yield value if isinstance(value, str) else ('' if value is None else str(value))
+        elif kind == OPTIONAL:
+            if _lookup(context, segment[1], item):
+                yield from _iter_segments(segment[2], context, item)
+        else:
+            for value in _lookup(context, segment[1], item) or ():
+                yield from _iter_segments(segment[2], context, value)
+
+
+def iter_render(template, context):
+    """Render a template lazily, yielding string chunks in document order."""
+    return _iter_segments(compile_template(template), context)
+
+
+def render(template, context):
+    """Render template source with the given context mapping."""
+    return ''.join(iter_render(template, context))
+
+
+def _bind(segments, columns):
+    """Swap each field name for its column, so rows are rendered without name lookups."""
+    bound = []
+    for segment in segments:
+        if segment[0] == LITERAL:
+            bound.append(segment)
+            continue
+        column = None if segment[1] == '.' else columns[segment[1]]
+        if len(segment) == 3:
+            bound.append((segment[0], column, _bind(segment[2], columns)))
+        else:
+            bound.append((segment[0], column))
+    return tuple(bound)
+
+
+def _emit_row(segments, row, item, append):
+    for segment in segments:
+        kind = segment[0]
+        if kind == LITERAL:
+            append(segment[1])
+            continue
+        column = segment[1]
+        value = item if column is None else column[row]
+        if kind == FIELD:
+            append(value if isinstance(value, str) else ('' if value is None else str(value)))
+        elif kind == OPTIONAL:
+            if value:
+                _emit_row(segment[2], row, item, append)
+        else:
+            for value in value or ():
+                _emit_row(segment[2], row, value, append)
+
+
+def render_rows(template, columns, count):
+    """Render a template once per row of columnar data; returns a list of strings.
+
+    columns maps each field the template reads to a sequence holding that
+    field's value for every row. The compiled literals are shared by all rows
+    and one parts list is reused, so a row costs little more than its join.
+    """
+    missing = [field for field in template_fields(template) if field not in columns]
+    if missing:
+        raise TemplateError(f"template field '{missing[0]}' is not defined")
+    segments = _bind(compile_template(template), columns)
+    rendered = []
+    parts = []
+    append = parts.append
+    for row in range(count):
+        _emit_row(segments, row, None, append)
+        rendered.append(''.join(parts))
+        parts.clear()
+    return rendered
+
+
+@lru_cache(maxsize=32)
+def template_sections(template):
+    """Split a template into (heading, source) pairs, one per '## ' section.
+
+    The text before the first heading comes first with a heading of None. The
+    heading is the template for the heading text, without the '## '. Raises
+    TemplateError if a {?field}/{#field} block spans more than one section.
+    """
+    starts = [match.end() for match in _SECTION_START.finditer(template)]
+    if not starts or starts[0] != 0:
+        starts.insert(0, 0)
+    sections = []
+    for start, end in zip(starts, starts[1:] + [len(template)]):
+        source = template[start:end]
+        try:
+            compile_template(source)
+        except TemplateError as error:
+            raise TemplateError(f"cannot split template into sections: {error}") from None
+        heading = None
+        heading_start = _OPENING_TAGS.match(source).end()
+        if source.startswith('## ', heading_start):
+            heading = source[heading_start + 3:].split("\n", 1)[0]
+        sections.append((heading, source))
+    return tuple(sections)
+
+
+def template_fields(template):
+    """Names of all context fields a template reads, in first-use order."""
+    fields = []
+
+    def collect(segments):
+        for segment in segments:
+            if segment[0] != LITERAL and segment[1] != '.' and segment[1] not in fields:
+                fields.append(segment[1])
+            if len(segment) == 3:
+                collect(segment[2])
+
+    collect(compile_template(template))
+    return fields
+
+
+def load_template(path):
+    """Read a user-supplied template file."""
+    with open(path, encoding='utf-8') as template_file:
+        return template_file.read()
@@ -0,0 +1,193 @@
+"""Section-level in-place update of an existing README.
+
+The README is scanned once (through mmap for large files) to index the byte
+offsets of its '## ' headings. Each section of the template is then matched
+to the file by heading text. Only sections whose inputs changed since the
+last update are re-rendered, and everything else in the file, including
+hand-written sections, is copied through byte for byte.
+
+The input digest of every generated section is kept in a sidecar
+``.README.md.sections`` file, so the next update can tell which sections
+need rendering without rendering them.
+"""
+import hashlib
+import json
+import mmap
+import os
+import re
+
+from readme_templates import DEFAULT_TEMPLATE, TEMPLATE_VERSION, render, template_fields, template_sections
+from readme_writer import DEFAULT_BUFFER_SIZE, atomic_write
+
+MMAP_THRESHOLD = 1024 * 1024  # smaller files are cheaper to read than to map
+COPY_CHUNK_SIZE = 1024 * 1024
+
+# A fence opener/closer or a level-2 heading at the start of a line
+_LINE_MARKER = re.compile(rb"^(?:(`{3,}|~{3,})|## ([^\r\n]*))", re.M)
+_TEMPLATE_FIELD = re.compile(r"\{[A-Za-z_.]")
+
+
+def sections_path(readme_file_path):
+    """Sidecar file holding the input digest of each generated section."""
+    directory, name = os.path.split(readme_file_path)
+    return os.path.join(directory, f".{name}.sections")
+
+
+def index_headings(data):
+    """Return [(heading, start, end), ...] for every '## ' section in data.
+
+    The first entry is the text before the first heading, with a heading of
+    None. Headings inside fenced code blocks are not section boundaries.
+    """
+    index = []
+    open_fence = None
+    for match in _LINE_MARKER.finditer(data):
+        fence, heading = match.groups()
+        if fence is not None:
+            if open_fence is None:
+                open_fence = fence
+            elif fence[:1] == open_fence[:1] and len(fence) >= len(open_fence):
+                open_fence = None
+        elif open_fence is None:
+            index.append((heading.decode('utf-8', 'replace').strip(), match.start()))
+    starts = [(None, 0)] + index
+    ends = [start for _, start in index] + [len(data)]
+    return [(heading, start, end) for (heading, start), end in zip(starts, ends)]
+
+
+def section_digest(source, context):
+    """Hash a section's template source together with the values it reads."""
+    values = [context.get(field) for field in template_fields(source)]
+    payload = json.dumps([TEMPLATE_VERSION, source, values], default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _load_section_digests(readme_file_path):
+    try:
+        with open(sections_path(readme_file_path), encoding='utf-8') as sections_file:
+            return json.load(sections_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _store_section_digests(readme_file_path, digests):
+    atomic_write(sections_path(readme_file_path), [json.dumps(digests, sort_keys=True)], fsync=False)
+
+
+def _copy_region(data, start, end):
+    for offset in range(start, end, COPY_CHUNK_SIZE):
+        yield data[offset:min(offset + COPY_CHUNK_SIZE, end)]
+
+
+def _open_data(readme_file):
+    size = os.fstat(readme_file.fileno()).st_size
+    if size >= MMAP_THRESHOLD:
+        return mmap.mmap(readme_file.fileno(), 0, access=mmap.ACCESS_READ)
+    return readme_file.read()
+
+
+def update_readme(readme_file_path, context, template=None, buffer_size=DEFAULT_BUFFER_SIZE):
+    """Re-render the changed generated sections of a README and splice them in.
+
+    Returns a dict of diff statistics. A README that does not exist yet is
+    written in full.
+    """
+    template = template or DEFAULT_TEMPLATE
+    stats = {'path': readme_file_path, 'sections_changed': [], 'sections_added': [], 'sections_removed': [],
+             'sections_unchanged': 0, 'sections_rendered': 0, 'bytes_added': 0, 'bytes_removed': 0,
+             'bytes_written': 0, 'write_seconds': 0.0, 'unchanged': True}
+    sections = template_sections(template)
+    digests = {heading or '': section_digest(source, context) for heading, source in sections}
+
+    if not os.path.exists(readme_file_path):
+        rendered = [render(source, context) for _, source in sections]
+        stats.update(atomic_write(readme_file_path, rendered, buffer_size=buffer_size))
+        stats['sections_added'] = [heading or '' for (heading, _), text in zip(sections, rendered) if text]
+        stats['sections_rendered'] = len(sections)
+        stats['bytes_added'] = stats['bytes_written']
+        stats['unchanged'] = False
+        _store_section_digests(readme_file_path, digests)
+        return stats
+
+    stored_digests = _load_section_digests(readme_file_path)
+    with open(readme_file_path, 'rb') as readme_file:
+        data = _open_data(readme_file)
+        try:
+            regions = index_headings(data)
+            region_by_heading = {}
+            for position, (heading, _, _) in enumerate(regions):
+                region_by_heading.setdefault(heading, position)
+
+            replacements = {}  # region position -> new bytes (b'' removes the section)
+            insertions = {}  # region position -> new sections to insert after it
+            previous_position = 0
+            for heading, source in sections:
+                key = heading or ''
+                if heading is not None and _TEMPLATE_FIELD.search(heading):
+                    heading = render(heading, context).strip()
+                position = region_by_heading.get(heading)
+                if stored_digests.get(key) == digests[key]:
+                    # Inputs unchanged: keep the section as it is, or keep it out if it was removed
+                    stats['sections_unchanged'] += 1
+                    if position is not None:
+                        previous_position = position
+                    continue
+
+                text = render(source, context).encode('utf-8')
+                stats['sections_rendered'] += 1
+                if position is None:
+                    if text:
+                        insertions.setdefault(previous_position, []).append(text)
+                        stats['sections_added'].append(key)
+                        stats['bytes_added'] += len(text)
+                    continue
+                previous_position = position
+                _, start, end = regions[position]
+                if data[start:end] == text:
+                    stats['sections_unchanged'] += 1
+                    continue
+                replacements[position] = text
+                stats['sections_removed' if not text else 'sections_changed'].append(key)
+                stats['bytes_removed'] += end - start
+                stats['bytes_added'] += len(text)
+
+            if replacements or insertions:
+                stats.update(atomic_write(readme_file_path, _spliced(data, regions, replacements, insertions),
+                                          buffer_size=buffer_size))
+                stats['unchanged'] = False
+        finally:
+            if isinstance(data, mmap.mmap):
+                data.close()
+
+    if stored_digests != digests:
+        _store_section_digests(readme_file_path, digests)
+    return stats
+
+
+def _spliced(data, regions, replacements, insertions):
+    """Yield the new file contents: old regions, replaced regions and inserted sections in order."""
+    for position, (_, start, end) in enumerate(regions):
+        if position in replacements:
+            yield replacements[position]
+            last_byte = replacements[position][-1:]
+        else:
+            yield from _copy_region(data, start, end)
+            last_byte = data[end - 1:end]
+        for text in insertions.get(position, ()):
+            if last_byte not in (b'', b'\n'):
+                yield b'\n'
+            yield text
+            last_byte = text[-1:]
+
+
+def format_update_stats(stats):
+    """One-line summary of an update for the console."""
+    if stats['unchanged']:
+        return f"{stats['path']} is up to date ({stats['sections_unchanged']} sections unchanged)."
+    parts = []
+    for label in ('changed', 'added', 'removed'):
+        if stats[f'sections_{label}']:
+            names = ', '.join(name or '(title)' for name in stats[f'sections_{label}'])
+            parts.append(f"{label}: {names}")
+    return (f"{stats['path']} updated ({'; '.join(parts)}; {stats['sections_unchanged']} unchanged; "
+            f"+{stats['bytes_added']}/-{stats['bytes_removed']} bytes).")
@@ -0,0 +1,76 @@
+"""URL validation with a cheap prefilter and a bounded cache of verdicts.
+
+validators.url() is comparatively slow, and in batch runs the same homepage
+and documentation URLs come up again and again. check_url() first looks the
+URL up in an LRU cache of verdicts. On a miss, the prefilter (a precompiled
+regex and urllib.parse) rejects obvious garbage, and only URLs that pass it
+are handed to validators. Either way the verdict is cached.
+"""
+import re
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from readme_metrics import metrics
+
+URL_CACHE_SIZE = 65536
+
+# Anything validators could accept has a scheme, '://', a host and no whitespace
+_PLAUSIBLE_URL = re.compile(r"[A-Za-z][A-Za-z0-9+.-]*://[^\s/?#]+\S*\Z")
+
+_prefilter_rejects = 0
+
+
+def prefilter(url):
+    """Return False for strings that cannot be a valid URL, True if validators should decide."""
+    if not _PLAUSIBLE_URL.match(url):
+        return False
+    try:
+        return bool(urlsplit(url).hostname)
+    except ValueError:  # e.g. an unbalanced '[' in the host
+        return False
+
+
+@lru_cache(maxsize=URL_CACHE_SIZE)
+def _cached_verdict(url):
+    global _prefilter_rejects
+    if not prefilter(url):
+        _prefilter_rejects += 1
+        return False
+    import validators  # imported on first use; it is slow to import and often not needed at all
+    return bool(validators.url(url))
+
+
+def check_url(url):
+    """Check if the given URL is valid."""
+    if not isinstance(url, str):
+        return False
+    if metrics.enabled:
+        metrics.count('validation_calls')
+        with metrics.phase('validate'):
+            return _cached_verdict(url)
+    return _cached_verdict(url)
+
+
+def validate_urls(urls):
+    """Validate many URLs at once; returns a dict mapping each distinct URL to its verdict."""
+    return {url: check_url(url) for url in dict.fromkeys(urls)}
+
+
+def cache_stats():
+    """Hit/miss counters of the verdict cache plus how many misses the prefilter rejected."""
+    info = _cached_verdict.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'hit_rate': info.hits / lookups if lookups else 0.0,
+        'cached': info.currsize,
+        'prefilter_rejects': _prefilter_rejects,
+    }
+
+
+def clear_cache():
+    """Forget all cached verdicts and reset the counters."""
+    global _prefilter_rejects
+    _cached_verdict.cache_clear()
+    _prefilter_rejects = 0
@@ -0,0 +1,107 @@
+"""Crash-safe README output.
+
+Chunks are streamed through a buffered binary writer into a temporary file
+next to the target, fsynced, and moved over the target with os.replace(), so
+readers only ever see the old README or the complete new one.
+
+Incremental runs keep a digest of a README's inputs in a small sidecar file
+(``.README.md.digest``) so an unchanged project costs a read and a compare.
+"""
+import os
+import time
+
+DEFAULT_BUFFER_SIZE = 64 * 1024
+DEFAULT_WRITE_CONCURRENCY = 16  # targets in flight per process with batch --writer async
+
+_new_file_mode = None
+
+
+def _default_mode():
+    """Permission bits a plain open(path, 'w') would have used under the current umask."""
+    global _new_file_mode
+    if _new_file_mode is None:
+        umask = os.umask(0)
+        os.umask(umask)
+        _new_file_mode = 0o666 & ~umask
+    return _new_file_mode
+
+
+def _create_temp_file(directory, name):
+    """Create and open a new, uniquely named temp file next to the target (like tempfile.mkstemp)."""
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{os.urandom(6).hex()}.tmp")
+        try:
+            return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), temp_path
+        except FileExistsError:
+            continue
+
+
+def fsync_directory(directory):
+    """Persist the rename itself; not every platform allows opening a directory."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write(path, chunks, buffer_size=DEFAULT_BUFFER_SIZE, fsync=True, sync_directory=True):
+    """Write an iterable of str (or bytes-like) chunks to path atomically.
+
+    Returns a dict with the number of bytes written and the seconds spent
+    writing (including fsync and the final rename). With sync_directory=False
+    the caller fsyncs the directory itself, e.g. once for several files.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    start = time.perf_counter()
+    fd, temp_path = _create_temp_file(directory, os.path.basename(path))
+    bytes_written = 0
+    try:
+        with os.fdopen(fd, 'wb', buffering=buffer_size) as temp_file:
+            for chunk in chunks:
+                bytes_written += temp_file.write(chunk.encode('utf-8') if isinstance(chunk, str) else chunk)
+            temp_file.flush()
+            if fsync:
+                os.fsync(temp_file.fileno())
+        try:
+            mode = os.stat(path).st_mode & 0o7777  # keep the permissions of the README we replace
+        except FileNotFoundError:
+            mode = _default_mode()
+        os.chmod(temp_path, mode)
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    if fsync and sync_directory:
+        fsync_directory(directory)
+    return {'path': path, 'bytes_written': bytes_written, 'write_seconds': time.perf_counter() - start}
+
+
+def digest_path(readme_file_path):
+    """Sidecar file that records the digest of the inputs a README was rendered from."""
+    directory, name = os.path.split(readme_file_path)
+    return os.path.join(directory, f".{name}.digest")
+
+
+def read_digest(readme_file_path):
+    """Return the stored digest for a README, or None if there is none (or no README)."""
+    if not os.path.exists(readme_file_path):
+        return None
+    try:
+        with open(digest_path(readme_file_path), encoding='ascii') as digest_file:
+            return digest_file.read().strip()
+    except (OSError, UnicodeDecodeError):
+        return None
+
+
+def write_digest(readme_file_path, digest, write=atomic_write):
+    """Store the digest next to the README it describes."""
+    write(digest_path(readme_file_path), [digest + "\n"], fsync=False)
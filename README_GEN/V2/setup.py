@@ -1,17 +1,41 @@
-from setuptools import setup, find_packages
+from setuptools import setup
 
 setup(
     name='readme_generator',
     version='0.1',
-    packages=find_packages(),
+    py_modules=[
+        'readme_answers',
+        'readme_batch',
+        'readme_cli',
+        'readme_deps',
+        'readme_document',
+        'readme_escape',
+        'readme_fanout',
+        'readme_generater',
+        'readme_git',
+        'readme_input',
+        'readme_links',
+        'readme_metrics',
+        'readme_scan',
+        'readme_serve',
+        'readme_templates',
+        'readme_update',
+        'readme_urls',
+        'readme_writer',
+    ],
     install_requires=[
         'click',
         'rich',
         'validators',
     ],
+    extras_require={
+        'test': ['pytest'],
+        'yaml': ['pyyaml'],
+        'toml': ['tomli; python_version < "3.11"'],
+    },
     entry_points={
         'console_scripts': [
-            'readme-generator = V2:cli',
+            'readme-generator = readme_cli:cli',
         ],
     },
 )
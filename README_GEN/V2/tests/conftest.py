@@ -0,0 +1,80 @@
+"""Shared fixtures for the README generator tests."""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def isolated_cwd(tmp_path, monkeypatch):
+    """Run every test in its own directory, so nothing writes a README.md or a cache into the checkout."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path / 'cache'))
+    return tmp_path
+
+
+@pytest.fixture
+def answers():
+    return {
+        'project_name': 'README.md Generator',
+        'project_description': 'Certainly! The provided Python script is a command-line tool for generating '
+                               'README.md files for software projects...',
+        'project_homepage': 'https://github.com/smritibangera/README.md-Generator',
+        'project_doc_url': 'https://github.com/smritibangera/README.md-Generator',
+        'author': 'Smriti Bangera',
+        'license_name': 'MIT',
+        'install_command': 'pip install click rich validators',
+        'usage_instructions': 'Certainly! Here are usage instructions for running the provided Python script:...',
+        'test_command': 'python script_name.py --run-tests',
+        'dependencies': ['click', 'rich', 'validators'],
+    }
+
+
+@pytest.fixture
+def empty_deps_answers():
+    return {
+        'project_name': 'Empty Dependencies Project',
+        'project_description': 'Project with empty dependencies.',
+        'project_homepage': 'https://github.com/testuser/emptydepsproject',
+        'project_doc_url': 'https://emptydepsproject.readthedocs.io/',
+        'author': 'John Doe',
+        'license_name': 'Apache 2.0',
+        'install_command': 'pip install emptydepsproject',
+        'usage_instructions': 'python emptydepsproject.py',
+        'test_command': 'pytest',
+        'dependencies': [],
+    }
+
+
+@pytest.fixture
+def special_answers():
+    return {
+        'project_name': 'Special Characters Project',
+        'project_description': 'Project with special characters: & < > " \'',
+        'project_homepage': 'https://github.com/testuser/specialcharsproject',
+        'project_doc_url': 'https://specialcharsproject.readthedocs.io/',
+        'author': 'Alice',
+        'license_name': 'MIT',
+        'install_command': 'pip install specialcharsproject',
+        'usage_instructions': 'python specialcharsproject.py',
+        'test_command': 'pytest',
+        'dependencies': ['dep1', 'dep2'],
+    }
+
+
+@pytest.fixture
+def pasted_answers(special_answers):
+    """Answers with markdown pasted into the prose and a fenced block pasted into a code field."""
+    return dict(special_answers, project_description="# Not a heading\n1. *not* a [list](x)",
+                usage_instructions="Run:\n```bash\nspecial --all\n```")
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    """--metrics-json enables the shared collector; turn it off again after each test."""
+    from readme_metrics import metrics
+    yield
+    metrics.enabled = False
+    metrics.drain()
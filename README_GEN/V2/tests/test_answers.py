@@ -0,0 +1,17 @@
+import pytest
+
+from readme_answers import ProjectAnswers
+
+
+def test_from_mapping_interns_and_splits(special_answers):
+    record = ProjectAnswers.from_mapping(special_answers)
+    bare = ProjectAnswers(project_name='Bare', license_name='MIT', dependencies=['dep1'])
+    assert record['license_name'] is bare.license_name
+    assert record.dependencies == ('dep1', 'dep2')
+    assert ProjectAnswers.from_mapping({'dependencies': 'a,b'}).dependencies == ('a', 'b')
+
+
+def test_misspelt_field_is_rejected(special_answers):
+    record = ProjectAnswers.from_mapping(special_answers)
+    with pytest.raises(KeyError):
+        record['project_hompage'] = 'https://example.com'
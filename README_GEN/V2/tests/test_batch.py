@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from readme_batch import iter_manifest, run_batch
+
+
+@pytest.fixture
+def manifest_path(special_answers, tmp_path):
+    path = tmp_path / 'projects.jsonl'
+    path.write_text(json.dumps(dict(special_answers, output_dir=str(tmp_path / 'a'))) + "\n"
+                    + json.dumps({'project_name': '', 'output_dir': str(tmp_path / 'b')}) + "\n"
+                    + "not json\n")
+    return str(path)
+
+
+def test_iter_manifest_reports_bad_lines(manifest_path):
+    records = list(iter_manifest(manifest_path))
+    assert [line_number for line_number, _ in records] == [1, 2, 3]
+    assert '_error' in records[2][1]
+
+
+def test_iter_manifest_reads_csv(tmp_path):
+    path = tmp_path / 'projects.csv'
+    path.write_text("project_name,output_dir,dependencies\nfirst,out,\"click,rich\"\n")
+    assert list(iter_manifest(str(path))) == [(2, {'project_name': 'first', 'output_dir': 'out',
+                                                   'dependencies': 'click,rich'})]
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_run_batch(manifest_path, tmp_path, jobs):
+    summary = run_batch(manifest_path, jobs=jobs)
+    assert (summary['written'], summary['skipped'], summary['failed']) == (1, 1, 1)
+    assert 'Special Characters Project' in (tmp_path / 'a' / 'README.md').read_text()
+
+
+def test_existing_readme_is_skipped_unless_overwritten(manifest_path):
+    run_batch(manifest_path, jobs=1)
+    assert run_batch(manifest_path, jobs=1)['skipped'] == 2
+    assert run_batch(manifest_path, jobs=1, overwrite=True)['written'] == 1
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_a_record_that_cannot_be_converted_fails_alone(special_answers, tmp_path, monkeypatch, jobs):
+    import readme_batch
+
+    def record_to_answers(record):
+        if record['project_name'] == 'bad':
+            raise TypeError("unusable field")
+        return original(record)
+
+    original = readme_batch.record_to_answers
+    monkeypatch.setattr(readme_batch, 'record_to_answers', record_to_answers)
+    path = tmp_path / 'projects.jsonl'
+    path.write_text(json.dumps({'project_name': 'bad', 'output_dir': str(tmp_path / 'bad')}) + "\n"
+                    + json.dumps(dict(special_answers, output_dir=str(tmp_path / 'good'))) + "\n")
+    summary = run_batch(str(path), jobs=jobs)
+    assert (summary['written'], summary['failed']) == (1, 1)
+    assert summary['errors'] == [('failed', 1, "TypeError: unusable field")]
+
+
+def test_skipped_records_do_not_crowd_out_failures(tmp_path, monkeypatch):
+    monkeypatch.setattr('readme_batch.MAX_REPORTED_ERRORS', 2)
+    path = tmp_path / 'projects.jsonl'
+    records = [{'project_name': f"P{index}", 'output_dir': str(tmp_path / 'out')} for index in range(4)]
+    path.write_text("".join(json.dumps(record) + "\n" for record in records) + "not json\n")
+    summary = run_batch(str(path), jobs=1)
+    assert (summary['written'], summary['skipped'], summary['failed']) == (1, 3, 1)
+    assert [(status, line_number) for status, line_number, _ in summary['errors']] \
+        == [('skipped', 2), ('skipped', 3), ('failed', 5)]
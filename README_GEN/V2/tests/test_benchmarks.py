@@ -0,0 +1,34 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+import run_benchmarks  # noqa: E402
+
+
+def results(seconds, peak_bytes, size='small'):
+    return {'size': size, 'results': {'case': {'seconds': seconds, 'peak_bytes': peak_bytes}}}
+
+
+def test_compare_flags_regressions_over_the_threshold():
+    baseline = results(1.0, 1000)
+    assert run_benchmarks.compare(results(1.1, 1000), baseline, threshold=0.2) == []
+    assert len(run_benchmarks.compare(results(1.3, 1000), baseline, threshold=0.2)) == 1
+    assert len(run_benchmarks.compare(results(1.0, 1500), baseline, threshold=0.2, memory_threshold=0.6)) == 0
+    assert len(run_benchmarks.compare(results(1.3, 1500), baseline, threshold=0.2)) == 2
+
+
+def test_compare_rejects_a_baseline_of_another_size():
+    with pytest.raises(ValueError):
+        run_benchmarks.compare(results(1.0, 1000), results(1.0, 1000, size='large'), threshold=0.2)
+
+
+def test_save_then_compare_baseline(monkeypatch, tmp_path):
+    monkeypatch.setitem(run_benchmarks.SIZES, 'small', {'records': 20, 'description_bytes': 4096, 'files': 2})
+    baseline_path = str(tmp_path / 'baseline.json')
+    arguments = ['--case', 'ingest_manifest', '--case', 'write_readme_files', '--repeat', '1',
+                 '--baseline', baseline_path]
+    assert run_benchmarks.main(arguments + ['--save-baseline']) == 0
+    assert run_benchmarks.main(arguments + ['--threshold', '1000']) == 0
@@ -0,0 +1,56 @@
+import json
+
+import pytest
+
+from click.testing import CliRunner
+
+from readme_cli import cli
+
+
+def test_batch_command_writes_metrics(special_answers, tmp_path):
+    manifest = tmp_path / 'projects.jsonl'
+    manifest.write_text(json.dumps(dict(special_answers, output_dir=str(tmp_path / 'a'))) + "\n")
+    metrics_path = tmp_path / 'metrics.json'
+    result = CliRunner().invoke(cli, ['batch', '--manifest', str(manifest), '--jobs', '1',
+                                      '--metrics-json', str(metrics_path)])
+    assert result.exit_code == 0, result.output
+    assert 'Written: 1' in result.output
+    report = json.loads(metrics_path.read_text())
+    assert report['counters']['records_written'] == 1 and 'render' in report['phases']
+
+
+def test_batch_command_fails_on_bad_records(tmp_path):
+    manifest = tmp_path / 'projects.jsonl'
+    manifest.write_text("not json\n")
+    assert CliRunner().invoke(cli, ['batch', '--manifest', str(manifest), '--jobs', '1']).exit_code == 1
+
+
+def test_run_tests_outside_a_source_checkout(tmp_path, monkeypatch):
+    monkeypatch.setattr('readme_cli.TESTS_DIR', str(tmp_path / 'missing'))
+    result = CliRunner().invoke(cli, ['--run-tests'])
+    assert result.exit_code == 1
+    assert 'only works from a source checkout' in result.output
+
+
+@pytest.mark.parametrize('option', ['--jobs', '--chunk-size', '--write-concurrency', '--buffer-size'])
+def test_batch_rejects_counts_below_one(tmp_path, option):
+    manifest = tmp_path / 'projects.jsonl'
+    manifest.write_text(json.dumps({'project_name': 'P', 'output_dir': str(tmp_path / 'p')}) + "\n")
+    result = CliRunner().invoke(cli, ['batch', '--manifest', str(manifest), option, '0'])
+    assert result.exit_code == 2
+    assert not (tmp_path / 'p').exists()
+
+
+@pytest.mark.parametrize('command', [[], ['batch', '--manifest', 'projects.jsonl']])
+def test_template_cannot_be_combined_with_other_formats(tmp_path, command):
+    (tmp_path / 'projects.jsonl').write_text(json.dumps({'project_name': 'P', 'output_dir': 'p'}) + "\n")
+    (tmp_path / 'template.md').write_text("# {project_name}\n")
+    result = CliRunner().invoke(cli, command + ['--template', 'template.md', '--output-format', 'html'])
+    assert result.exit_code == 2 and '--template' in result.output
+    assert not (tmp_path / 'p').exists()
+
+
+def test_buffer_size_below_one_is_rejected(tmp_path):
+    result = CliRunner().invoke(cli, ['--buffer-size', '0'], input="P\n")
+    assert result.exit_code == 2 and '--buffer-size' in result.output
+    assert not (tmp_path / 'README.md').exists()
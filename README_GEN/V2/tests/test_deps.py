@@ -0,0 +1,163 @@
+import io
+import json
+import os
+import tarfile
+import zipfile
+
+import pytest
+
+from readme_answers import ProjectAnswers
+from readme_batch import run_batch
+from readme_deps import (Dependency, DependencyIndex, canonical_name, enrich_dependencies, normalize_dependencies,
+                         open_index)
+from readme_document import emit, readme_document
+from readme_generater import generate_readme
+
+METADATA = """Metadata-Version: 2.1
+Name: {name}
+Version: {version}
+Summary: {summary}
+Home-page: https://example.com/{name}
+Project-URL: Documentation, https://{name}.readthedocs.io/
+License: MIT
+"""
+
+
+def write_wheel(directory, name, version, summary):
+    path = os.path.join(directory, f"{name}-{version}-py3-none-any.whl")
+    with zipfile.ZipFile(path, 'w') as archive:
+        archive.writestr(f"{name}-{version}.dist-info/METADATA",
+                         METADATA.format(name=name, version=version, summary=summary))
+    return path
+
+
+def write_sdist(directory, name, version, summary):
+    path = os.path.join(directory, f"{name}-{version}.tar.gz")
+    data = METADATA.format(name=name, version=version, summary=summary).replace('License: MIT\n', '') \
+        + "Classifier: License :: OSI Approved :: BSD License\n"
+    data = data.encode('utf-8')
+    with tarfile.open(path, 'w:gz') as archive:
+        member = tarfile.TarInfo(f"{name}-{version}/PKG-INFO")
+        member.size = len(data)
+        archive.addfile(member, io.BytesIO(data))
+    return path
+
+
+@pytest.fixture
+def mirror(tmp_path):
+    mirror = tmp_path / 'mirror'
+    mirror.mkdir()
+    write_wheel(str(mirror), 'fast_json', '1.0', 'Fast JSON [parsing] for *everyone*')
+    write_sdist(str(mirror), 'Tiny.Lib', '0.3', 'A tiny library')
+    return mirror
+
+
+@pytest.fixture
+def index(tmp_path, mirror):
+    index = DependencyIndex(str(tmp_path / 'deps.sqlite'))
+    index.build(mirrors=[str(mirror)], installed=False)
+    yield index
+    index.close()
+
+
+def test_canonical_name():
+    assert canonical_name('Tiny.Lib') == canonical_name('tiny_lib') == 'tiny-lib'
+
+
+def test_normalize_strips_and_merges_by_canonical_name():
+    assert normalize_dependencies([' click ', '', 'Click>=7', 'rich', 'click < 9', '  ']) == ['click>=7,<9', 'rich']
+    assert normalize_dependencies(['zope.interface', 'zope_interface']) == ['zope.interface']
+
+
+def test_normalize_turns_other_values_into_strings():
+    assert normalize_dependencies([1, 2.5, None, 'rich']) == ['1', '2.5', 'rich']
+
+
+def test_normalize_keeps_extras_markers_and_urls():
+    assert normalize_dependencies(['requests [socks] >= 2.0 ; python_version < "3.8"', 'requests[security]']) \
+        == ['requests[security,socks]>=2.0']
+    assert normalize_dependencies(['pkg @ https://example.com/pkg.whl', 'pkg>=1']) \
+        == ['pkg @ https://example.com/pkg.whl']
+    assert normalize_dependencies(['tomli; python_version < "3.11"']) == ['tomli; python_version < "3.11"']
+
+
+def test_project_answers_normalize_dependencies():
+    answers = ProjectAnswers.from_mapping({'project_name': 'x', 'dependencies': 'click, rich ,Click'})
+    assert answers['dependencies'] == ('click', 'rich')
+
+
+def test_plain_dependency_lists_are_normalized():
+    readme = generate_readme({'project_name': 'x'}, 'click, rich, , Click'.split(','))
+    assert "- click\n- rich\n" in readme
+    html = emit(readme_document({'project_name': 'x'}, ['click', ' rich', '']), 'html')
+    assert '<li>rich</li>' in html and '<li></li>' not in html
+
+
+def test_build_reads_wheels_and_sdists(index):
+    found = index.lookup(['fast-json', 'tiny-lib', 'missing'])
+    assert found['fast-json'] == ('fast_json', '1.0', 'Fast JSON [parsing] for *everyone*',
+                                  'https://fast_json.readthedocs.io/', 'MIT')
+    assert found['tiny-lib'][2:] == ('A tiny library', 'https://Tiny.Lib.readthedocs.io/', 'BSD License')
+    assert found['missing'] is None
+
+
+def test_rebuild_reuses_unchanged_archives(index, mirror):
+    write_wheel(str(mirror), 'other', '2.0', 'Another one')
+    stats = index.build(mirrors=[str(mirror)], installed=False)
+    assert (stats['archives_read'], stats['archives_reused'], stats['packages']) == (1, 2, 3)
+
+    os.remove(mirror / 'other-2.0-py3-none-any.whl')
+    stats = index.build(mirrors=[str(mirror)], installed=False)
+    assert (stats['archives_read'], stats['packages']) == (0, 2)
+    assert index.lookup(['other']) == {'other': None}
+
+
+def test_build_indexes_installed_distributions(tmp_path):
+    index = DependencyIndex(str(tmp_path / 'installed.sqlite'))
+    assert index.build()['installed'] > 0
+    assert index.lookup(['pytest'])['pytest'] is not None
+
+
+def test_enrich_and_render(index):
+    dependencies = enrich_dependencies(['fast-json>=1', 'unknown'], index)
+    assert dependencies[1] == 'unknown'
+    assert isinstance(dependencies[0], Dependency)
+    assert str(dependencies[0]) == ('[fast-json](https://fast_json.readthedocs.io/)>=1: '
+                                    r'Fast JSON \[parsing\] for \*everyone\* (MIT)')
+
+    document = readme_document({'project_name': 'P'}, dependencies)
+    html = emit(document, 'html')
+    assert ('<a href="https://fast_json.readthedocs.io/">fast-json</a>&gt;=1: '
+            'Fast JSON [parsing] for *everyone*') in html
+    assert '<li>unknown</li>' in html
+    rst = emit(document, 'rst')
+    assert '`fast-json <https://fast_json.readthedocs.io/>`__' in rst
+
+
+def test_open_index_builds_a_missing_index(tmp_path):
+    path = str(tmp_path / 'auto.sqlite')
+    assert len(open_index(path)) > 0
+    assert open_index(path) is open_index(path)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_batch_enriches_dependencies(tmp_path, index, jobs):
+    manifest = tmp_path / 'manifest.jsonl'
+    record = {'project_name': 'P', 'dependencies': ['Tiny_Lib', 'tiny-lib>=0.3'],
+              'output_dir': str(tmp_path / 'p')}
+    manifest.write_text(json.dumps(record) + "\n")
+    summary = run_batch(str(manifest), jobs=jobs, enrich_deps=True, deps_index=index.path)
+    assert summary['written'] == 1
+    if jobs > 1:
+        assert open_index.cache_info().currsize == 0  # no connection was open when the workers forked
+    readme = (tmp_path / 'p' / 'README.md').read_text()
+    assert '[Tiny_Lib](https://Tiny.Lib.readthedocs.io/)>=0.3: A tiny library (BSD License)' in readme
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_batch_accepts_numeric_dependencies(tmp_path, jobs):
+    manifest = tmp_path / 'manifest.jsonl'
+    manifest.write_text(json.dumps({'project_name': 'P', 'dependencies': [1, 2], 'output_dir': str(tmp_path / 'p')})
+                        + "\n")
+    assert run_batch(str(manifest), jobs=jobs)['written'] == 1
+    assert "- 1\n- 2\n" in (tmp_path / 'p' / 'README.md').read_text()
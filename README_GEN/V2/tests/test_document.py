@@ -0,0 +1,49 @@
+import os
+
+import pytest
+
+from readme_document import build_document, emit, readme_document
+from readme_generater import write_readme
+
+HOMEPAGE = 'https://example.com/?a=1&b=2'
+
+
+def test_document_is_built_once_for_all_formats(pasted_answers, tmp_path, monkeypatch):
+    import readme_document as module
+    calls = []
+    monkeypatch.setattr(module, 'build_document', lambda *args: calls.append(args) or build_document(*args))
+    write_readme(pasted_answers, ['dep<1>'], output_dir=str(tmp_path), quiet=True, formats=('html', 'rst'))
+    assert len(calls) == 1
+
+
+def test_html_is_escaped(pasted_answers):
+    html = emit(readme_document(pasted_answers, ['dep<1>'], HOMEPAGE), 'html')
+    assert '<a href="https://example.com/?a=1&amp;b=2">Homepage</a>' in html
+    assert '<li>dep&lt;1&gt;</li>' in html
+
+
+def test_rst_is_escaped(pasted_answers):
+    rst = emit(readme_document(pasted_answers, ['dep<1>'], HOMEPAGE), 'rst')
+    assert "Usage\n-----\n\n.. code-block:: bash\n\n   Run:\n   ```bash\n" in rst
+    assert "\\# Not a heading\n\\1. \\*not\\* a [list](x)" in rst
+
+
+def test_unknown_format(pasted_answers):
+    with pytest.raises(ValueError):
+        emit(readme_document(pasted_answers, []), 'pdf')
+
+
+def test_write_readme_writes_every_format(pasted_answers, tmp_path):
+    result = write_readme(pasted_answers, [], output_dir=str(tmp_path), quiet=True, formats=('md', 'html', 'rst'))
+    assert sorted(os.listdir(tmp_path)) == ['README.html', 'README.md', 'README.rst']
+    assert result['formats']['rst'] == os.path.join(str(tmp_path), 'README.rst')
+
+
+def test_template_cannot_be_combined_with_other_formats(pasted_answers, tmp_path):
+    from readme_serve import render_payload
+    with pytest.raises(ValueError):
+        write_readme(pasted_answers, [], output_dir=str(tmp_path), quiet=True, template="# {project_name}\n",
+                     formats=('html',))
+    assert not os.listdir(tmp_path)
+    with pytest.raises(ValueError):
+        render_payload(dict(pasted_answers, template="# {project_name}\n"), 'rst')
@@ -0,0 +1,70 @@
+import json
+
+import pytest
+
+from readme_batch import run_batch
+from readme_fanout import StagedFiles, write_targets
+from readme_metrics import metrics
+
+
+def staged(*files):
+    target = StagedFiles()
+    for path, text in files:
+        target.write(str(path), [text], fsync=not path.name.startswith('.'))
+    return target.files
+
+
+def test_targets_are_written_with_one_fsync_per_directory(tmp_path):
+    (tmp_path / 'a').mkdir()
+    (tmp_path / 'b').mkdir()
+    metrics.enable()
+    results = write_targets([staged((tmp_path / 'a' / 'README.md', "# A\n"), (tmp_path / 'a' / '.digest', "1\n")),
+                             staged((tmp_path / 'a' / 'README.html', "<h1>A</h1>\n")),
+                             staged((tmp_path / 'b' / 'README.md', "# B\n"))], concurrency=2)
+    assert [(result['ok'], result['bytes_written']) for result in results] == [(True, 6), (True, 11), (True, 4)]
+    assert results[0]['path'] == str(tmp_path / 'a' / 'README.md')
+    assert (tmp_path / 'a' / '.digest').read_text() == "1\n"
+    assert metrics.counters['directory_fsyncs'] == 2
+
+
+def test_a_failed_target_does_not_stop_the_others(tmp_path):
+    taken = tmp_path / 'taken'
+    (taken / 'README.md').mkdir(parents=True)  # a directory cannot be replaced by a file
+    results = write_targets([staged((taken / 'README.md', "# A\n"), (taken / '.digest', "1\n")),
+                             staged((tmp_path / 'README.md', "# B\n"))])
+    assert not results[0]['ok'] and 'README.md' in results[0]['error']
+    assert not (taken / '.digest').exists()  # no digest for a README that was not written
+    assert results[1]['ok'] and (tmp_path / 'README.md').read_text() == "# B\n"
+
+
+def test_a_single_target_is_written_without_an_event_loop(tmp_path, monkeypatch):
+    monkeypatch.setattr('asyncio.run', None)
+    assert write_targets([staged((tmp_path / 'README.md', "# A\n"))])[0]['ok']
+
+
+@pytest.fixture
+def manifest_path(special_answers, tmp_path):
+    path = tmp_path / 'projects.jsonl'
+    records = [dict(special_answers, project_name=f"P{index}", output_dir=str(tmp_path / 'out' / str(index)))
+               for index in range(5)]
+    (tmp_path / 'out' / '3' / 'README.md').mkdir(parents=True)
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+    return str(path)
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_async_batch_reports_every_target(manifest_path, tmp_path, jobs):
+    report_path = tmp_path / 'targets.jsonl'
+    summary = run_batch(manifest_path, jobs=jobs, chunk_size=3, writer='async', write_concurrency=4, overwrite=True,
+                        incremental=True, formats=('html',), target_report=str(report_path))
+    assert (summary['written'], summary['failed']) == (4, 1)
+    assert summary['errors'][0][1] == 4 and 'write failed' in summary['errors'][0][2]
+    assert 'P4' in (tmp_path / 'out' / '4' / 'README.html').read_text()
+    assert summary['write_latency']['max_seconds'] > 0
+
+    report = [json.loads(line) for line in report_path.read_text().splitlines()]
+    assert sorted(entry['line'] for entry in report) == [1, 2, 3, 4, 5]
+    assert all(entry['write_seconds'] > 0 for entry in report if entry['status'] == 'written')
+
+    summary = run_batch(manifest_path, jobs=jobs, chunk_size=3, writer='async', incremental=True, formats=('html',))
+    assert (summary['unchanged'], summary['skipped']) == (4, 1)
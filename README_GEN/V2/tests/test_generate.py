@@ -0,0 +1,91 @@
+from readme_answers import ProjectAnswers
+from readme_generater import generate_readme, readme_context, render_many, write_readme
+from readme_templates import DEFAULT_TEMPLATE, render
+
+
+def test_generate_readme(answers):
+    homepage_url = answers['project_homepage']
+    generated_readme = generate_readme(answers, answers['dependencies'], homepage_url=homepage_url)
+    assert 'README.md Generator' in generated_readme
+    assert 'Certainly! The provided Python script is a command-line tool for generating README.md files ' \
+           'for software projects.' in generated_readme
+    assert homepage_url in generated_readme
+
+
+def test_empty_dependencies_leave_out_the_section(empty_deps_answers):
+    generated_readme = generate_readme(empty_deps_answers, empty_deps_answers['dependencies'])
+    assert 'Empty Dependencies Project' in generated_readme
+    assert '## Dependencies\n' not in generated_readme
+
+
+def test_missing_links_are_left_out(empty_deps_answers):
+    generated_readme = generate_readme(empty_deps_answers, [])
+    assert '(None)' not in generated_readme
+    assert '## Project Links' not in generated_readme
+
+
+def test_special_characters_are_kept(special_answers):
+    generated_readme = generate_readme(special_answers, special_answers['dependencies'])
+    assert 'Special Characters Project' in generated_readme
+    for character in ('&', '<', '>', '"', "'"):
+        assert character in generated_readme
+
+
+def test_custom_template(special_answers):
+    custom_template = "{project_name} by {author}{?dependencies}:{#dependencies} {.}{/dependencies}{/dependencies}"
+    assert generate_readme(special_answers, ['a', 'b'], template=custom_template) == \
+        'Special Characters Project by Alice: a b'
+
+
+def test_pasted_markdown_is_escaped(pasted_answers):
+    generated_readme = generate_readme(pasted_answers, [])
+    assert "\\# Not a heading\n1\\. \\*not\\* a \\[list\\](x)" in generated_readme
+    assert "````bash\nRun:\n```bash\nspecial --all\n```\n````\n" in generated_readme
+
+
+def test_default_layout_is_the_template(pasted_answers):
+    homepage_url = 'https://example.com/?a=1&b=2'
+    assert generate_readme(pasted_answers, ['dep<1>'], homepage_url) == \
+        render(DEFAULT_TEMPLATE, readme_context(pasted_answers, ['dep<1>'], homepage_url))
+
+
+def test_missing_answers_render_empty_in_every_mode(tmp_path):
+    readme = generate_readme({'project_name': 'Bare'}, ['dep1'])
+    assert readme.startswith("# Bare\n\n## Description\n\n")
+    write_readme({'project_name': 'Bare'}, ['dep1'], output_dir=str(tmp_path), quiet=True, update=True)
+    assert (tmp_path / 'README.md').read_text() == readme
+
+
+def test_render_many_matches_generate_readme(special_answers, pasted_answers):
+    records = [ProjectAnswers.from_mapping(special_answers), pasted_answers,
+               ProjectAnswers(project_name='Bare', license_name='MIT', dependencies=['dep1'])]
+    expected = [generate_readme(record, record['dependencies'], record['project_homepage'] or None,
+                                record['project_doc_url'] or None) for record in records]
+    assert render_many(records) == expected
+
+
+def test_dependencies_are_printed_without_rich_markup(tmp_path, monkeypatch):
+    import io
+
+    from rich.console import Console
+
+    import readme_generater
+    from readme_deps import Dependency
+
+    output = io.StringIO()
+    monkeypatch.setattr(readme_generater.console, '_console', Console(file=output, color_system=None))
+    answers = ProjectAnswers(project_name='P', dependencies=[Dependency('[/x]', '', 'https://example.com/x', '', ''),
+                                                             'click'])
+    readme_generater.generate_project(answers, output_dir=str(tmp_path))
+    assert "- [[/x]](https://example.com/x)\n- click\n" in output.getvalue()
+
+
+def test_nothing_is_reported_as_generated_when_up_to_date(tmp_path, capsys):
+    from readme_generater import generate_project
+
+    answers = ProjectAnswers(project_name='P', dependencies=['click'])
+    generate_project(answers, output_dir=str(tmp_path), incremental=True)
+    assert "README.md generated successfully!\n- click\n" in capsys.readouterr().out
+    generate_project(answers, output_dir=str(tmp_path), incremental=True)
+    output = capsys.readouterr().out
+    assert 'is up to date' in output and 'generated successfully' not in output and '- click' not in output
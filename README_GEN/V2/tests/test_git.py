@@ -0,0 +1,81 @@
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from readme_batch import run_batch
+from readme_git import GitError, ProjectIndex, changed_items, changed_paths, find_project_roots, is_generated
+
+needs_git = pytest.mark.skipif(shutil.which('git') is None, reason='git is not installed')
+
+
+def git(repo, *args):
+    subprocess.run(('git', '-C', str(repo)) + args, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A checkout with three projects, one nested in a directory without packaging files."""
+    repo = tmp_path / 'repo'
+    for name in ('a', 'b', 'group/c'):
+        (repo / 'pkgs' / name / 'src').mkdir(parents=True)
+        (repo / 'pkgs' / name / 'setup.py').write_text(f"setup(name='{name.split('/')[-1]}', author='Team')")
+        (repo / 'pkgs' / name / 'src' / 'module.py').write_text("x = 1\n")
+    (repo / 'tools.py').write_text("")
+    git(repo, 'init', '-q')
+    git(repo, 'add', '-A')
+    git(repo, '-c', 'user.name=Test', '-c', 'user.email=test@example.com', 'commit', '-qm', 'initial')
+    return repo
+
+
+def test_index_finds_the_innermost_root():
+    index = ProjectIndex()
+    index.add(('pkgs', 'a'), 'a')
+    index.add(('pkgs', 'a', 'plugins', 'p'), 'p')
+    index.add((), 'top')
+    assert index.lookup('pkgs/a/src/module.py') == ['a']
+    assert index.lookup('pkgs/a/plugins/p/setup.py') == ['p']
+    assert index.lookup('pkgs/a') == ['a']
+    assert index.lookup('docs/index.md') == ['top']
+    assert changed_items(index, ['pkgs/a/x', 'pkgs/a/y', 'tools.py']) == ['a', 'top']
+
+
+def test_generated_files_are_not_changes():
+    assert is_generated('pkgs/a/README.md') and is_generated('.README.md.digest')
+    assert is_generated('README_20240101120000.md') and not is_generated('pkgs/a/README.txt')
+
+
+def test_find_project_roots(repo):
+    paths = ['pkgs/a/src/module.py', 'pkgs/a/setup.py', 'pkgs/group/c/src/new.py', 'tools.py', 'gone/file.py']
+    assert find_project_roots(str(repo), paths) == ['pkgs/a', 'pkgs/group/c']
+
+
+@needs_git
+def test_changed_paths_include_untracked_files(repo):
+    (repo / 'pkgs' / 'a' / 'src' / 'module.py').write_text("x = 2\n")
+    (repo / 'pkgs' / 'b' / 'new.py').write_text("")
+    (repo / 'pkgs' / 'b' / 'README.md').write_text("generated\n")
+    top, paths = changed_paths('HEAD', str(repo / 'pkgs'))
+    assert sorted(paths) == ['pkgs/a/src/module.py', 'pkgs/b/new.py']
+    with pytest.raises(GitError):
+        changed_paths('no-such-revision', str(repo))
+
+
+@needs_git
+def test_batch_renders_only_changed_projects(repo, monkeypatch):
+    monkeypatch.chdir(repo)
+    (repo / 'pkgs' / 'group' / 'c' / 'src' / 'module.py').write_text("x = 2\n")
+    summary = run_batch(None, jobs=1, since='HEAD')
+    assert (summary['written'], summary['changes']['changed_projects']) == (1, 1)
+    assert (repo / 'pkgs' / 'group' / 'c' / 'README.md').read_text().startswith("# c\n")
+    assert not (repo / 'pkgs' / 'a' / 'README.md').exists()
+
+    manifest = repo.parent / 'projects.jsonl'
+    manifest.write_text(''.join(json.dumps({'project_name': name, 'output_dir': f"pkgs/{name}"}) + "\n"
+                                for name in ('a', 'b')) + "not json\n")
+    (repo / 'pkgs' / 'b' / 'setup.py').write_text("setup(name='b', author='Someone else')")
+    summary = run_batch(str(manifest), jobs=1, since='HEAD')
+    assert (summary['written'], summary['failed']) == (1, 1)
+    assert summary['changes']['projects'] == 2
+    assert (repo / 'pkgs' / 'b' / 'README.md').exists() and not (repo / 'pkgs' / 'a' / 'README.md').exists()
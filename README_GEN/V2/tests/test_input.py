@@ -0,0 +1,112 @@
+import io
+import json
+import sys
+
+import pytest
+
+import readme_generater
+import readme_input
+from readme_generater import ask_answers, get_multiline_input, main
+from readme_input import AnswersError, guess_format, iter_answers
+
+
+def answers_of(path, answers_format=None):
+    return [answers for _, answers in iter_answers(path, answers_format)]
+
+
+@pytest.fixture
+def stdin(monkeypatch):
+    def feed(data):
+        monkeypatch.setattr(sys, 'stdin', io.TextIOWrapper(io.BufferedReader(io.BytesIO(data.encode()))))
+    return feed
+
+
+@pytest.mark.parametrize('name, head, expected', [
+    ('answers.yml', b'', 'yaml'),
+    ('answers.ndjson', b'', 'jsonl'),
+    ('-', b'{"project_name": "a"}\n{"project_name": "b"}\n', 'jsonl'),
+    ('-', b'{\n  "project_name": "a"\n}\n', 'json'),
+    ('-', b'[{"project_name": "a"}]', 'json'),
+    ('-', b'# answers\n[[projects]]\nproject_name = "a"\n', 'toml'),
+    ('-', b'project_name = "a"\n', 'toml'),
+    ('-', b'project_name: a\n', 'yaml'),
+])
+def test_guess_format(name, head, expected):
+    assert guess_format(name, head) == expected
+
+
+def test_json_toml_and_yaml_agree(tmp_path):
+    pytest.importorskip('yaml')
+    expected = {'project_name': 'Demo', 'license_name': '2.0', 'dependencies': ['click', 'rich']}
+    (tmp_path / 'a.json').write_text(json.dumps({'project_name': 'Demo', 'license_name': 2.0,
+                                                 'dependencies': ['click', 'rich']}))
+    (tmp_path / 'a.toml').write_text('project_name = "Demo"\nlicense_name = 2.0\ndependencies = ["click", "rich"]\n')
+    (tmp_path / 'a.yaml').write_text("project_name: Demo\nlicense_name: 2.0\ndependencies: [click, rich]\n")
+    for name in ('a.json', 'a.toml', 'a.yaml'):
+        assert answers_of(str(tmp_path / name)) == [expected]
+
+
+def test_several_projects_per_document(tmp_path):
+    pytest.importorskip('yaml')
+    (tmp_path / 'a.toml').write_text('[[projects]]\nproject_name = "A"\n\n[[projects]]\nproject_name = "B"\n')
+    (tmp_path / 'b.yaml').write_text("project_name: A\n---\n- project_name: B\n- project_name: C\n")
+    assert [answers['project_name'] for answers in answers_of(str(tmp_path / 'a.toml'))] == ['A', 'B']
+    assert [answers['project_name'] for answers in answers_of(str(tmp_path / 'b.yaml'))] == ['A', 'B', 'C']
+
+
+def test_large_files_are_mapped(tmp_path, monkeypatch):
+    monkeypatch.setattr(readme_input, 'MMAP_THRESHOLD', 16)
+    description = "line\n" * 1000
+    (tmp_path / 'big.json').write_text(json.dumps({'project_name': 'Big', 'project_description': description}))
+    assert answers_of(str(tmp_path / 'big.json'))[0]['project_description'] == description
+
+
+def test_stdin_is_streamed(stdin):
+    stdin('{"project_name": "A"}\n\n{"project_name": "B"}\nnot json\n')
+    projects = iter_answers('-')
+    assert next(projects) == ('stdin line 1', {'project_name': 'A'})
+    assert next(projects) == ('stdin line 3', {'project_name': 'B'})
+    with pytest.raises(AnswersError, match='stdin line 4'):
+        next(projects)
+
+
+@pytest.mark.parametrize('content', ['[1, 2]', '"text"', '{"project_name": '])
+def test_bad_documents(tmp_path, content):
+    (tmp_path / 'a.json').write_text(content)
+    with pytest.raises(AnswersError):
+        answers_of(str(tmp_path / 'a.json'))
+
+
+def test_only_missing_fields_are_prompted(monkeypatch):
+    prompts = []
+
+    def fake_input(prompt=''):
+        prompts.append(prompt)
+        return 'END' if not prompt else ''
+    monkeypatch.setattr('builtins.input', fake_input)
+    known = {'project_name': 'Known', 'project_description': 'Set', 'author': 'A', 'license_name': 'MIT',
+             'install_command': 'pip install known', 'test_command': 'pytest', 'project_homepage': '',
+             'project_doc_url': 'https://example.com/docs'}
+    answers = ask_answers(False, known=known)
+    assert answers.project_name == 'Known' and answers.project_doc_url == 'https://example.com/docs'
+    assert prompts == ['', 'Enter project dependencies (comma-separated, or \'END\' to finish): ']
+
+
+def test_missing_fields_without_a_terminal_stay_empty():
+    answers = ask_answers(False, known={'project_name': 'Quiet', 'project_homepage': 'not a url'}, interactive=False)
+    assert (answers.project_description, answers.dependencies, answers.project_homepage) == ('', (), None)
+
+
+def test_multiline_retries_do_not_recurse(stdin, monkeypatch):
+    monkeypatch.setattr(readme_generater.console, 'print', lambda *args, **kwargs: None)
+    stdin("END\n" * (sys.getrecursionlimit() + 10) + "finally\nEND\n")
+    assert get_multiline_input("Describe your project:") == "finally"
+
+
+def test_main_reads_answers_from_stdin(stdin, isolated_cwd):
+    (isolated_cwd / 'taken').mkdir()
+    (isolated_cwd / 'taken' / 'README.md').write_text("hand-written\n")
+    stdin('{"project_name": "A", "output_dir": "a"}\n{"project_name": "B", "output_dir": "taken"}\n')
+    main(False, answers_path='-')
+    assert (isolated_cwd / 'a' / 'README.md').read_text().startswith("# A\n")
+    assert (isolated_cwd / 'taken' / 'README.md').read_text() == "hand-written\n"
@@ -0,0 +1,53 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from readme_links import check_links, extract_links
+
+
+class LinkHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_HEAD(self):
+        if self.path == '/no-head':
+            self.send_response(405)
+        elif self.path == '/moved':
+            self.send_response(301)
+            self.send_header('Location', '/ok')
+        else:
+            self.send_response(200 if self.path == '/ok' else 404)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), LinkHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_extract_links_skips_code_and_duplicates(base_url):
+    markdown = f"- [Homepage]({base_url}/ok)\n- <{base_url}/moved>\n```\n{base_url}/in-code\n```\n" \
+               f"[a]({base_url}/no-head) [b]({base_url}/gone) [c]({base_url}/ok)"
+    assert extract_links(markdown) == [f"{base_url}/{path}" for path in ('ok', 'moved', 'no-head', 'gone')]
+
+
+def test_check_links_reports_broken_and_caches(base_url, tmp_path):
+    links = [f"{base_url}/{path}" for path in ('ok', 'moved', 'no-head', 'gone')]
+    cache_path = str(tmp_path / 'links.json')
+    report = check_links(links, cache_path=cache_path)
+    assert [result['url'] for result in report['broken']] == [f"{base_url}/gone"]
+    assert report['checked'] == 4
+    assert check_links(links, cache_path=cache_path)['cached'] == 4
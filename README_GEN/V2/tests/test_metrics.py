@@ -0,0 +1,23 @@
+from readme_metrics import Metrics
+
+
+def test_disabled_metrics_collect_nothing():
+    collector = Metrics()
+    with collector.phase('render'):
+        collector.count('files_written')
+    assert collector.phases == {} and collector.counters == {}
+
+
+def test_worker_snapshots_merge():
+    collector = Metrics()
+    collector.enable()
+    assert list(collector.timed(iter(['a', 'b']), 'ingest')) == ['a', 'b']
+    collector.count('files_written', 2)
+    worker = Metrics()
+    worker.enable()
+    with worker.phase('render'):
+        worker.count('files_written')
+    collector.merge(worker.drain())
+    report = collector.report()
+    assert report['counters'] == {'files_written': 3} and worker.counters == {}
+    assert (report['phases']['ingest']['calls'], report['phases']['render']['calls']) == (1, 1)
@@ -0,0 +1,14 @@
+from readme_scan import scan_project
+
+
+def test_scan_ignores_vendored_directories(tmp_path):
+    (tmp_path / 'node_modules' / 'left-pad').mkdir(parents=True)
+    (tmp_path / 'node_modules' / 'left-pad' / 'setup.py').write_text(
+        "setup(name='left-pad', install_requires=['wrong'])")
+    (tmp_path / 'setup.py').write_text("setup(name='scanned', author='Alice', install_requires=['click', 'rich'])")
+    (tmp_path / 'LICENSE').write_text("MIT License\n\nPermission is hereby granted, free of charge...")
+    cache_path = str(tmp_path / '.scan-cache.json')
+    found = scan_project(str(tmp_path), cache_path=cache_path)
+    assert found == {'project_name': 'scanned', 'author': 'Alice', 'license_name': 'MIT',
+                     'dependencies': ['click', 'rich'], 'install_command': 'pip install .'}
+    assert scan_project(str(tmp_path), cache_path=cache_path) == found
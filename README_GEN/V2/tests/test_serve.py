@@ -0,0 +1,54 @@
+import asyncio
+import json
+
+import pytest
+
+from readme_generater import generate_readme
+from readme_serve import RenderServer
+
+
+async def post_renders(bodies):
+    render_server = RenderServer(workers=1)
+    await render_server.start(port=0)
+    port = render_server.server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    responses = []
+    for body in bodies:
+        writer.write(f"POST /render HTTP/1.1\r\nContent-Length: {len(body)}\r\n\r\n".encode() + body)
+        status = int((await reader.readline()).split()[1])
+        length = 0
+        while (line := await reader.readline()) != b"\r\n":
+            if line.lower().startswith(b"content-length:"):
+                length = int(line.split(b":")[1])
+        responses.append((status, (await reader.readexactly(length)).decode()))
+    writer.close()
+    await render_server.shutdown()
+    return responses, render_server.metrics()
+
+
+def test_render_then_bad_payload_then_shutdown(special_answers):
+    responses, metrics = asyncio.run(post_renders([json.dumps(special_answers).encode(), b"[not json"]))
+    expected = generate_readme(special_answers, special_answers['dependencies'],
+                               special_answers['project_homepage'], special_answers['project_doc_url'])
+    assert responses[0] == (200, expected)
+    assert responses[1][0] == 400
+    assert (metrics['requests'], metrics['errors']) == (2, 1)
+
+
+async def post_with_length(content_length):
+    render_server = RenderServer(workers=1)
+    await render_server.start(port=0)
+    port = render_server.server.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    writer.write(f"POST /render HTTP/1.1\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode())
+    response = await reader.read()  # the server answers and closes the connection
+    writer.close()
+    await render_server.shutdown()
+    return response
+
+
+@pytest.mark.parametrize('content_length', ['abc', '-5'])
+def test_invalid_content_length_is_rejected(content_length):
+    response = asyncio.run(post_with_length(content_length))
+    assert response.startswith(b"HTTP/1.1 400 ")
+    assert response.endswith(b"invalid Content-Length\n")
@@ -0,0 +1,23 @@
+import pytest
+
+from readme_escape import code_fence, escape_prose
+from readme_templates import DEFAULT_TEMPLATE, TemplateError, render, template_fields, template_sections
+
+
+@pytest.mark.parametrize('source', ["{?links}never closed", "{/links}", "{#.}{/.}"])
+def test_invalid_templates(source):
+    with pytest.raises(TemplateError):
+        render(source, {})
+
+
+def test_sections_and_fields():
+    headings = [heading for heading, _ in template_sections(DEFAULT_TEMPLATE)]
+    assert headings[0] is None and 'Dependencies' in headings
+    assert template_fields("{a} {?b}{c}{.}{/b}")[:3] == ['a', 'b', 'c']
+
+
+def test_escape_prose_and_fences():
+    assert escape_prose("plain text") == "plain text"
+    assert escape_prose("- item\n2) two | a_b") == "\\- item\n2\\) two \\| a\\_b"
+    assert code_fence("no ticks") == '```'
+    assert code_fence("````") == '`````'
@@ -0,0 +1,12 @@
+from readme_generater import is_valid_url
+from readme_urls import validate_urls
+
+
+def test_validate_urls_deduplicates():
+    urls = ['https://github.com/testuser/project', 'not a url', 'https://github.com/testuser/project', '']
+    assert validate_urls(urls) == {'https://github.com/testuser/project': True, 'not a url': False, '': False}
+
+
+def test_is_valid_url():
+    assert is_valid_url('https://emptydepsproject.readthedocs.io/')
+    assert not is_valid_url('http://')
@@ -0,0 +1,53 @@
+import os
+
+import pytest
+
+from readme_generater import write_readme
+from readme_writer import atomic_write
+
+
+def test_write_readme_into_the_working_directory(answers, isolated_cwd):
+    result = write_readme(answers, answers['dependencies'], homepage_url=answers['project_homepage'], quiet=True)
+    assert result['path'] == 'README.md'
+    assert 'README.md Generator' in (isolated_cwd / 'README.md').read_text(encoding='utf-8')
+    assert result['bytes_written'] == os.path.getsize(isolated_cwd / 'README.md')
+
+
+def test_failed_write_keeps_the_old_readme(tmp_path):
+    def failing_chunks():
+        yield "partial"
+        raise RuntimeError("render failed")
+
+    readme_file_path = str(tmp_path / 'README.md')
+    assert atomic_write(readme_file_path, ["# Old\n"], buffer_size=16)['bytes_written'] == 6
+    with pytest.raises(RuntimeError):
+        atomic_write(readme_file_path, failing_chunks())
+    assert (tmp_path / 'README.md').read_text() == "# Old\n"
+    assert os.listdir(tmp_path) == ['README.md']
+
+
+def test_incremental_only_rewrites_on_change(special_answers, tmp_path):
+    write_args = dict(output_dir=str(tmp_path), quiet=True, incremental=True)
+    assert not write_readme(special_answers, ['dep1'], **write_args)['unchanged']
+    assert write_readme(special_answers, ['dep1'], **write_args)['unchanged']
+    assert not write_readme(special_answers, ['dep1', 'dep2'], **write_args)['unchanged']
+
+
+def test_update_keeps_hand_written_sections(special_answers, tmp_path):
+    readme_file = tmp_path / 'README.md'
+    write_readme(special_answers, ['dep1'], output_dir=str(tmp_path), quiet=True, update=True)
+    content = readme_file.read_text().replace("## Author", "## Notes\nWritten by hand.\n\n## Author")
+    readme_file.write_text(content)
+    stats = write_readme(special_answers, ['dep1', 'dep2'], output_dir=str(tmp_path), quiet=True, update=True)
+    assert stats['sections_changed'] == ['Dependencies'] and stats['sections_rendered'] == 1
+    assert readme_file.read_text() == content.replace("- dep1\n", "- dep1\n- dep2\n")
+
+
+def test_incremental_after_update_keeps_hand_written_sections(special_answers, tmp_path):
+    readme_file = tmp_path / 'README.md'
+    write_readme(special_answers, ['dep1'], output_dir=str(tmp_path), quiet=True, update=True)
+    readme_file.write_text(readme_file.read_text().replace("## Author", "## Notes\nWritten by hand.\n\n## Author"))
+    write_readme(special_answers, ['dep1'], output_dir=str(tmp_path), quiet=True, update=True)
+    write_readme(special_answers, ['dep1', 'dep2'], output_dir=str(tmp_path), quiet=True, incremental=True)
+    content = readme_file.read_text()
+    assert "## Notes\nWritten by hand." in content and "- dep2\n" in content